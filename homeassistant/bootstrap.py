@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
 import contextlib
 from functools import partial
 from itertools import chain
@@ -88,7 +89,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -99,6 +100,7 @@ from .setup import (
     _setup_started,
     async_get_setup_timings,
     async_notify_setup_error,
+    async_process_deps_reqs,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -134,6 +136,10 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+SETUP_TIMES_STORAGE_KEY = "core.setup_times"
+SETUP_TIMES_STORAGE_VERSION = 1
+SETUP_TIMES_SAVE_DELAY = 60
+
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -254,6 +260,7 @@ PRELOAD_STORAGE = [
     "core.analytics",
     "auth_module.totp",
     "backup",
+    SETUP_TIMES_STORAGE_KEY,
 ]
 
 
@@ -436,6 +443,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(issue_registry.async_load(hass)),
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
+        create_eager_task(template.async_load_compiled_templates(hass)),
         create_eager_task(template.async_load_custom_templates(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
@@ -454,6 +462,7 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    await loader.async_load_integration_index(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -804,6 +813,216 @@ async def async_setup_multi_components(
             )
 
 
+class _SetupScheduler:
+    """Set up integrations as soon as the integrations they depend on are set up.
+
+    Integrations are added in stages. The integrations of a stage are started
+    once the dependencies and requirements of the integrations of the previous
+    stages have been processed, so they do not import packages which are
+    about to be updated, without waiting for the previous stages to finish
+    their setup.
+
+    Integrations which become ready at the same time are started in order of
+    the longest chain of setup times which waits on them, using the setup
+    times of the previous start, so the integrations on the critical path are
+    first in line for the import executor.
+    """
+
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        config: dict[str, Any],
+        integration_cache: dict[str, loader.Integration],
+        setup_times: Mapping[str, float],
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._config = config
+        self._integration_cache = integration_cache
+        self._setup_times = setup_times
+        self._stages: list[set[str]] = []
+        self._released = 0
+        self._released_domains: set[str] = set()
+        self._pending_requirements: set[str] = set()
+        self._dependencies: dict[str, set[str]] = {}
+        self._dependents: defaultdict[str, set[str]] = defaultdict(set)
+        self._ranks: dict[str, float] = {}
+        self._done: dict[str, asyncio.Future[None]] = {}
+        self._started: set[str] = set()
+        self._start_times: dict[str, float] = {}
+        self._done_times: dict[str, float] = {}
+
+    @core.callback
+    def async_add_stage(self, domains: set[str]) -> None:
+        """Add a stage of domains to set up.
+
+        Only dependencies on domains of the same or earlier stages are
+        scheduled, after dependencies on later stages are ignored like
+        async_setup_component ignores domains which are not yet to be loaded.
+        """
+        domains = domains - self._dependencies.keys()
+        self._stages.append(domains)
+        for domain in domains:
+            self._dependencies[domain] = set()
+            self._done[domain] = self._hass.loop.create_future()
+        for domain in domains:
+            if (integration := self._integration_cache.get(domain)) is None:
+                continue
+            for dep in chain(integration.dependencies, integration.after_dependencies):
+                if dep in self._dependencies and dep != domain:
+                    self._dependencies[domain].add(dep)
+                    self._dependents[dep].add(domain)
+        self._async_break_cycles(domains)
+
+    @core.callback
+    def _async_break_cycles(self, domains: set[str]) -> None:
+        """Drop the dependencies of domains which wait on each other.
+
+        A cycle of after dependencies would otherwise never be started, the
+        setup of these domains sorts out the order as it did before.
+        """
+        waiting = {
+            domain: len(self._dependencies[domain] & domains) for domain in domains
+        }
+        ready = [domain for domain, count in waiting.items() if not count]
+        while ready:
+            domain = ready.pop()
+            del waiting[domain]
+            for dependent in self._dependents[domain] & domains:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+        for domain in waiting:
+            for dep in self._dependencies[domain] & waiting.keys():
+                self._dependents[dep].discard(domain)
+            self._dependencies[domain] -= waiting.keys()
+
+    def _rank(self, domain: str) -> float:
+        """Return the setup time of the longest chain starting at a domain."""
+        if (rank := self._ranks.get(domain)) is None:
+            rank = self._ranks[domain] = self._setup_times.get(domain, 0.0) + max(
+                (self._rank(dependent) for dependent in self._dependents[domain]),
+                default=0.0,
+            )
+        return rank
+
+    @core.callback
+    def async_start(self) -> None:
+        """Start setting up the first stage."""
+        self._async_release_stages()
+
+    @core.callback
+    def async_release_all(self) -> None:
+        """Start setting up all stages, without waiting for requirements."""
+        self._async_release_stages(wait_requirements=False)
+
+    @core.callback
+    def _async_release_stages(self, wait_requirements: bool = True) -> None:
+        """Release the next stage, and the ones after it which need not wait."""
+        while self._released < len(self._stages):
+            domains = self._stages[self._released]
+            self._released += 1
+            self._released_domains |= domains
+            # Enables after dependencies when setting up the stage
+            async_set_domains_to_be_loaded(self._hass, domains)
+            self._pending_requirements = {
+                domain
+                for domain in domains
+                if domain not in self._hass.config.components
+                and domain in self._integration_cache
+            }
+            self._async_start_ready(domains)
+            if wait_requirements and self._pending_requirements:
+                return
+
+    @core.callback
+    def _async_start_ready(self, domains: Iterable[str]) -> None:
+        """Start setting up the domains which are no longer waiting."""
+        ready = [
+            domain
+            for domain in domains
+            if domain in self._released_domains
+            and domain not in self._started
+            and all(self._done[dep].done() for dep in self._dependencies[domain])
+        ]
+        # Base platforms are started first since everything will have to
+        # wait for them to be imported
+        ready.sort(
+            key=lambda domain: (SETUP_ORDER_SORT_KEY(domain), self._rank(domain)),
+            reverse=True,
+        )
+        for domain in ready:
+            self._started.add(domain)
+            self._start_times[domain] = monotonic()
+            task = self._hass.async_create_task_internal(
+                self._async_setup_domain(domain),
+                f"setup component {domain}",
+                eager_start=True,
+            )
+            task.add_done_callback(partial(self._async_setup_done, domain))
+
+    async def _async_setup_domain(self, domain: str) -> None:
+        """Set up a domain.
+
+        The next stage is released once the dependencies and requirements of
+        all domains of the current stage are processed.
+        """
+        if domain in self._pending_requirements:
+            try:
+                await async_process_deps_reqs(
+                    self._hass, self._config, self._integration_cache[domain]
+                )
+            except HomeAssistantError:
+                # The setup of the domain below notifies about the failure
+                pass
+            finally:
+                self._pending_requirements.discard(domain)
+                if not self._pending_requirements:
+                    self._async_release_stages()
+        await async_setup_component(self._hass, domain, self._config)
+
+    @core.callback
+    def _async_setup_done(self, domain: str, task: asyncio.Task[None]) -> None:
+        """Start the domains which were waiting on a domain."""
+        self._done_times[domain] = monotonic()
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _LOGGER.error(
+                "Error setting up integration %s - received exception",
+                domain,
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
+        self._done[domain].set_result(None)
+        self._async_start_ready(self._dependents[domain])
+
+    async def async_wait_stage(self, index: int) -> None:
+        """Wait for the setup of the domains of a stage."""
+        if futures := [self._done[domain] for domain in self._stages[index]]:
+            await asyncio.wait(futures)
+
+    @core.callback
+    def async_critical_path(self) -> list[tuple[str, float]]:
+        """Return the chain of setups which finished last.
+
+        Each domain is returned with the time it took from when it was
+        started, after the domains it waited on were set up, until it was set
+        up.
+        """
+        if not self._done_times:
+            return []
+        domain = max(self._done_times, key=self._done_times.__getitem__)
+        path: list[tuple[str, float]] = []
+        while domain is not None:
+            waited_on = max(
+                (dep for dep in self._dependencies[domain] if dep in self._done_times),
+                key=self._done_times.__getitem__,
+                default=None,
+            )
+            path.append((domain, self._done_times[domain] - self._start_times[domain]))
+            domain = waited_on
+        path.reverse()
+        return path
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -1025,25 +1244,34 @@ async def _async_set_up_integrations(
             async_set_domains_to_be_loaded(hass, to_be_loaded)
             await async_setup_multi_components(hass, domain_group, config)
 
-    # Enables after dependencies when setting up stage 1 domains
-    async_set_domains_to_be_loaded(hass, stage_1_domains)
+    # The setup times of the previous start are used to prioritize the
+    # integrations which hold up the integrations depending on them
+    setup_times_store = Store[dict[str, float]](
+        hass, SETUP_TIMES_STORAGE_VERSION, SETUP_TIMES_STORAGE_KEY, private=True
+    )
+    setup_times = await setup_times_store.async_load() or {}
+    scheduler = _SetupScheduler(hass, config, integration_cache, setup_times)
+    scheduler.async_add_stage(stage_1_domains)
+    scheduler.async_add_stage(stage_2_domains)
 
-    # Start setup
+    # Start setup, stage 2 domains are started as soon as the requirements
+    # of stage 1 are processed and the domains they depend on are set up
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
+    scheduler.async_start()
+    if stage_1_domains:
         try:
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await scheduler.async_wait_stage(0)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
 
-    # Add after dependencies when setting up stage 2 domains
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
+    scheduler.async_release_all()
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
@@ -1051,13 +1279,21 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await scheduler.async_wait_stage(1)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
 
+    if critical_path := scheduler.async_critical_path():
+        _LOGGER.info(
+            "Startup critical path: %s",
+            " -> ".join(
+                f"{domain} ({duration:.2f}s)" for domain, duration in critical_path
+            ),
+        )
+
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
@@ -1071,8 +1307,17 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_time = async_get_setup_timings(hass)
+    setup_times_store.async_delay_save(
+        lambda: {
+            domain: round(setup_time[domain], 3)
+            for domain in domains_to_setup
+            if domain in setup_time
+        },
+        SETUP_TIMES_SAVE_DELAY,
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
-        setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
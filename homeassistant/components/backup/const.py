@@ -18,6 +18,7 @@ LOGGER = getLogger(__package__)
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
+    ".cache/*",
     ".HA_RESTORE",
     "*.db-shm",
     "*.log.*",
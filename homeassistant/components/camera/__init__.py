@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import collections
-from collections.abc import Awaitable, Callable, Coroutine
-from contextlib import suppress
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import aclosing, suppress
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import IntFlag
@@ -16,6 +16,7 @@ from random import SystemRandom
 import time
 from typing import Any, Final, final
 
+import aiohttp
 from aiohttp import hdrs, web
 import attr
 from propcache import cached_property, under_cached_property
@@ -67,6 +68,7 @@ from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType, VolDictType
 from homeassistant.loader import bind_hass
 
+from .broadcast import MjpegStreamBroadcaster, StillStreamBroadcaster
 from .const import (
     CAMERA_IMAGE_TIMEOUT,
     CAMERA_STREAM_SOURCE_TIMEOUT,
@@ -77,6 +79,7 @@ from .const import (
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_CACHE_TTL,
     SERVICE_RECORD,
     CameraState,
     StreamType,
@@ -84,6 +87,7 @@ from .const import (
 from .helper import get_camera_from_entity_id
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .snapshot import SnapshotCache
 from .webrtc import (
     DATA_ICE_SERVERS,
     CameraWebRTCLegacyProvider,
@@ -181,6 +185,36 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+async def _async_fetch_image(
+    camera: Camera,
+    width: int | None = None,
+    height: int | None = None,
+) -> Image:
+    """Fetch a snapshot image from a camera without a timeout.
+
+    If width and height are passed, an attempt to scale
+    the image will be made on a best effort basis.
+    """
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        raise HomeAssistantError("Unable to get image")
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+    return image
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -197,32 +231,42 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
-                return image
+            return await _async_fetch_image(camera, width, height)
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_snapshot_cache_ttl(camera: Camera) -> float:
+    """Return how many seconds snapshots of a camera are served from the cache."""
+    settings = await camera.hass.data[DATA_CAMERA_PREFS].get_dynamic_stream_settings(
+        camera.entity_id
+    )
+    if settings.snapshot_cache_ttl is None:
+        return camera.snapshot_cache_ttl
+    return settings.snapshot_cache_ttl
+
+
+async def _async_get_cached_image(
+    camera: Camera,
+    width: int | None,
+    height: int | None,
+    timeout: float,
+    fetch: Callable[[int | None, int | None], Awaitable[Image]],
+) -> Image:
+    """Return a snapshot of a camera through its snapshot cache."""
+    try:
+        return await camera.snapshot_cache.async_get(
+            camera.hass,
+            await _async_snapshot_cache_ttl(camera),
+            width,
+            height,
+            timeout,
+            fetch,
+        )
+    except TimeoutError as err:
+        raise HomeAssistantError("Unable to get image") from err
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -236,7 +280,9 @@ async def async_get_image(
     width and height will be passed to the underlying camera.
     """
     camera = get_camera_from_entity_id(hass, entity_id)
-    return await _async_get_image(camera, timeout, width, height)
+    return await _async_get_cached_image(
+        camera, width, height, timeout, partial(_async_fetch_image, camera)
+    )
 
 
 async def _async_get_stream_image(
@@ -286,6 +332,34 @@ async def async_get_still_stream(
 
     This method must be run in the event loop.
     """
+
+    async def fetch_images() -> AsyncIterator[bytes]:
+        """Fetch changed images at the interval."""
+        last_image = None
+        while True:
+            last_fetch = time.monotonic()
+            img_bytes = await image_cb()
+            if not img_bytes:
+                break
+
+            if img_bytes != last_image:
+                yield img_bytes
+                last_image = img_bytes
+
+            next_fetch = last_fetch + interval
+            now = time.monotonic()
+            if next_fetch > now:
+                sleep_time = next_fetch - now
+                await asyncio.sleep(sleep_time)
+
+    async with aclosing(fetch_images()) as images:
+        return await _async_write_still_stream(request, images, content_type)
+
+
+async def _async_write_still_stream(
+    request: web.Request, images: AsyncIterator[bytes], content_type: str
+) -> web.StreamResponse:
+    """Write images to an HTTP MJPEG stream."""
     response = web.StreamResponse()
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
@@ -303,32 +377,19 @@ async def async_get_still_stream(
             + b"\r\n"
         )
 
-    last_image = None
-
-    while True:
-        last_fetch = time.monotonic()
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
-
-        if img_bytes != last_image:
+    first_image = True
+    async for img_bytes in images:
+        await write_to_mjpeg_stream(img_bytes)
+
+        # Chrome always shows the n-1 frame:
+        # https://issues.chromium.org/issues/41199053
+        # https://issues.chromium.org/issues/40791855
+        # We send the first frame twice to ensure it shows
+        # Subsequent frames are not a concern at reasonable frame rates
+        # (even 1/10 FPS is about the latency of HLS)
+        if first_image:
             await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome always shows the n-1 frame:
-            # https://issues.chromium.org/issues/41199053
-            # https://issues.chromium.org/issues/40791855
-            # We send the first frame twice to ensure it shows
-            # Subsequent frames are not a concern at reasonable frame rates
-            # (even 1/10 FPS is about the latency of HLS)
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        next_fetch = last_fetch + interval
-        now = time.monotonic()
-        if next_fetch > now:
-            sleep_time = next_fetch - now
-            await asyncio.sleep(sleep_time)
+            first_image = False
 
     return response
 
@@ -350,6 +411,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_get_prefs)
     websocket_api.async_register_command(hass, websocket_update_prefs)
     websocket_api.async_register_command(hass, ws_camera_capabilities)
+    websocket_api.async_register_command(hass, ws_camera_snapshot_cache)
     async_register_ws(hass)
 
     await component.async_setup(config)
@@ -442,6 +504,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "is_streaming",
     "model",
     "motion_detection_enabled",
+    "snapshot_cache_ttl",
     "supported_features",
 }
 
@@ -464,6 +527,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
     _attr_should_poll: bool = False  # No need to poll cameras
+    _attr_snapshot_cache_ttl: float = 0
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
 
@@ -476,6 +540,9 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.stream_options: dict[str, str | bool | float] = {}
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.snapshot_cache = SnapshotCache()
+        self._still_stream_broadcasters: dict[float, StillStreamBroadcaster] = {}
+        self._mjpeg_stream_broadcaster: MjpegStreamBroadcaster | None = None
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
@@ -559,6 +626,14 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def snapshot_cache_ttl(self) -> float:
+        """Return how many seconds snapshots are served from the cache.
+
+        Requests for a snapshot of the same size always share one fetch.
+        """
+        return self._attr_snapshot_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -720,10 +795,65 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The images are fetched once for all viewers of a stream with the
+        same interval.
+        """
+        if (broadcaster := self._still_stream_broadcasters.get(interval)) is None:
+            broadcaster = self._still_stream_broadcasters[interval] = (
+                StillStreamBroadcaster(
+                    self.hass,
+                    self.async_camera_image,
+                    interval,
+                    self._async_remove_still_stream_broadcaster,
+                )
+            )
+        async with aclosing(broadcaster.async_images()) as images:
+            return await _async_write_still_stream(request, images, self.content_type)
+
+    @callback
+    def _async_remove_still_stream_broadcaster(
+        self, broadcaster: StillStreamBroadcaster
+    ) -> None:
+        """Remove a broadcaster after its last viewer left."""
+        if self._still_stream_broadcasters.get(broadcaster.interval) is broadcaster:
+            del self._still_stream_broadcasters[broadcaster.interval]
+
+    async def async_proxy_mjpeg_stream(
+        self,
+        request: web.Request,
+        open_stream: Callable[[], Awaitable[aiohttp.ClientResponse]],
+    ) -> web.StreamResponse | None:
+        """Proxy the upstream MJPEG stream of the camera.
+
+        One upstream stream is opened for all viewers, the callback of the
+        first viewer opens it. Can be used by camera platforms overriding
+        handle_async_mjpeg_stream.
+        """
+        if (broadcaster := self._mjpeg_stream_broadcaster) is None:
+            broadcaster = self._mjpeg_stream_broadcaster = MjpegStreamBroadcaster(
+                self.hass, open_stream, self._async_remove_mjpeg_stream_broadcaster
+            )
+        async with aclosing(broadcaster.async_parts()) as parts:
+            if (first_part := await anext(parts, None)) is None:
+                return None
+            response = web.StreamResponse()
+            if broadcaster.content_type is not None:
+                response.content_type = broadcaster.content_type
+            await response.prepare(request)
+            await response.write(first_part)
+            async for part in parts:
+                await response.write(part)
+        return response
+
+    @callback
+    def _async_remove_mjpeg_stream_broadcaster(
+        self, broadcaster: MjpegStreamBroadcaster
+    ) -> None:
+        """Remove the upstream MJPEG stream broadcaster after its last viewer left."""
+        if self._mjpeg_stream_broadcaster is broadcaster:
+            self._mjpeg_stream_broadcaster = None
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -988,11 +1118,12 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
+            image = await _async_get_cached_image(
                 camera,
-                CAMERA_IMAGE_TIMEOUT,
                 int(width) if width else None,
                 int(height) if height else None,
+                CAMERA_IMAGE_TIMEOUT,
+                partial(_async_fetch_image, camera),
             )
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError from ex
@@ -1046,6 +1177,31 @@ async def ws_camera_capabilities(
     connection.send_result(msg["id"], asdict(camera.camera_capabilities))
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "camera/snapshot_cache",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@websocket_api.async_response
+async def ws_camera_snapshot_cache(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get camera snapshot cache statistics websocket command.
+
+    Async friendly.
+    """
+    camera = get_camera_from_entity_id(hass, msg["entity_id"])
+    connection.send_result(
+        msg["id"],
+        {
+            "ttl": await _async_snapshot_cache_ttl(camera),
+            "hits": camera.snapshot_cache.hits,
+            "misses": camera.snapshot_cache.misses,
+        },
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "camera/stream",
@@ -1096,6 +1252,9 @@ async def websocket_get_prefs(
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional(PREF_PRELOAD_STREAM): bool,
         vol.Optional(PREF_ORIENTATION): vol.Coerce(Orientation),
+        vol.Optional(PREF_SNAPSHOT_CACHE_TTL): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),
     }
 )
 @websocket_api.async_response
@@ -1175,14 +1334,24 @@ async def async_handle_snapshot_service(
             f"Cannot write `{snapshot_file}`, no access to path; `allowlist_external_dirs` may need to be adjusted in `configuration.yaml`"
         )
 
-    async with asyncio.timeout(CAMERA_IMAGE_TIMEOUT):
-        image = (
+    async def _async_fetch_snapshot(width: int | None, height: int | None) -> Image:
+        """Fetch a full size snapshot from the camera."""
+        image_bytes = (
             await _async_get_stream_image(camera, wait_for_next_keyframe=True)
             if camera.use_stream_for_stills
             else await camera.async_camera_image()
         )
+        if image_bytes is None:
+            raise HomeAssistantError("Unable to get image")
+        return Image(camera.content_type, image_bytes)
 
-    if image is None:
+    try:
+        image = (
+            await _async_get_cached_image(
+                camera, None, None, CAMERA_IMAGE_TIMEOUT, _async_fetch_snapshot
+            )
+        ).content
+    except HomeAssistantError:
         return
 
     def _write_image(to_file: str, image_data: bytes) -> None:
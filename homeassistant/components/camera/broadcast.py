@@ -0,0 +1,277 @@
+"""Share the streams of a camera between their viewers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import suppress
+import logging
+import time
+from typing import Self
+
+import aiohttp
+from aiohttp import hdrs, web
+from aiohttp.helpers import parse_mimetype
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames queued for a viewer, a slow viewer skips the oldest frames
+MAX_QUEUED_FRAMES = 2
+# Bytes read from an upstream stream at once
+UPSTREAM_BUFFER_SIZE = 102400
+# Seconds to wait for an upstream stream to open or send data
+UPSTREAM_TIMEOUT = 10
+# Largest part of an upstream MJPEG stream, larger parts end the stream
+MAX_PART_SIZE = 16 * 1024 * 1024
+
+
+class _Broadcaster:
+    """Queue the frames of a source for each of its viewers.
+
+    The source is read while there are viewers. A viewer which does not
+    keep up gets the newest frames, the oldest queued frame is dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, on_done: Callable[[Self], None]) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self.dropped_frames = 0
+        self._on_done = on_done
+        self._queues: set[asyncio.Queue[bytes | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._done = False
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of viewers of the stream."""
+        return len(self._queues)
+
+    @callback
+    def _subscribe(self) -> asyncio.Queue[bytes | None]:
+        """Add a viewer, starting to read the source for the first one."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(MAX_QUEUED_FRAMES)
+        self._queues.add(queue)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_read_source(), self._task_name
+            )
+        return queue
+
+    @callback
+    def _unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Remove a viewer, stopping to read the source after the last one."""
+        self._queues.discard(queue)
+        if not self._queues and self._task is not None:
+            self._task.cancel()
+            self._async_done()
+
+    @callback
+    def _async_done(self) -> None:
+        """Stop sharing frames."""
+        if not self._done:
+            self._done = True
+            self._on_done(self)
+
+    @callback
+    def _publish(self, frame: bytes | None) -> None:
+        """Queue a frame for all viewers, None ends the stream."""
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped_frames += 1
+            queue.put_nowait(frame)
+
+    @property
+    def _task_name(self) -> str:
+        """Return the name of the task reading the source."""
+        raise NotImplementedError
+
+    async def _async_read_source(self) -> None:
+        """Read the source until it ends."""
+        try:
+            await self._async_read_frames()
+        except Exception:
+            _LOGGER.exception("Error reading %s", self._task_name)
+        finally:
+            if self._queues:
+                self._publish(None)
+            self._async_done()
+
+    async def _async_read_frames(self) -> None:
+        """Read and publish the frames of the source."""
+        raise NotImplementedError
+
+    async def _async_frames(self) -> AsyncIterator[bytes]:
+        """Yield the frames of the source for a viewer."""
+        if self._done:
+            return
+        queue = self._subscribe()
+        try:
+            while (frame := await queue.get()) is not None:
+                yield frame
+        finally:
+            self._unsubscribe(queue)
+
+
+class StillStreamBroadcaster(_Broadcaster):
+    """Fetch the images of a still stream once for all of its viewers.
+
+    Images are fetched from the camera at the interval of the stream while
+    there are viewers, and queued for each viewer.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        interval: float,
+        on_done: Callable[[StillStreamBroadcaster], None],
+    ) -> None:
+        """Initialize the broadcaster."""
+        super().__init__(hass, on_done)
+        self.interval = interval
+        self._image_cb = image_cb
+        self._last_image: bytes | None = None
+
+    @property
+    def _task_name(self) -> str:
+        """Return the name of the task fetching the images."""
+        return f"camera still stream {self.interval}"
+
+    @callback
+    def _subscribe(self) -> asyncio.Queue[bytes | None]:
+        """Add a viewer, starting with the current image of a running stream."""
+        queue = super()._subscribe()
+        if self._last_image is not None:
+            queue.put_nowait(self._last_image)
+        return queue
+
+    async def _async_read_frames(self) -> None:
+        """Fetch images from the camera until there are no more images."""
+        while True:
+            last_fetch = time.monotonic()
+            if not (image := await self._image_cb()):
+                break
+            if image != self._last_image:
+                self._last_image = image
+                self._publish(image)
+            next_fetch = last_fetch + self.interval
+            now = time.monotonic()
+            if next_fetch > now:
+                await asyncio.sleep(next_fetch - now)
+
+    def async_images(self) -> AsyncIterator[bytes]:
+        """Yield the images of the stream for a viewer."""
+        return self._async_frames()
+
+
+class MjpegStreamBroadcaster(_Broadcaster):
+    """Proxy one upstream MJPEG stream of a camera to all of its viewers.
+
+    The upstream stream is opened for the first viewer and closed after the
+    last one left. It is split into the parts of the multipart stream, so
+    viewers joining the stream and viewers skipping parts still receive
+    whole frames. Streams without a boundary are shared as they are read.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        open_stream: Callable[[], Awaitable[aiohttp.ClientResponse]],
+        on_done: Callable[[MjpegStreamBroadcaster], None],
+    ) -> None:
+        """Initialize the broadcaster."""
+        super().__init__(hass, on_done)
+        self.content_type: str | None = None
+        self._open_stream = open_stream
+        self._error: type[web.HTTPException] | None = None
+
+    @property
+    def _task_name(self) -> str:
+        """Return the name of the task proxying the stream."""
+        return "camera upstream mjpeg stream"
+
+    async def _async_read_frames(self) -> None:
+        """Read the upstream stream until it ends."""
+        try:
+            async with asyncio.timeout(UPSTREAM_TIMEOUT):
+                response = await self._open_stream()
+        except TimeoutError:
+            self._error = web.HTTPGatewayTimeout
+            return
+        except aiohttp.ClientError:
+            self._error = web.HTTPBadGateway
+            return
+
+        try:
+            self.content_type = response.headers.get(hdrs.CONTENT_TYPE)
+            boundary = (
+                parse_mimetype(self.content_type).parameters.get("boundary")
+                if self.content_type
+                else None
+            )
+            # Suppressing something went wrong fetching data, closed connection
+            with suppress(TimeoutError, aiohttp.ClientError):
+                if boundary:
+                    await self._async_read_parts(response, boundary)
+                else:
+                    await self._async_read_chunks(response)
+        finally:
+            response.close()
+
+    async def _async_read(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read the next data of the upstream stream."""
+        async with asyncio.timeout(UPSTREAM_TIMEOUT):
+            return await response.content.read(UPSTREAM_BUFFER_SIZE)
+
+    async def _async_read_chunks(self, response: aiohttp.ClientResponse) -> None:
+        """Publish the data of the upstream stream as it is read."""
+        while self.hass.is_running and (data := await self._async_read(response)):
+            self._publish(data)
+
+    async def _async_read_parts(
+        self, response: aiohttp.ClientResponse, boundary: str
+    ) -> None:
+        """Publish each part of the upstream multipart stream.
+
+        Some cameras repeat the dashes of the delimiter in the boundary
+        parameter, so the boundary is matched without them.
+        """
+        delimiter = b"--" + boundary.lstrip("-").encode()
+        buffer = bytearray()
+        while self.hass.is_running and (data := await self._async_read(response)):
+            buffer += data
+            if (start := buffer.find(delimiter)) < 0:
+                # Keep what could be the start of a delimiter
+                del buffer[: -len(delimiter)]
+                continue
+            while (end := buffer.find(delimiter, start + len(delimiter))) >= 0:
+                self._publish(bytes(buffer[start:end]))
+                start = end
+            del buffer[:start]
+            if len(buffer) > MAX_PART_SIZE:
+                _LOGGER.warning(
+                    "Part of the upstream MJPEG stream exceeds %s bytes",
+                    MAX_PART_SIZE,
+                )
+                return
+
+    async def async_parts(self) -> AsyncIterator[bytes]:
+        """Yield the parts of the stream for a viewer.
+
+        Raises an HTTP error if the upstream stream could not be opened.
+        """
+        frames = self._async_frames()
+        try:
+            first_frame = await anext(frames, None)
+            if self._error is not None:
+                raise self._error
+            if first_frame is None:
+                return
+            yield first_frame
+            async for frame in frames:
+                yield frame
+        finally:
+            await frames.aclose()
@@ -20,6 +20,7 @@ DATA_CAMERA_PREFS: HassKey[CameraPreferences] = HassKey("camera_prefs")
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
+PREF_SNAPSHOT_CACHE_TTL: Final = "snapshot_cache_ttl"
 
 SERVICE_RECORD: Final = "record"
 
@@ -13,7 +13,12 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM
+from .const import (
+    DOMAIN,
+    PREF_ORIENTATION,
+    PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_CACHE_TTL,
+)
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -25,19 +30,21 @@ class DynamicStreamSettings:
 
     preload_stream: bool = False
     orientation: Orientation = Orientation.NO_TRANSFORM
+    # Seconds snapshots are served from the cache, None for the camera default
+    snapshot_cache_ttl: float | None = None
 
 
 class CameraPreferences:
     """Handle camera preferences."""
 
-    _preload_prefs: dict[str, dict[str, bool | Orientation]]
+    _preload_prefs: dict[str, dict[str, bool | float | None]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize camera prefs."""
         self._hass = hass
         # The orientation prefs are stored in in the entity registry options
-        # The preload_stream prefs are stored in this Store
-        self._store = Store[dict[str, dict[str, bool | Orientation]]](
+        # The preload_stream and snapshot_cache_ttl prefs are stored in this Store
+        self._store = Store[dict[str, dict[str, bool | float | None]]](
             hass, STORAGE_VERSION, STORAGE_KEY
         )
         self._dynamic_stream_settings_by_entity_id: dict[
@@ -54,11 +61,12 @@ class CameraPreferences:
         *,
         preload_stream: bool | UndefinedType = UNDEFINED,
         orientation: Orientation | UndefinedType = UNDEFINED,
-    ) -> dict[str, bool | Orientation]:
+        snapshot_cache_ttl: float | None | UndefinedType = UNDEFINED,
+    ) -> dict[str, bool | Orientation | float | None]:
         """Update camera preferences.
 
         Also update the DynamicStreamSettings if they exist.
-        preload_stream is stored in a Store
+        preload_stream and snapshot_cache_ttl are stored in a Store
         orientation is stored in the Entity Registry
 
         Returns a dict with the preferences on success.
@@ -70,7 +78,17 @@ class CameraPreferences:
         if preload_stream is not UNDEFINED:
             if dynamic_stream_settings:
                 dynamic_stream_settings.preload_stream = preload_stream
-            self._preload_prefs[entity_id] = {PREF_PRELOAD_STREAM: preload_stream}
+            self._preload_prefs.setdefault(entity_id, {})[PREF_PRELOAD_STREAM] = (
+                preload_stream
+            )
+            await self._store.async_save(self._preload_prefs)
+
+        if snapshot_cache_ttl is not UNDEFINED:
+            if dynamic_stream_settings:
+                dynamic_stream_settings.snapshot_cache_ttl = snapshot_cache_ttl
+            self._preload_prefs.setdefault(entity_id, {})[PREF_SNAPSHOT_CACHE_TTL] = (
+                snapshot_cache_ttl
+            )
             await self._store.async_save(self._preload_prefs)
 
         if orientation is not UNDEFINED:
@@ -97,12 +115,11 @@ class CameraPreferences:
         # Get orientation setting from entity registry
         reg_entry = er.async_get(self._hass).async_get(entity_id)
         er_prefs: Mapping = reg_entry.options.get(DOMAIN, {}) if reg_entry else {}
+        store_prefs = self._preload_prefs.get(entity_id, {})
         settings = DynamicStreamSettings(
-            preload_stream=cast(
-                bool,
-                self._preload_prefs.get(entity_id, {}).get(PREF_PRELOAD_STREAM, False),
-            ),
+            preload_stream=cast(bool, store_prefs.get(PREF_PRELOAD_STREAM, False)),
             orientation=er_prefs.get(PREF_ORIENTATION, Orientation.NO_TRANSFORM),
+            snapshot_cache_ttl=store_prefs.get(PREF_SNAPSHOT_CACHE_TTL),
         )
         self._dynamic_stream_settings_by_entity_id[entity_id] = settings
         return settings
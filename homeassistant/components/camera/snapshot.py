@@ -0,0 +1,151 @@
+"""Cache of the snapshots of a camera."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING
+
+import attr
+
+from homeassistant.core import HomeAssistant
+
+from .img_util import scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Image
+
+# Most sizes of a snapshot kept at the same time, requests may ask for any size
+MAX_SNAPSHOT_SIZES = 16
+
+type SnapshotSize = tuple[int | None, int | None]
+
+FULL_SIZE: SnapshotSize = (None, None)
+
+
+def _is_jpeg(image: Image) -> bool:
+    """Return if an image can be scaled."""
+    return "jpeg" in image.content_type or "jpg" in image.content_type
+
+
+class SnapshotCache:
+    """Cache the snapshots of a camera for a short time.
+
+    Requests for a snapshot of the same size share one fetch from the camera,
+    each waiting for it as long as its own timeout allows, and fetched
+    snapshots are served until they are older than the TTL of the camera.
+    Scaled variants of a fresh full size snapshot are scaled from it once
+    instead of fetched from the camera.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the snapshot cache."""
+        self.hits = 0
+        self.misses = 0
+        self._snapshots: dict[SnapshotSize, tuple[float, Image]] = {}
+        self._fetches: dict[SnapshotSize, asyncio.Task[Image]] = {}
+        # Number of requests waiting for each fetch
+        self._waiters: dict[asyncio.Task[Image], int] = {}
+
+    def _get_fresh(self, size: SnapshotSize, ttl: float) -> tuple[float, Image] | None:
+        """Return a snapshot of a size which is not older than the TTL."""
+        if (snapshot := self._snapshots.get(size)) is not None and (
+            time.monotonic() - snapshot[0] < ttl
+        ):
+            return snapshot
+        return None
+
+    def _store(
+        self, size: SnapshotSize, ttl: float, fetched: float, image: Image
+    ) -> None:
+        """Store a snapshot, dropping the snapshots which are no longer fresh."""
+        snapshots = self._snapshots
+        now = time.monotonic()
+        for stale in [
+            stale for stale, snapshot in snapshots.items() if now - snapshot[0] >= ttl
+        ]:
+            del snapshots[stale]
+        if size not in snapshots and len(snapshots) >= MAX_SNAPSHOT_SIZES:
+            oldest = min(snapshots, key=lambda size: snapshots[size][0])
+            del snapshots[oldest]
+        snapshots[size] = (fetched, image)
+
+    async def async_get(
+        self,
+        hass: HomeAssistant,
+        ttl: float,
+        width: int | None,
+        height: int | None,
+        timeout: float,
+        fetch: Callable[[int | None, int | None], Awaitable[Image]],
+    ) -> Image:
+        """Return a snapshot of a size, fetching it if there is no fresh one.
+
+        Raises TimeoutError if the snapshot is not fetched within the timeout
+        of the request, the fetch is cancelled once no request waits for it.
+        """
+        size = (width, height)
+        if ttl:
+            if (snapshot := self._get_fresh(size, ttl)) is not None:
+                self.hits += 1
+                return snapshot[1]
+            if (
+                width is not None
+                and height is not None
+                and (full := self._get_fresh(FULL_SIZE, ttl)) is not None
+                and _is_jpeg(full[1])
+            ):
+                self.hits += 1
+                fetched, full_image = full
+                image = attr.evolve(
+                    full_image,
+                    content=scale_jpeg_camera_image(full_image, width, height),
+                )
+                self._store(size, ttl, fetched, image)
+                return image
+
+        if (task := self._fetches.get(size)) is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            # Not started eagerly, the fetch must be registered before it
+            # can finish and unregister itself
+            task = self._fetches[size] = hass.async_create_task_internal(
+                self._async_fetch(size, ttl, fetch),
+                f"camera snapshot {size}",
+                eager_start=False,
+            )
+            self._waiters[task] = 0
+        self._waiters[task] += 1
+        try:
+            async with asyncio.timeout(timeout):
+                # Shield the fetch so a request going away does not
+                # cancel it for the other requests sharing it
+                return await asyncio.shield(task)
+        finally:
+            if waiters := self._waiters[task] - 1:
+                self._waiters[task] = waiters
+            else:
+                del self._waiters[task]
+                if not task.done():
+                    # No request waits for the fetch anymore
+                    task.cancel()
+                    if self._fetches.get(size) is task:
+                        del self._fetches[size]
+
+    async def _async_fetch(
+        self,
+        size: SnapshotSize,
+        ttl: float,
+        fetch: Callable[[int | None, int | None], Awaitable[Image]],
+    ) -> Image:
+        """Fetch a snapshot from the camera."""
+        try:
+            image = await fetch(*size)
+        finally:
+            if self._fetches.get(size) is asyncio.current_task():
+                del self._fetches[size]
+        if ttl:
+            self._store(size, ttl, time.monotonic(), image)
+        return image
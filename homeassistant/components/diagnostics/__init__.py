@@ -74,8 +74,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Diagnostics from a config entry."""
     hass.data[DOMAIN] = DiagnosticsData()
 
+    # Diagnostics platforms are only imported when diagnostics are requested
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
+        hass, DOMAIN, _register_diagnostics_platform, defer_imports=True
     )
 
     websocket_api.async_register_command(hass, handle_info)
@@ -111,14 +112,22 @@ def _register_diagnostics_platform(
     )
 
 
+async def _async_get_diagnostics_data(hass: HomeAssistant) -> DiagnosticsData:
+    """Return the diagnostics data with the platforms of all integrations."""
+    await integration_platform.async_process_deferred_integration_platforms(
+        hass, DOMAIN
+    )
+    return hass.data[DOMAIN]
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    diagnostics_data = await _async_get_diagnostics_data(hass)
     result = [
         {
             "domain": domain,
@@ -139,13 +148,13 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    diagnostics_data = await _async_get_diagnostics_data(hass)
 
     if (info := diagnostics_data.platforms.get(domain)) is None:
         connection.send_error(
@@ -267,7 +276,7 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+        diagnostics_data = await _async_get_diagnostics_data(hass)
         if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
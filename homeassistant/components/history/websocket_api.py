@@ -7,12 +7,12 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import get_instance, history, statistics
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -72,27 +72,248 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    resolution: Literal["5minute", "hour"] | None = None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
+                resolution,
             ),
         )
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_id: str,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    resolution: Literal["5minute", "hour"] | None,
+) -> bytes | None:
+    """Fetch the history of one entity and convert it to a json event in the executor."""
+    if not (
+        states := _get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            [entity_id],
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            resolution,
+        )
+    ):
+        return None
+    return json_bytes(messages.event_message(msg_id, {"states": states}))
+
+
+def _get_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    resolution: Literal["5minute", "hour"] | None,
+) -> dict[str, Any]:
+    """Fetch history significant_states in the compressed state format."""
+    if resolution and entity_ids:
+        return _get_significant_states_with_rollups(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            resolution,
+        )
+    return history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+
+
+def _get_significant_states_with_rollups(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    resolution: Literal["5minute", "hour"],
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch history, serving entities with a mean from the statistics.
+
+    The recorder compiles the mean, min and max of measurement entities every
+    5 minutes, those statistics are used as the downsampled history for
+    entities which have them. The raw states are only fetched for the other
+    entities, and for the time before the first and after the last compiled
+    statistics period.
+    """
+    rollups: dict[str, list[statistics.StatisticsRow]] = {}
+    if metadata := statistics.get_metadata(
+        hass, statistic_ids=set(entity_ids), statistic_type="mean"
+    ):
+        rollups = statistics.statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            set(metadata),
+            resolution,
+            None,
+            {"mean", "min", "max"},
+        )
+    rollup_entity_ids = [
+        entity_id for entity_id in entity_ids if rollups.get(entity_id)
+    ]
+    raw_entity_ids = [
+        entity_id for entity_id in entity_ids if entity_id not in rollup_entity_ids
+    ]
+
+    states: dict[str, list[dict[str, Any]]] = {}
+    if rollup_entity_ids:
+        # Fetch the raw states before the first compiled period, the state
+        # at the start time is always fetched for its attributes
+        start_time_ts = start_time.timestamp()
+        head = history.get_significant_states(
+            hass,
+            start_time,
+            dt_util.utc_from_timestamp(
+                max(rollups[entity_id][0]["start"] for entity_id in rollup_entity_ids)
+            ),
+            rollup_entity_ids,
+            None,
+            True,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        for entity_id in rollup_entity_ids:
+            first_start_ts = rollups[entity_id][0]["start"]
+            entity_states = states[entity_id] = [
+                head_state
+                for head_state in cast(list[dict[str, Any]], head.get(entity_id, []))
+                if (last_updated_ts := head_state[COMPRESSED_STATE_LAST_UPDATED])
+                < first_start_ts
+                or last_updated_ts == start_time_ts
+            ]
+            attributes: dict[str, Any] | None = None
+            if (
+                entity_states
+                and entity_states[0][COMPRESSED_STATE_LAST_UPDATED] == start_time_ts
+            ):
+                attributes = entity_states[0].get(COMPRESSED_STATE_ATTRIBUTES)
+                if not include_start_time_state:
+                    del entity_states[0]
+            if entity_states:
+                if attributes is not None:
+                    entity_states[0].setdefault(COMPRESSED_STATE_ATTRIBUTES, attributes)
+                attributes = None
+            for row in rollups[entity_id]:
+                if (mean := row.get("mean")) is None:
+                    continue
+                comp_state: dict[str, Any] = {
+                    COMPRESSED_STATE_STATE: str(mean),
+                    COMPRESSED_STATE_LAST_UPDATED: row["start"],
+                }
+                if (min_ := row.get("min")) is not None:
+                    comp_state["min"] = min_
+                if (max_ := row.get("max")) is not None:
+                    comp_state["max"] = max_
+                if attributes is not None:
+                    # Only the first state carries the attributes
+                    comp_state[COMPRESSED_STATE_ATTRIBUTES] = attributes
+                    attributes = None
+                entity_states.append(comp_state)
+
+        # Fill in the raw states after the last compiled period
+        tail_start_ts = min(
+            rollups[entity_id][-1]["end"] for entity_id in rollup_entity_ids
+        )
+        tail_start = dt_util.utc_from_timestamp(tail_start_ts)
+        if end_time is None or tail_start < end_time:
+            tail = history.get_significant_states(
+                hass,
+                tail_start,
+                end_time,
+                rollup_entity_ids,
+                None,
+                False,
+                significant_changes_only,
+                True,
+                True,
+                True,
+            )
+            for entity_id, tail_states in tail.items():
+                last_end_ts = rollups[entity_id][-1]["end"]
+                states[entity_id].extend(
+                    {
+                        COMPRESSED_STATE_STATE: tail_state[COMPRESSED_STATE_STATE],
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                    for tail_state in cast(list[dict[str, Any]], tail_states)
+                    if (last_updated_ts := tail_state[COMPRESSED_STATE_LAST_UPDATED])
+                    >= last_end_ts
+                )
+
+    if raw_entity_ids:
+        states.update(
+            cast(
+                dict[str, list[dict[str, Any]]],
+                history.get_significant_states(
+                    hass,
+                    start_time,
+                    end_time,
+                    raw_entity_ids,
+                    None,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    True,
+                ),
+            )
+        )
+
+    # Keep the order of the requested entity_ids
+    return {
+        entity_id: states[entity_id]
+        for entity_id in entity_ids
+        if states.get(entity_id)
+    }
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +324,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("resolution"): vol.In(("5minute", "hour")),
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -129,7 +352,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -152,12 +375,39 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        # Send the history one entity at a time so only the history of a
+        # single entity is held in memory and the frontend can render it
+        # as it arrives. The result is sent first, then an event for each
+        # entity with states and a final event once all have been sent.
+        connection.send_result(msg["id"])
+        instance = get_instance(hass)
+        for entity_id in entity_ids:
+            if message := await instance.async_add_executor_job(
+                _ws_get_significant_states_chunk,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_id,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                msg.get("resolution"),
+            ):
+                connection.send_message(message)
+        connection.send_message(
+            messages.event_message(msg["id"], {"states": {}, "complete": True})
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -170,10 +420,25 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("resolution"),
         )
     )
 
 
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history_during_period response."""
+    if not msg["chunked"]:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(
+        messages.event_message(msg["id"], {"states": {}, "complete": True})
+    )
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
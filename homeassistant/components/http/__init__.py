@@ -10,6 +10,7 @@ from functools import partial
 from ipaddress import IPv4Network, IPv6Network, ip_network
 import logging
 import os
+from pathlib import Path
 import socket
 import ssl
 from tempfile import NamedTemporaryFile
@@ -68,7 +69,12 @@ from .forwarded import async_setup_forwarded
 from .headers import setup_headers
 from .request_context import setup_request_context
 from .security_filter import setup_security_filter
-from .static import CACHE_HEADERS, CachingStaticResource
+from .static import (
+    CACHE_HEADERS,
+    COMPRESSED_CACHE_DIR,
+    CachingStaticResource,
+    prune_compressed_cache,
+)
 from .web_runner import HomeAssistantTCPSite
 
 CONF_SERVER_HOST: Final = "server_host"
@@ -149,12 +155,6 @@ class StaticPathConfig:
     cache_headers: bool = True
 
 
-_STATIC_CLASSES = {
-    True: CachingStaticResource,
-    False: web.StaticResource,
-}
-
-
 class ConfData(TypedDict, total=False):
     """Typed dict for config data."""
 
@@ -251,6 +251,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_server)
             # We already checked it's not None.
             assert conf is not None
+            # Before any file is compressed
+            await hass.async_add_executor_job(
+                prune_compressed_cache, Path(hass.config.path(COMPRESSED_CACHE_DIR))
+            )
             await start_http_server_and_save_config(hass, dict(conf), server)
 
     async_when_setup_or_start(hass, "frontend", start_server)
@@ -461,9 +465,16 @@ class HomeAssistantHTTP:
         self, configs: Collection[StaticPathConfig]
     ) -> dict[str, CachingStaticResource | web.StaticResource | None]:
         """Create a list of static resources."""
+        compressed_cache_dir = Path(self.hass.config.path(COMPRESSED_CACHE_DIR))
         return {
-            config.url_path: _STATIC_CLASSES[config.cache_headers](
-                config.url_path, config.path
+            config.url_path: (
+                CachingStaticResource(
+                    config.url_path,
+                    config.path,
+                    compressed_cache_dir=compressed_cache_dir,
+                )
+                if config.cache_headers
+                else web.StaticResource(config.url_path, config.path)
             )
             if os.path.isdir(config.path)
             else None
@@ -2,21 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+from dataclasses import dataclass
+import gzip
+from hashlib import sha1
+from http import HTTPStatus
+import os
 from pathlib import Path
+import shutil
 import sys
-from typing import Final
+import tempfile
+import time
+from typing import Any, Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    VARY,
+)
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
+from homeassistant.helpers.http import KEY_HASS
+
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
-RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
+RESPONSE_CACHE: LRU[tuple[str, Path], StaticFile] = LRU(512)
+
+# Seconds a cached file is trusted before it is checked for changes
+FILE_CHECK_INTERVAL: Final = 5
+# Directory of the config directory where compressed files are cached
+COMPRESSED_CACHE_DIR: Final = ".cache/http"
+# Suffix of the files keeping the path of the compressed files
+SOURCE_SUFFIX: Final = ".source"
+TEMP_SUFFIX: Final = ".tmp"
+COMPRESS_MIN_SIZE: Final = 1024
+COMPRESS_MAX_SIZE: Final = 16 * 1024 * 1024
+COMPRESSIBLE_CONTENT_TYPES: Final = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+}
 
 if sys.version_info >= (3, 13):
     # guess_type is soft-deprecated in 3.13
@@ -28,20 +63,189 @@ else:
     _GUESSER = CONTENT_TYPES.guess_type
 
 
+def _etag(stat: os.stat_result) -> str:
+    """Return the entity tag of a file, the same as aiohttp uses."""
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+@dataclass(slots=True)
+class StaticFile:
+    """A resolved static file."""
+
+    path: Path
+    content_type: str
+    etag: str
+    # Monotonic time the file was last checked for changes
+    checked: float
+    # If the file can be compressed, it has no precompressed siblings
+    compressible: bool
+    # Path and entity tag of the compressed file once it is cached
+    compressed: tuple[Path, str] | None = None
+    # Compression shared by the requests arriving while the file is compressed
+    compressing: asyncio.Future[tuple[Path, str]] | None = None
+
+
+def _stat_file(path: Path) -> os.stat_result | None:
+    """Return the stat of a file or None if it is no longer a file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat if path.is_file() else None
+
+
+def _index_file(path: Path, content_type: str) -> StaticFile | None:
+    """Return the static file of a path."""
+    if (stat := _stat_file(path)) is None:
+        return None
+    compressible = (
+        (
+            content_type.startswith("text/")
+            or content_type.partition(";")[0] in COMPRESSIBLE_CONTENT_TYPES
+        )
+        and COMPRESS_MIN_SIZE <= stat.st_size <= COMPRESS_MAX_SIZE
+        # Precompressed files are served by FileResponse
+        and not any(
+            path.with_name(f"{path.name}{suffix}").exists() for suffix in (".gz", ".br")
+        )
+    )
+    return StaticFile(path, content_type, _etag(stat), time.monotonic(), compressible)
+
+
+def _compress_file(path: Path, etag: str, cache_dir: Path) -> tuple[Path, str]:
+    """Compress a file to the cache, reusing a compressed file of the same version.
+
+    The path of the file is kept next to its compressed files, so they can be
+    pruned once the file is removed.
+    """
+    name = sha1(str(path).encode(), usedforsecurity=False).hexdigest()
+    compressed_path = cache_dir / f"{name}-{etag}.gz"
+    if not compressed_path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_dir.joinpath(f"{name}{SOURCE_SUFFIX}").write_text(str(path))
+        temp_file = tempfile.NamedTemporaryFile(
+            dir=cache_dir, suffix=TEMP_SUFFIX, delete=False
+        )
+        try:
+            with (
+                temp_file,
+                path.open("rb") as source,
+                gzip.GzipFile(fileobj=temp_file, mode="wb", mtime=0) as target,
+            ):
+                shutil.copyfileobj(source, target)
+            os.replace(temp_file.name, compressed_path)
+        except BaseException:
+            Path(temp_file.name).unlink(missing_ok=True)
+            raise
+        # Drop the compressed files of previous versions of the file
+        for previous in cache_dir.glob(f"{name}-*.gz"):
+            if previous != compressed_path:
+                previous.unlink(missing_ok=True)
+    return compressed_path, _etag(compressed_path.stat())
+
+
+def prune_compressed_cache(cache_dir: Path) -> None:
+    """Remove the compressed files of files which no longer exist.
+
+    Also removes the temporary files of compressions which were interrupted.
+    """
+    if not cache_dir.is_dir():
+        return
+    sources: set[str] = set()
+    for source_path in cache_dir.glob(f"*{SOURCE_SUFFIX}"):
+        name = source_path.name.removesuffix(SOURCE_SUFFIX)
+        try:
+            exists = Path(source_path.read_text()).is_file()
+        except OSError:
+            exists = False
+        if exists:
+            sources.add(name)
+        else:
+            source_path.unlink(missing_ok=True)
+    for file in cache_dir.iterdir():
+        if (file.suffix == ".gz" and file.name.partition("-")[0] not in sources) or (
+            file.suffix == TEMP_SUFFIX
+        ):
+            file.unlink(missing_ok=True)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return if the Accept-Encoding header of a request accepts gzip."""
+    accepted = False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if (name := name.strip().lower()) not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        if name == "gzip":
+            return quality > 0
+        # The wildcard applies when gzip is not listed
+        accepted = quality > 0
+    return accepted
+
+
+def _matching_etag(request: Request, static_file: StaticFile) -> str | None:
+    """Return the entity tag of the file the client has, if any."""
+    if not (if_none_match := request.if_none_match):
+        return None
+    etags = {static_file.etag}
+    if static_file.compressed:
+        etags.add(static_file.compressed[1])
+    for etag in if_none_match:
+        if etag.value == ETAG_ANY:
+            return static_file.etag
+        if etag.value in etags:
+            return etag.value
+    return None
+
+
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Resolved files are indexed with their entity tag, so requests for files
+    which the client already has are answered without filesystem access.
+    Compressible files without precompressed siblings are compressed once to
+    the compressed cache directory. Files are checked for changes at most once
+    every FILE_CHECK_INTERVAL seconds.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        directory: str | Path,
+        *,
+        compressed_cache_dir: Path | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the static resource."""
+        super().__init__(prefix, directory, **kwargs)
+        self._compressed_cache_dir = compressed_cache_dir
 
     async def _handle(self, request: Request) -> StreamResponse:
         """Wrap base handler to cache file path resolution and content type guess."""
         rel_url = request.match_info["filename"]
         key = (rel_url, self._directory)
+        hass = request.app[KEY_HASS]
         response: StreamResponse
 
-        if key in RESPONSE_CACHE:
-            file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
-        else:
+        if (static_file := RESPONSE_CACHE.get(key)) is not None and (
+            time.monotonic() - static_file.checked > FILE_CHECK_INTERVAL
+        ):
+            stat = await hass.async_add_executor_job(_stat_file, static_file.path)
+            if stat is None or _etag(stat) != static_file.etag:
+                del RESPONSE_CACHE[key]
+                static_file = None
+            else:
+                static_file.checked = time.monotonic()
+
+        if static_file is None:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
                 # Must be directory index; ignore caching
@@ -50,7 +254,49 @@ class CachingStaticResource(StaticResource):
             response.content_type = _GUESSER(file_path)[0] or FALLBACK_CONTENT_TYPE
             # Cache actual header after setter construction.
             content_type = response.headers[CONTENT_TYPE]
-            RESPONSE_CACHE[key] = (file_path, content_type)
+            if (
+                static_file := await hass.async_add_executor_job(
+                    _index_file, file_path, content_type
+                )
+            ) is None:
+                response.headers[CACHE_CONTROL] = CACHE_HEADER
+                return response
+            RESPONSE_CACHE[key] = static_file
+
+        if (etag := _matching_etag(request, static_file)) is not None:
+            response = Response(status=HTTPStatus.NOT_MODIFIED)
+            response.etag = etag
+        elif (
+            static_file.compressible
+            and self._compressed_cache_dir is not None
+            and _accepts_gzip(request.headers.get(ACCEPT_ENCODING, ""))
+        ):
+            if static_file.compressed is None:
+                if (compressing := static_file.compressing) is None:
+                    compressing = static_file.compressing = hass.async_add_executor_job(
+                        _compress_file,
+                        static_file.path,
+                        static_file.etag,
+                        self._compressed_cache_dir,
+                    )
+                try:
+                    # Shielded so a request going away does not cancel
+                    # the compression for the other requests
+                    static_file.compressed = await asyncio.shield(compressing)
+                except Exception:
+                    # The next request compresses the file again
+                    static_file.compressing = None
+                    raise
+            response = FileResponse(
+                static_file.compressed[0], chunk_size=self._chunk_size
+            )
+            response.headers[CONTENT_ENCODING] = "gzip"
+            response.headers[CONTENT_TYPE] = static_file.content_type
+        else:
+            response = FileResponse(static_file.path, chunk_size=self._chunk_size)
+            response.headers[CONTENT_TYPE] = static_file.content_type
 
+        if static_file.compressible:
+            response.headers[VARY] = "Accept-Encoding"
         response.headers[CACHE_CONTROL] = CACHE_HEADER
         return response
@@ -59,6 +59,7 @@ from .const import (
     CODE_INVALID_INPUTS,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
+    CONF_ASYNC_WRITER,
     CONF_BUCKET,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
@@ -102,6 +103,7 @@ from .const import (
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .writer import InfluxWriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -165,6 +167,7 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_ASYNC_WRITER, default=False): cv.boolean,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -492,6 +495,14 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         return True
 
     event_to_json = _generate_event_to_json(conf)
+
+    if conf[CONF_ASYNC_WRITER]:
+        # The client was only needed to check the connection
+        influx.close()
+        writer = hass.data[DOMAIN] = InfluxWriter(hass, conf, event_to_json)
+        hass.add_job(writer.async_start)
+        return True
+
     max_tries = conf.get(CONF_RETRY_COUNT)
     instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
     instance.start()
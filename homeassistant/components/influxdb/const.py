@@ -33,6 +33,7 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_ASYNC_WRITER = "async_writer"
 
 CONF_QUERIES = "queries"
 CONF_QUERIES_FLUX = "queries_flux"
@@ -78,6 +79,11 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+ASYNC_BATCH_MAX_BYTES = 512 * 1024
+ASYNC_BATCH_MAX_POINTS = 5000
+ASYNC_MAX_WRITES_IN_FLIGHT = 4
+BUFFER_DIR = ".cache/influxdb"
+BUFFER_MAX_BYTES = 64 * 1024 * 1024
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +126,9 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+BUFFERING_MESSAGE = "%s Buffering events on disk until InfluxDB is available."
+BUFFER_FULL_MESSAGE = "Disk buffer is full, dropped %d bytes of the oldest events."
+BUFFER_REPLAYED_MESSAGE = "Resumed, wrote %d buffered batches."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
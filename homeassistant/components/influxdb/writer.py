@@ -0,0 +1,428 @@
+"""Asynchronous line protocol writer for InfluxDB."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+import logging
+import math
+from pathlib import Path
+import ssl
+import threading
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PATH,
+    CONF_PORT,
+    CONF_SSL,
+    CONF_TOKEN,
+    CONF_URL,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    API_VERSION_2,
+    ASYNC_BATCH_MAX_BYTES,
+    ASYNC_BATCH_MAX_POINTS,
+    ASYNC_MAX_WRITES_IN_FLIGHT,
+    BATCH_TIMEOUT,
+    BUFFER_DIR,
+    BUFFER_FULL_MESSAGE,
+    BUFFER_MAX_BYTES,
+    BUFFER_REPLAYED_MESSAGE,
+    BUFFERING_MESSAGE,
+    CLIENT_ERROR_V1,
+    CLIENT_ERROR_V2,
+    CODE_INVALID_INPUTS,
+    CONF_API_VERSION,
+    CONF_BUCKET,
+    CONF_DB_NAME,
+    CONF_ORG,
+    CONF_PRECISION,
+    CONF_SSL_CA_CERT,
+    CONNECTION_ERROR,
+    INFLUX_CONF_FIELDS,
+    INFLUX_CONF_MEASUREMENT,
+    INFLUX_CONF_TAGS,
+    INFLUX_CONF_TIME,
+    RETRY_DELAY,
+    TIMEOUT,
+    WRITE_ERROR,
+    WROTE_MESSAGE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HOST_V1 = "localhost"
+DEFAULT_PORT_V1 = 8086
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+# Microseconds per unit of the precision
+_PRECISION_DIVISORS = {"s": 1_000_000, "ms": 1_000, "us": 1}
+# Precision parameter of the V1 write endpoint
+_PRECISION_V1 = {"s": "s", "ms": "ms", "us": "u", "ns": "n"}
+
+_MEASUREMENT_ESCAPES = str.maketrans({",": r"\,", " ": r"\ ", "\n": r"\n"})
+_KEY_ESCAPES = str.maketrans({",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n"})
+_STRING_ESCAPES = str.maketrans({'"': r"\"", "\\": r"\\"})
+
+
+def _encode_field_value(value: Any) -> str | None:
+    """Encode a field value, returning None if it cannot be written."""
+    if isinstance(value, str):
+        return f'"{value.translate(_STRING_ESCAPES)}"'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if not math.isfinite(value := float(value)):
+        return None
+    return repr(value)
+
+
+def encode_line(json: dict[str, Any], precision: str | None) -> bytes | None:
+    """Encode an event converted by event_to_json to a line of line protocol.
+
+    Returns None if the point has no fields which can be written.
+    """
+    fields = ",".join(
+        f"{str(key).translate(_KEY_ESCAPES)}={encoded}"
+        for key, value in json[INFLUX_CONF_FIELDS].items()
+        if (encoded := _encode_field_value(value)) is not None
+    )
+    if not fields:
+        return None
+    tags = "".join(
+        f",{key.translate(_KEY_ESCAPES)}={tag.translate(_KEY_ESCAPES)}"
+        for key, value in sorted(json[INFLUX_CONF_TAGS].items())
+        if value is not None and (tag := str(value))
+    )
+    measurement = str(json[INFLUX_CONF_MEASUREMENT]).translate(_MEASUREMENT_ESCAPES)
+    microseconds = (json[INFLUX_CONF_TIME] - _EPOCH) // _MICROSECOND
+    if precision in _PRECISION_DIVISORS:
+        timestamp = microseconds // _PRECISION_DIVISORS[precision]
+    else:
+        timestamp = microseconds * 1000
+    return f"{measurement}{tags} {fields} {timestamp}".encode()
+
+
+class _WriteError(Exception):
+    """Error writing a batch which may succeed when retried."""
+
+
+class DiskBuffer:
+    """Batches which could not be written, kept on disk until they can be.
+
+    Each batch is a file, so writing a batch only appends a file and the
+    oldest batches can be dropped when the buffer is full. The files and
+    their sizes are listed once and then tracked in memory. Only accessed
+    from the executor, by the writes and the replay at once, so all access
+    is guarded by a lock.
+    """
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        """Initialize the disk buffer."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._sequence = 0
+        self._lock = threading.Lock()
+        # Sizes of the files of the buffered batches, oldest first
+        self._files: dict[Path, int] | None = None
+        self._size = 0
+
+    def _load(self) -> dict[Path, int]:
+        """Return the files of the buffered batches, listing them once.
+
+        Must be called with the lock held.
+        """
+        if (files := self._files) is None:
+            files = self._files = {}
+            if self.path.is_dir():
+                for file in sorted(self.path.glob("*.lp")):
+                    files[file] = file.stat().st_size
+            self._size = sum(files.values())
+        return files
+
+    def count(self) -> int:
+        """Return the number of buffered batches."""
+        with self._lock:
+            return len(self._load())
+
+    def append(self, body: bytes) -> None:
+        """Add a batch, dropping the oldest ones if the buffer is full."""
+        with self._lock:
+            files = self._load()
+            self.path.mkdir(parents=True, exist_ok=True)
+            dropped = 0
+            while files and self._size + len(body) > self.max_bytes:
+                file = next(iter(files))
+                file.unlink(missing_ok=True)
+                file_size = files.pop(file)
+                self._size -= file_size
+                dropped += file_size
+            self._sequence += 1
+            file = self.path.joinpath(f"{time.time_ns():020d}-{self._sequence:06d}.lp")
+            file.write_bytes(body)
+            files[file] = len(body)
+            self._size += len(body)
+        if dropped:
+            _LOGGER.warning(BUFFER_FULL_MESSAGE, dropped)
+
+    def oldest(self) -> tuple[Path, bytes] | None:
+        """Return the oldest batch and its file."""
+        with self._lock:
+            if not (files := self._load()):
+                return None
+            file = next(iter(files))
+            return file, file.read_bytes()
+
+    def remove(self, file: Path) -> None:
+        """Remove a batch once it was written."""
+        with self._lock:
+            file.unlink(missing_ok=True)
+            if (file_size := self._load().pop(file, None)) is not None:
+                self._size -= file_size
+
+
+class InfluxWriter:
+    """Write events to InfluxDB in batches of line protocol.
+
+    Events are encoded when they are fired and collected into batches, which
+    are written when they are large enough or after the batch timeout. Up to
+    ASYNC_MAX_WRITES_IN_FLIGHT batches are written at once. While InfluxDB
+    cannot be reached, batches are kept in a buffer on disk and written once
+    it can be reached again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        conf: dict[str, Any],
+        event_to_json: Callable[[Event], dict[str, Any] | None],
+    ) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self._event_to_json = event_to_json
+        self._precision: str | None = conf.get(CONF_PRECISION)
+        self._verify_ssl: bool = conf[CONF_VERIFY_SSL]
+        self._ssl_ca_cert: str | None = conf.get(CONF_SSL_CA_CERT)
+        self._ssl_context: ssl.SSLContext | None = None
+        self._v2 = conf[CONF_API_VERSION] == API_VERSION_2
+        self._client_error = CLIENT_ERROR_V2 if self._v2 else CLIENT_ERROR_V1
+        self._headers: dict[str, str] = {}
+        self._auth: aiohttp.BasicAuth | None = None
+        precision = self._precision or "ns"
+        if self._v2:
+            self._url = f"{conf[CONF_URL]}/api/v2/write"
+            self._params = {
+                "org": conf[CONF_ORG],
+                "bucket": conf[CONF_BUCKET],
+                "precision": precision,
+            }
+            self._headers["Authorization"] = f"Token {conf[CONF_TOKEN]}"
+        else:
+            scheme = "https" if conf.get(CONF_SSL) else "http"
+            host = conf.get(CONF_HOST, DEFAULT_HOST_V1)
+            port = conf.get(CONF_PORT, DEFAULT_PORT_V1)
+            path = conf.get(CONF_PATH, "")
+            if path and not path.startswith("/"):
+                path = f"/{path}"
+            self._url = f"{scheme}://{host}:{port}{path}/write"
+            self._params = {
+                "db": conf[CONF_DB_NAME],
+                "precision": _PRECISION_V1[precision],
+            }
+            if CONF_USERNAME in conf:
+                self._auth = aiohttp.BasicAuth(
+                    conf[CONF_USERNAME], conf.get(CONF_PASSWORD, "")
+                )
+        self._buffer = DiskBuffer(Path(hass.config.path(BUFFER_DIR)), BUFFER_MAX_BYTES)
+        self._lines: list[bytes] = []
+        self._size = 0
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._writes = asyncio.Semaphore(ASYNC_MAX_WRITES_IN_FLIGHT)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._buffering = False
+        self._replay_timer: asyncio.TimerHandle | None = None
+        self._replaying = False
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self.write_errors = 0
+
+    async def async_start(self) -> None:
+        """Start writing events."""
+        if self._ssl_ca_cert and self._verify_ssl:
+            self._ssl_context = await self.hass.async_add_executor_job(
+                ssl.create_default_context, ssl.Purpose.SERVER_AUTH, self._ssl_ca_cert
+            )
+        if await self.hass.async_add_executor_job(self._buffer.count):
+            # Batches buffered before the last shutdown
+            self._buffering = True
+            self._async_schedule_replay(0)
+        self._unsub_state_changed = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_event_listener
+        )
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
+
+    @callback
+    def _async_event_listener(self, event: Event) -> None:
+        """Encode an event and add it to the batch."""
+        if (json := self._event_to_json(event)) is None or (
+            line := encode_line(json, self._precision)
+        ) is None:
+            return
+        self._lines.append(line)
+        self._size += len(line) + 1
+        if (
+            self._size >= ASYNC_BATCH_MAX_BYTES
+            or len(self._lines) >= ASYNC_BATCH_MAX_POINTS
+        ):
+            self._async_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = self.hass.loop.call_later(
+                BATCH_TIMEOUT, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the collected batch."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._lines:
+            return
+        count = len(self._lines)
+        body = b"\n".join(self._lines)
+        self._lines = []
+        self._size = 0
+        task = self.hass.async_create_background_task(
+            self._async_write_batch(body, count), "influxdb write", eager_start=True
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_post(self, body: bytes) -> None:
+        """Post a batch to InfluxDB.
+
+        Raises ValueError if InfluxDB rejected the batch and _WriteError if
+        writing it may succeed later.
+        """
+        session = async_get_clientsession(self.hass, self._verify_ssl)
+        kwargs: dict[str, Any] = {}
+        if self._ssl_context is not None:
+            kwargs["ssl"] = self._ssl_context
+        try:
+            async with session.post(
+                self._url,
+                params=self._params,
+                data=body,
+                headers=self._headers,
+                auth=self._auth,
+                timeout=aiohttp.ClientTimeout(total=TIMEOUT),
+                **kwargs,
+            ) as response:
+                status = response.status
+                if status < HTTPStatus.MULTIPLE_CHOICES:
+                    return
+                text = await response.text()
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise _WriteError(CONNECTION_ERROR % err) from err
+        if status == CODE_INVALID_INPUTS:
+            raise ValueError(WRITE_ERROR % (body[:200], text))
+        if status in (
+            HTTPStatus.UNAUTHORIZED,
+            HTTPStatus.FORBIDDEN,
+            HTTPStatus.NOT_FOUND,
+        ):
+            raise _WriteError(self._client_error % text)
+        raise _WriteError(CONNECTION_ERROR % f"{status} {text}")
+
+    async def _async_write_batch(self, body: bytes, count: int) -> None:
+        """Write a batch, buffering it on disk if InfluxDB cannot be reached."""
+        if self._buffering:
+            await self.hass.async_add_executor_job(self._buffer.append, body)
+            self.write_errors += count
+            return
+        async with self._writes:
+            try:
+                await self._async_post(body)
+            except ValueError as err:
+                _LOGGER.error(err)
+                return
+            except _WriteError as err:
+                if not self._buffering:
+                    _LOGGER.error(BUFFERING_MESSAGE, err)
+                    self._buffering = True
+                    self._async_schedule_replay(RETRY_DELAY)
+                self.write_errors += count
+                await self.hass.async_add_executor_job(self._buffer.append, body)
+                return
+        _LOGGER.debug(WROTE_MESSAGE, count)
+
+    @callback
+    def _async_schedule_replay(self, delay: float) -> None:
+        """Schedule writing the buffered batches."""
+        self._replay_timer = self.hass.loop.call_later(delay, self._async_start_replay)
+
+    @callback
+    def _async_start_replay(self) -> None:
+        """Start writing the buffered batches."""
+        self._replay_timer = None
+        self.hass.async_create_background_task(
+            self._async_replay(), "influxdb replay buffer", eager_start=True
+        )
+
+    async def _async_replay(self) -> None:
+        """Write the buffered batches, oldest first."""
+        if self._replaying:
+            return
+        self._replaying = True
+        replayed = 0
+        try:
+            while batch := await self.hass.async_add_executor_job(self._buffer.oldest):
+                file, body = batch
+                try:
+                    await self._async_post(body)
+                except ValueError as err:
+                    _LOGGER.error(err)
+                except _WriteError:
+                    self._async_schedule_replay(RETRY_DELAY)
+                    return
+                await self.hass.async_add_executor_job(self._buffer.remove, file)
+                replayed += 1
+            self._buffering = False
+            # Batches which were being buffered while the last one was written
+            if await self.hass.async_add_executor_job(self._buffer.count):
+                self._async_schedule_replay(0)
+        finally:
+            self._replaying = False
+        _LOGGER.info(BUFFER_REPLAYED_MESSAGE, replayed)
+        self.write_errors = 0
+
+    async def async_block_till_done(self) -> None:
+        """Write the collected batch and wait for the writes in flight."""
+        self._async_flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def _async_shutdown(self, event: Event) -> None:
+        """Write the remaining events and stop listening."""
+        if self._unsub_state_changed is not None:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+        if self._replay_timer is not None:
+            self._replay_timer.cancel()
+            self._replay_timer = None
+        await self.async_block_till_done()
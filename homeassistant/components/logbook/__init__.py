@@ -34,6 +34,12 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.event_type import EventType
 
 from . import rest_api, websocket_api
+from .cache import (
+    HumanifyCache,
+    RecentEventCache,
+    async_clear_caches_on_purge,
+    async_clear_humanify_cache_on_registry_update,
+)
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
     DOMAIN,
@@ -136,7 +142,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    recent_events = RecentEventCache(external_events)
+    humanify_cache = HumanifyCache()
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, recent_events, humanify_cache
+    )
+    recent_events.async_setup(hass)
+    async_clear_caches_on_purge(hass, recent_events, humanify_cache)
+    async_clear_humanify_cache_on_registry_update(hass, humanify_cache)
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
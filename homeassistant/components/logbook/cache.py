@@ -0,0 +1,499 @@
+"""In-memory caches of the logbook."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Callable, Collection, Iterable, Mapping
+from heapq import merge
+import threading
+import time
+from typing import Any, Final
+
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, get_instance
+from homeassistant.components.recorder.services import (
+    SERVICE_PURGE,
+    SERVICE_PURGE_ENTITIES,
+)
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_CALL_SERVICE,
+    EVENT_STATE_CHANGED,
+    MATCH_ALL,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.util.event_type import EventType
+from homeassistant.util.ulid import ulid_to_bytes_or_none
+
+from .const import ALWAYS_CONTINUOUS_DOMAINS, BUILT_IN_EVENTS
+from .helpers import extract_attr
+from .models import EventAsRow, async_event_to_row
+
+# Number of rows kept, the window covered by the cache shrinks
+# when more rows are added in the time it is asked for
+RECENT_EVENTS_MAX_ROWS: Final = 10000
+# Number of humanified events and contexts kept
+HUMANIFY_CACHE_MAX_SIZE: Final = 10000
+
+_EMPTY_DATA: Final[dict[str, Any]] = {}
+ATTR_OLD_ENTITY_ID: Final = "old_entity_id"
+
+
+def _strip_row(row: EventAsRow) -> EventAsRow:
+    """Drop the parts of a row the logbook does not use once it is kept."""
+    if row.event_type is None:
+        # The states are kept in their own columns
+        return row._replace(data=_EMPTY_DATA, context=None)
+    return row._replace(context=None)
+
+
+def _context_created_ts(context_id_bin: bytes) -> float:
+    """Return the time a context was created from the timestamp of its ulid."""
+    return int.from_bytes(context_id_bin[:6], "big") / 1000
+
+
+def _is_logbook_state_change(event: Event) -> bool:
+    """Check if a state change would be selected by the logbook queries."""
+    data = event.data
+    if (old_state := data["old_state"]) is None or (
+        new_state := data["new_state"]
+    ) is None:
+        return False
+    domain = new_state.domain
+    return not (
+        new_state.state == old_state.state
+        or new_state.last_changed != new_state.last_updated
+        or domain in ALWAYS_CONTINUOUS_DOMAINS
+        or (
+            domain == SENSOR_DOMAIN and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+        )
+    )
+
+
+def _row_keys(row: EventAsRow) -> tuple[list[str], str | None]:
+    """Return the entity ids and the device id a row is indexed by.
+
+    Like the logbook queries, events only match the entity and device ids
+    which are set as a single string in their data.
+    """
+    if (entity_id := row.entity_id) is not None:
+        return [entity_id], None
+    data = row.data
+    entity_ids = [
+        entity_id
+        for key in (ATTR_ENTITY_ID, ATTR_OLD_ENTITY_ID)
+        if type(entity_id := data.get(key)) is str
+    ]
+    if type(device_id := data.get(ATTR_DEVICE_ID)) is not str:
+        device_id = None
+    return entity_ids, device_id
+
+
+class RecentEventCache:
+    """Ring of the recent rows the logbook queries select from the database.
+
+    The rows are fed from the event bus and kept in columns of rows and of
+    their timestamps, so a time window is found with a binary search, and
+    are indexed by context id, entity id and device id. Requests for a
+    window the cache covers are answered without querying the database.
+
+    Requests for entities or devices also select the rows sharing a context
+    with the selected rows. Only the first of them is used, to describe the
+    context of the entries, so the first row the recorder records in each
+    context is kept as well. A context created before the oldest kept one
+    may have started before the cache, and such requests are answered from
+    the database.
+
+    The cache is fed in the event loop and read from the recorder executor,
+    so all access is guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        external_events: Collection[EventType[Any] | str],
+        max_rows: int = RECENT_EVENTS_MAX_ROWS,
+    ) -> None:
+        """Initialize the cache."""
+        self._external_events = external_events
+        self._max_rows = max_rows
+        self._lock = threading.Lock()
+        self._rows: list[EventAsRow] = []
+        self._times: list[float] = []
+        # Sequence number of the first row in the columns
+        self._offset = 0
+        # Index of the oldest row which was not evicted yet
+        self._head = 0
+        self._context_index: dict[bytes, deque[int]] = {}
+        self._entity_index: dict[str, deque[int]] = {}
+        self._device_index: dict[str, deque[int]] = {}
+        # First recorded row of each context
+        self._context_origins: OrderedDict[bytes, EventAsRow] = OrderedDict()
+        # All rows newer than this timestamp are in the cache
+        self.covered_since = time.time()
+        # The first rows of all contexts created after this timestamp are kept
+        self._origins_covered_since = self.covered_since
+
+    @callback
+    def async_setup(self, hass: HomeAssistant) -> None:
+        """Start feeding the cache from the event bus."""
+        self.covered_since = self._origins_covered_since = time.time()
+        instance = get_instance(hass)
+        entity_filter = instance.entity_filter
+        exclude_event_types = instance.exclude_event_types
+        external_events = self._external_events
+
+        @callback
+        def _async_event_listener(event: Event) -> None:
+            """Add the events the recorder records."""
+            event_type = event.event_type
+            if event_type in exclude_event_types:
+                return
+            if entity_filter is not None and (
+                entity_id := event.data.get(ATTR_ENTITY_ID)
+            ):
+                if isinstance(entity_id, str):
+                    if not entity_filter(entity_id):
+                        return
+                elif isinstance(entity_id, list) and not any(
+                    entity_filter(eid) for eid in entity_id
+                ):
+                    return
+            if event_type == EVENT_STATE_CHANGED:
+                if _is_logbook_state_change(event):
+                    self.add(async_event_to_row(event))
+                elif event.data["new_state"] is not None:
+                    self.add_context_origin(event)
+            elif event_type in BUILT_IN_EVENTS or event_type in external_events:
+                self.add(async_event_to_row(event))
+            else:
+                self.add_context_origin(event)
+
+        hass.bus.async_listen(MATCH_ALL, _async_event_listener)
+
+    def _index_keys(
+        self, row: EventAsRow
+    ) -> list[tuple[dict[Any, deque[int]], bytes | str]]:
+        """Return the indexes of a row with the key it is indexed by."""
+        entity_ids, device_id = _row_keys(row)
+        index_keys: list[tuple[dict[Any, deque[int]], bytes | str]] = [
+            (self._context_index, row.context_id_bin)
+        ]
+        index_keys.extend((self._entity_index, entity_id) for entity_id in entity_ids)
+        if device_id is not None:
+            index_keys.append((self._device_index, device_id))
+        return index_keys
+
+    def add(self, row: EventAsRow) -> None:
+        """Add a row, evicting the oldest row if the cache is full."""
+        row = _strip_row(row)
+        time_fired_ts = row.time_fired_ts
+        with self._lock:
+            times = self._times
+            if self._head < len(times) and time_fired_ts < times[-1]:
+                # The clock went backwards, only the rows newer than the
+                # newest row are known to be complete from here on
+                self.covered_since = max(self.covered_since, times[-1])
+                self._origins_covered_since = max(
+                    self._origins_covered_since, times[-1]
+                )
+                self._clear()
+            seq = self._offset + len(self._rows)
+            self._rows.append(row)
+            times.append(time_fired_ts)
+            for index, key in self._index_keys(row):
+                if (seqs := index.get(key)) is None:
+                    seqs = index[key] = deque()
+                seqs.append(seq)
+            if len(times) - self._head > self._max_rows:
+                self._evict()
+            self._add_context_origin(row)
+
+    def add_context_origin(self, event: Event) -> None:
+        """Keep an event the logbook does not show if it starts a context."""
+        if (context_id_bin := ulid_to_bytes_or_none(event.context.id)) is None:
+            return
+        with self._lock:
+            if context_id_bin in self._context_origins:
+                return
+        row = _strip_row(async_event_to_row(event))
+        with self._lock:
+            self._add_context_origin(row)
+
+    def _add_context_origin(self, row: EventAsRow) -> None:
+        """Keep a row if it is the first row of its context.
+
+        Must be called with the lock held.
+        """
+        origins = self._context_origins
+        if row.context_id_bin in origins:
+            return
+        origins[row.context_id_bin] = row
+        if len(origins) > self._max_rows:
+            _, evicted = origins.popitem(last=False)
+            self._origins_covered_since = max(
+                self._origins_covered_since, evicted.time_fired_ts
+            )
+
+    def _evict(self) -> None:
+        """Evict the oldest row.
+
+        Must be called with the lock held.
+        """
+        head = self._head
+        seq = self._offset + head
+        row = self._rows[head]
+        self.covered_since = max(self.covered_since, self._times[head])
+        for index, key in self._index_keys(row):
+            seqs = index[key]
+            if seqs[0] == seq:
+                seqs.popleft()
+            if not seqs:
+                del index[key]
+        self._head = head = head + 1
+        if head >= self._max_rows:
+            del self._rows[:head]
+            del self._times[:head]
+            self._offset += head
+            self._head = 0
+
+    def clear(self) -> None:
+        """Drop all rows, the cache covers the rows added from now on."""
+        with self._lock:
+            self.covered_since = self._origins_covered_since = time.time()
+            self._clear()
+
+    def _clear(self) -> None:
+        """Drop all rows.
+
+        Must be called with the lock held.
+        """
+        self._offset += len(self._rows)
+        self._rows.clear()
+        self._times.clear()
+        self._head = 0
+        self._context_index.clear()
+        self._entity_index.clear()
+        self._device_index.clear()
+        self._context_origins.clear()
+
+    def _seqs(
+        self, index: dict[Any, deque[int]], keys: Iterable[Any], start: int, end: int
+    ) -> Iterable[int]:
+        """Return the sequence numbers of the rows in a window with any of the keys."""
+        offset = self._offset
+        for key in keys:
+            if (seqs := index.get(key)) is not None:
+                yield from (seq for seq in seqs if start <= seq - offset < end)
+
+    def get_rows(
+        self,
+        start_time_ts: float,
+        end_time_ts: float,
+        event_types: Collection[EventType[Any] | str],
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+        context_id_bin: bytes | None,
+        entities_filter: Callable[[str], bool] | None,
+    ) -> list[EventAsRow] | None:
+        """Return the rows the logbook query of a request would select.
+
+        Returns None if the cache does not cover the start of the window or
+        the start of the contexts of the rows of the entities or devices.
+        """
+        event_types = set(event_types)
+        with self._lock:
+            if start_time_ts < self.covered_since:
+                return None
+            times = self._times
+            start = bisect_right(times, start_time_ts, self._head)
+            end = bisect_left(times, end_time_ts, start)
+            rows = self._rows
+            offset = self._offset
+            if entity_ids or device_ids:
+                seqs = {
+                    *self._seqs(self._entity_index, entity_ids or (), start, end),
+                    *self._seqs(self._device_index, device_ids or (), start, end),
+                }
+                selected = [
+                    row
+                    for row in (rows[seq - offset] for seq in sorted(seqs))
+                    if (event_type := row.event_type) is None
+                    or event_type in event_types
+                ]
+                origins: list[EventAsRow] = []
+                for context_id in dict.fromkeys(row.context_id_bin for row in selected):
+                    if (
+                        _context_created_ts(context_id) < self._origins_covered_since
+                        or (origin := self._context_origins.get(context_id)) is None
+                    ):
+                        return None
+                    origins.append(origin._replace(context_only=True))
+                # The first row of each context is selected by the context
+                # before the rows it caused, like in the database queries
+                origins.sort(key=_time_fired_ts)
+                return list(merge(origins, selected, key=_time_fired_ts))
+            if context_id_bin is not None:
+                selected = [
+                    rows[seq - offset]
+                    for seq in self._context_index.get(context_id_bin, ())
+                    if start <= seq - offset < end
+                ]
+                entities_filter = None
+            else:
+                selected = rows[start:end]
+        return [
+            row
+            for row in selected
+            if ((event_type := row.event_type) is None or event_type in event_types)
+            and (entities_filter is None or _row_allowed(row, entities_filter))
+        ]
+
+
+def _time_fired_ts(row: EventAsRow) -> float:
+    """Return the time a row was fired to sort rows by."""
+    return row.time_fired_ts
+
+
+def _row_allowed(row: EventAsRow, entities_filter: Callable[[str], bool]) -> bool:
+    """Check if a row is allowed by the logbook filter."""
+    if (entity_id := row.entity_id) is not None:
+        return entities_filter(entity_id)
+    data = row.data
+    entity_ids = extract_attr(data, ATTR_ENTITY_ID)
+    if entity_ids and not any(entities_filter(entity_id) for entity_id in entity_ids):
+        return False
+    return not (domain := data.get(ATTR_DOMAIN)) or entities_filter(f"{domain}._")
+
+
+class HumanifyCache:
+    """Humanified events of database rows, shared by the logbook requests.
+
+    Describing an event decodes its data and calls the integration which
+    describes it, so the results are kept for the requests of overlapping
+    windows. The entity names are not kept since they may change, they are
+    added for each request.
+
+    Only rows from the database are kept, by row id and time fired, since
+    row ids are reused after a purge or when the database is recreated.
+    Describers may use the device and entity registries, so the results are
+    dropped when the registries are updated. Used from the recorder executor
+    and the event loop, so all access is guarded by a lock.
+    """
+
+    def __init__(self, max_size: int = HUMANIFY_CACHE_MAX_SIZE) -> None:
+        """Initialize the cache."""
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[int, float], dict[str, Any]] = OrderedDict()
+        self._contexts: OrderedDict[tuple[int, float], dict[str, Any]] = OrderedDict()
+
+    def _get(
+        self,
+        cache: OrderedDict[tuple[int, float], dict[str, Any]],
+        key: tuple[int, float],
+    ) -> dict[str, Any] | None:
+        """Return a cached result."""
+        with self._lock:
+            if (result := cache.get(key)) is not None:
+                cache.move_to_end(key)
+            return result
+
+    def _set(
+        self,
+        cache: OrderedDict[tuple[int, float], dict[str, Any]],
+        key: tuple[int, float],
+        data: dict[str, Any],
+    ) -> None:
+        """Cache a result, evicting the least recently used one if full."""
+        with self._lock:
+            cache[key] = data
+            if len(cache) > self._max_size:
+                cache.popitem(last=False)
+
+    def get_entry(self, key: tuple[int, float]) -> dict[str, Any] | None:
+        """Return the entry of an event, empty if it is not shown."""
+        return self._get(self._entries, key)
+
+    def set_entry(self, key: tuple[int, float], data: dict[str, Any]) -> None:
+        """Cache the entry of an event, empty if it is not shown."""
+        self._set(self._entries, key, data)
+
+    def get_context(self, key: tuple[int, float]) -> dict[str, Any] | None:
+        """Return the context data an event adds to the entries it caused."""
+        return self._get(self._contexts, key)
+
+    def set_context(self, key: tuple[int, float], data: dict[str, Any]) -> None:
+        """Cache the context data an event adds to the entries it caused."""
+        self._set(self._contexts, key, data)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._contexts.clear()
+
+
+@callback
+def _async_is_purge(event_data: Mapping[str, Any]) -> bool:
+    """Check if a service call purges the recorder database."""
+    return event_data[ATTR_DOMAIN] == RECORDER_DOMAIN and event_data[ATTR_SERVICE] in (
+        SERVICE_PURGE,
+        SERVICE_PURGE_ENTITIES,
+    )
+
+
+@callback
+def async_clear_caches_on_purge(
+    hass: HomeAssistant,
+    recent_events: RecentEventCache,
+    humanify_cache: HumanifyCache,
+) -> None:
+    """Clear the caches when the recorder database is purged.
+
+    Row ids may be reused once the newest rows are purged, and the purged
+    rows must not be returned from the recent events.
+    """
+
+    @callback
+    def _async_clear_caches() -> None:
+        recent_events.clear()
+        humanify_cache.clear()
+
+    async def _async_clear_caches_after_purge() -> None:
+        await get_instance(hass).async_block_till_done()
+        _async_clear_caches()
+
+    @callback
+    def _async_purge_called(event: Event) -> None:
+        _async_clear_caches()
+        hass.async_create_background_task(
+            _async_clear_caches_after_purge(), "logbook clear caches after purge"
+        )
+
+    hass.bus.async_listen(
+        EVENT_CALL_SERVICE, _async_purge_called, event_filter=_async_is_purge
+    )
+
+
+@callback
+def async_clear_humanify_cache_on_registry_update(
+    hass: HomeAssistant, humanify_cache: HumanifyCache
+) -> None:
+    """Clear the humanified events when the device or entity registry is updated.
+
+    Describers may look up names and other details in the registries.
+    """
+
+    @callback
+    def _async_registry_updated(event: Event) -> None:
+        humanify_cache.clear()
+
+    hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, _async_registry_updated)
+    hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated)
@@ -22,6 +22,9 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+if TYPE_CHECKING:
+    from .cache import HumanifyCache, RecentEventCache
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +36,8 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    recent_events: RecentEventCache | None = None
+    humanify_cache: HumanifyCache | None = None
 
 
 class LazyEventPartialState:
@@ -134,7 +139,7 @@ class EventAsRow(NamedTuple):
 
     # Additional fields for EventAsRow
     data: Mapping[str, Any]
-    context: Context
+    context: Context | None
 
 
 @callback
@@ -19,6 +19,7 @@ from homeassistant.components.recorder.models import (
     extract_event_type_ids,
     extract_metadata_ids,
     process_timestamp_to_utc_isoformat,
+    ulid_to_bytes_or_none,
 )
 from homeassistant.components.recorder.util import (
     execute_stmt_lambda_element,
@@ -39,6 +40,7 @@ from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
+from .cache import HumanifyCache
 from .const import (
     ATTR_MESSAGE,
     CONTEXT_DOMAIN,
@@ -99,6 +101,7 @@ class LogbookRun:
     include_entity_name: bool
     timestamp: bool
     memoize_new_contexts: bool = True
+    humanify_cache: HumanifyCache | None = None
 
 
 class EventProcessor:
@@ -126,6 +129,8 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.entities_filter = logbook_config.entity_filter
+        self.recent_events = logbook_config.recent_events
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
@@ -133,6 +138,7 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
+            humanify_cache=logbook_config.humanify_cache,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
@@ -156,6 +162,8 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        if (rows := self._get_recent_rows(start_day, end_day)) is not None:
+            return self.humanify(rows)
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -184,8 +192,25 @@ class EventProcessor:
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def _get_recent_rows(self, start_day: dt, end_day: dt) -> list[EventAsRow] | None:
+        """Get the rows for a period of time from the recent events.
+
+        Returns None if the period is not covered by the recent events.
+        """
+        if self.recent_events is None:
+            return None
+        return self.recent_events.get_rows(
+            start_day.timestamp(),
+            end_day.timestamp(),
+            self.event_types,
+            self.entity_ids,
+            self.device_ids,
+            ulid_to_bytes_or_none(self.context_id),
+            self.entities_filter,
+        )
+
     def humanify(
-        self, rows: Generator[EventAsRow] | Sequence[Row] | Result
+        self, rows: Generator[EventAsRow] | Sequence[Row | EventAsRow] | Result
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -201,7 +226,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Sequence[Row | EventAsRow] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -216,6 +241,7 @@ def _humanify(
     include_entity_name = logbook_run.include_entity_name
     timestamp = logbook_run.timestamp
     memoize_new_contexts = logbook_run.memoize_new_contexts
+    humanify_cache = logbook_run.humanify_cache
     get_context = context_augmenter.get_context
     context_id_bin: bytes
     data: dict[str, Any]
@@ -253,31 +279,14 @@ def _humanify(
             if icon := row[ICON_POS]:
                 data[LOGBOOK_ENTRY_ICON] = icon
 
-        elif event_type in external_events:
-            domain, describe_event = external_events[event_type]
-            try:
-                data = describe_event(event_cache_get(row))
-            except Exception:
-                _LOGGER.exception(
-                    "Error with %s describe event for %s", domain, event_type
+        elif event_type in external_events or event_type == EVENT_LOGBOOK_ENTRY:
+            if (
+                described := _describe_row(
+                    row, event_type, external_events, event_cache_get, humanify_cache
                 )
+            ) is None:
                 continue
-            data[LOGBOOK_ENTRY_DOMAIN] = domain
-
-        elif event_type == EVENT_LOGBOOK_ENTRY:
-            event = event_cache_get(row)
-            if not (event_data := event.data):
-                continue
-            entry_domain = event_data.get(ATTR_DOMAIN)
-            entry_entity_id = event_data.get(ATTR_ENTITY_ID)
-            if entry_domain is None and entry_entity_id is not None:
-                entry_domain = split_entity_id(str(entry_entity_id))[0]
-            data = {
-                LOGBOOK_ENTRY_NAME: event_data.get(ATTR_NAME),
-                LOGBOOK_ENTRY_MESSAGE: event_data.get(ATTR_MESSAGE),
-                LOGBOOK_ENTRY_DOMAIN: entry_domain,
-                LOGBOOK_ENTRY_ENTITY_ID: entry_entity_id,
-            }
+            data = described
 
         else:
             continue
@@ -320,6 +329,7 @@ class ContextAugmenter:
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
         self.include_entity_name = logbook_run.include_entity_name
+        self.humanify_cache = logbook_run.humanify_cache
 
     def get_context(
         self, context_id_bin: bytes | None, row: Row | EventAsRow | None
@@ -339,7 +349,6 @@ class ContextAugmenter:
 
     def augment(self, data: dict[str, Any], context_row: Row | EventAsRow) -> None:
         """Augment data from the row and cache."""
-        event_type = context_row[EVENT_TYPE_POS]
         # State change
         if context_entity_id := context_row[ENTITY_ID_POS]:
             data[CONTEXT_STATE] = context_row[STATE_POS]
@@ -350,27 +359,46 @@ class ContextAugmenter:
                 )
             return
 
+        humanify_cache = self.humanify_cache
+        if humanify_cache is None or type(context_row) is EventAsRow:
+            context_data = self._describe_context(context_row)
+        elif (
+            context_data := humanify_cache.get_context(
+                key := (context_row[ROW_ID_POS], context_row[TIME_FIRED_TS_POS])
+            )
+        ) is None:
+            context_data = self._describe_context(context_row)
+            humanify_cache.set_context(key, context_data)
+        data.update(context_data)
+        if self.include_entity_name and (
+            attr_entity_id := context_data.get(CONTEXT_ENTITY_ID)
+        ):
+            data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+
+    def _describe_context(self, context_row: Row | EventAsRow) -> dict[str, Any]:
+        """Describe the context an event adds to the entries it caused."""
+        event_type = context_row[EVENT_TYPE_POS]
         # Call service
         if event_type == EVENT_CALL_SERVICE:
             event = self.event_cache.get(context_row)
             event_data = event.data
-            data[CONTEXT_DOMAIN] = event_data.get(ATTR_DOMAIN)
-            data[CONTEXT_SERVICE] = event_data.get(ATTR_SERVICE)
-            data[CONTEXT_EVENT_TYPE] = event_type
-            return
+            return {
+                CONTEXT_DOMAIN: event_data.get(ATTR_DOMAIN),
+                CONTEXT_SERVICE: event_data.get(ATTR_SERVICE),
+                CONTEXT_EVENT_TYPE: event_type,
+            }
 
         if event_type not in self.external_events:
-            return
+            return {}
 
         domain, describe_event = self.external_events[event_type]
-        data[CONTEXT_EVENT_TYPE] = event_type
-        data[CONTEXT_DOMAIN] = domain
+        data: dict[str, Any] = {CONTEXT_EVENT_TYPE: event_type, CONTEXT_DOMAIN: domain}
         event = self.event_cache.get(context_row)
         try:
             described = describe_event(event)
         except Exception:
             _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
-            return
+            return data
         if name := described.get(LOGBOOK_ENTRY_NAME):
             data[CONTEXT_NAME] = name
         if message := described.get(LOGBOOK_ENTRY_MESSAGE):
@@ -378,11 +406,70 @@ class ContextAugmenter:
         # In 2022.12 and later drop `CONTEXT_MESSAGE` if `CONTEXT_SOURCE` is available
         if source := described.get(LOGBOOK_ENTRY_SOURCE):
             data[CONTEXT_SOURCE] = source
-        if not (attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID)):
-            return
-        data[CONTEXT_ENTITY_ID] = attr_entity_id
-        if self.include_entity_name:
-            data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+        if attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID):
+            data[CONTEXT_ENTITY_ID] = attr_entity_id
+        return data
+
+
+def _describe_row(
+    row: Row | EventAsRow,
+    event_type: EventType[Any] | str,
+    external_events: dict[
+        EventType[Any] | str,
+        tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
+    ],
+    event_cache_get: Callable[[Row | EventAsRow], LazyEventPartialState],
+    humanify_cache: HumanifyCache | None,
+) -> dict[str, Any] | None:
+    """Describe an event row, using the shared cache for database rows.
+
+    Returns None if the event is not shown.
+    """
+    if humanify_cache is None or type(row) is EventAsRow:
+        return _describe_event(row, event_type, external_events, event_cache_get)
+    key = (row[ROW_ID_POS], row[TIME_FIRED_TS_POS])
+    if (described := humanify_cache.get_entry(key)) is None:
+        described = (
+            _describe_event(row, event_type, external_events, event_cache_get) or {}
+        )
+        humanify_cache.set_entry(key, described)
+    # The cached entry is completed for each request
+    return described.copy() if described else None
+
+
+def _describe_event(
+    row: Row | EventAsRow,
+    event_type: EventType[Any] | str,
+    external_events: dict[
+        EventType[Any] | str,
+        tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
+    ],
+    event_cache_get: Callable[[Row | EventAsRow], LazyEventPartialState],
+) -> dict[str, Any] | None:
+    """Describe an event row, returns None if the event is not shown."""
+    if event_type in external_events:
+        domain, describe_event = external_events[event_type]
+        try:
+            data = describe_event(event_cache_get(row))
+        except Exception:
+            _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
+            return None
+        data[LOGBOOK_ENTRY_DOMAIN] = domain
+        return data
+
+    event = event_cache_get(row)
+    if not (event_data := event.data):
+        return None
+    entry_domain = event_data.get(ATTR_DOMAIN)
+    entry_entity_id = event_data.get(ATTR_ENTITY_ID)
+    if entry_domain is None and entry_entity_id is not None:
+        entry_domain = split_entity_id(str(entry_entity_id))[0]
+    return {
+        LOGBOOK_ENTRY_NAME: event_data.get(ATTR_NAME),
+        LOGBOOK_ENTRY_MESSAGE: event_data.get(ATTR_MESSAGE),
+        LOGBOOK_ENTRY_DOMAIN: entry_domain,
+        LOGBOOK_ENTRY_ENTITY_ID: entry_entity_id,
+    }
 
 
 def _rows_ids_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -117,6 +118,8 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -267,12 +270,116 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicLevel:
+    """A level of the wildcard subscription topic trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the topic level."""
+        self.children: dict[str, _TopicLevel] = {}
+        # The value is the order the subscription was added in
+        self.subscriptions: dict[Subscription, int] = {}
+
+
+class WildcardSubscriptionTrie:
+    """Index wildcard subscriptions by the levels of their topic filter.
+
+    Looking up the subscriptions matching a topic costs O(topic depth)
+    instead of testing the topic against every wildcard subscription.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicLevel()
+        self._added = 0
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            children = node.children
+            if (child := children.get(level)) is None:
+                child = children[level] = _TopicLevel()
+            node = child
+        self._added += 1
+        node.subscriptions[subscription] = self._added
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        path: list[tuple[_TopicLevel, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune levels that no longer lead to a subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in the order they were added.
+
+        Wildcards do not match topics starting with `$` on the first level,
+        see section 4.7.2 of the MQTT 3.1.1 specification.
+        """
+        matches: dict[Subscription, int] = {}
+        nodes = [self._root]
+        wildcards = not topic.startswith("$")
+        for level in topic.split("/"):
+            next_nodes: list[_TopicLevel] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                if (child := children.get("+")) is not None:
+                    next_nodes.append(child)
+                if (child := children.get("#")) is not None:
+                    matches.update(child.subscriptions)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards = True
+        else:
+            for node in nodes:
+                matches.update(node.subscriptions)
+                # The multi-level wildcard also matches the parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.update(child.subscriptions)
+        if len(matches) < 2:
+            return list(matches)
+        return sorted(matches, key=matches.__getitem__)
+
+
+def _topic_matches_filter(topic_filter: str, topic: str) -> bool:
+    """Return if a topic matches a topic filter with wildcards."""
+    if topic.startswith("$") and topic_filter.startswith(("+", "#")):
+        return False
+    topic_levels = topic.split("/")
+    filter_levels = topic_filter.split("/")
+    for idx, filter_level in enumerate(filter_levels):
+        if filter_level == "#":
+            return True
+        if idx == len(topic_levels):
+            return False
+        if filter_level not in ("+", topic_levels[idx]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -379,6 +486,10 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscriptions_trie = WildcardSubscriptionTrie()
+        self._matching_subscriptions_cache: LRU[str, list[Subscription]] = LRU(
+            MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+        )
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -746,28 +857,39 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions_trie.add(subscription)
+        self._async_evict_matching_subscriptions(subscription)
+
+    @callback
+    def _async_evict_matching_subscriptions(self, subscription: Subscription) -> None:
+        """Evict the cached matches for the topics a subscription matches."""
+        cache = self._matching_subscriptions_cache
+        topic_filter = subscription.topic
+        if subscription.is_simple_match:
+            cache.pop(topic_filter, None)
+            return
+        # LRU.keys() returns a copy so the cache can be mutated in the loop
+        cached_topics: list[str] = cache.keys()
+        for topic in cached_topics:
+            if _topic_matches_filter(topic_filter, topic):
+                del cache[topic]
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -778,12 +900,14 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="mqtt_not_setup_cannot_unsubscribe_twice",
                 translation_placeholders={"topic": topic},
             ) from exc
+        self._async_evict_matching_subscriptions(subscription)
 
     @callback
     def _async_queue_subscriptions(
@@ -848,11 +972,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -864,7 +986,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1057,18 +1178,14 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        """Return the subscriptions matching a topic."""
+        if (subscriptions := self._matching_subscriptions_cache.get(topic)) is None:
+            subscriptions = []
+            if topic in self._simple_subscriptions:
+                subscriptions.extend(self._simple_subscriptions[topic])
+            subscriptions.extend(self._wildcard_subscriptions_trie.match(topic))
+            self._matching_subscriptions_cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -1264,13 +1381,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -1,12 +1,14 @@
 """The profiler integration."""
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Generator
 import contextlib
 from contextlib import suppress
 from datetime import timedelta
 from functools import _lru_cache_wrapper
 import logging
+from operator import itemgetter
 import reprlib
 import sys
 import threading
@@ -23,8 +25,11 @@ from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_polling_platforms
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.loader import async_get_import_timings
 
 from .const import DOMAIN
 
@@ -40,6 +45,9 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_EVENT_BUS_PROFILE = "event_bus_profile"
+SERVICE_LOG_IMPORT_TIMES = "log_import_times"
+SERVICE_LOG_POLL_STATISTICS = "log_poll_statistics"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,12 +71,17 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_EVENT_BUS_PROFILE,
+    SERVICE_LOG_IMPORT_TIMES,
+    SERVICE_LOG_POLL_STATISTICS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+MAX_LOGGED_IMPORTS = 50
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
@@ -94,6 +107,12 @@ async def async_setup_entry(  # noqa: C901
         async with lock:
             await _async_generate_memory_profile(hass, call)
 
+    async def _async_run_event_bus_profile(call: ServiceCall) -> None:
+        if hass.bus.listener_profiling:
+            raise HomeAssistantError("Event bus profiling already started")
+        async with lock:
+            await _async_generate_event_bus_profile(hass, call)
+
     async def _async_start_log_objects(call: ServiceCall) -> None:
         if LOG_INTERVAL_SUB in domain_data:
             raise HomeAssistantError("Object logging already started")
@@ -260,6 +279,53 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_log_import_times(call: ServiceCall) -> None:
+        """Log the time spent importing the modules of the integrations."""
+        timings = async_get_import_timings(hass)
+        integration_seconds: defaultdict[str, float] = defaultdict(float)
+        integration_modules: defaultdict[str, int] = defaultdict(int)
+        for timing in timings:
+            integration_seconds[timing.domain] += timing.seconds
+            integration_modules[timing.domain] += timing.modules_loaded
+        for domain, seconds in sorted(
+            integration_seconds.items(), key=itemgetter(1), reverse=True
+        ):
+            _LOGGER.critical(
+                "Integration %s imports took %.3fs and loaded %s modules",
+                domain,
+                seconds,
+                integration_modules[domain],
+            )
+        for timing in timings[:MAX_LOGGED_IMPORTS]:
+            _LOGGER.critical(
+                "Import of %s took %.3fs and loaded %s modules%s",
+                timing.module,
+                timing.seconds,
+                timing.modules_loaded,
+                " in the event loop" if timing.event_loop else "",
+            )
+
+    async def _async_log_poll_statistics(call: ServiceCall) -> None:
+        """Log the poll statistics of the entity platforms."""
+        for platform in async_get_polling_platforms(hass):
+            statistics = platform.poll_statistics
+            _LOGGER.critical(
+                (
+                    "Polls of %s %s: %s polls every %ss, average %.3fs, last %.3fs,"
+                    " max %.3fs, last latency %.3fs, max latency %.3fs, %s overruns"
+                ),
+                platform.platform_name,
+                platform.domain,
+                statistics.polls,
+                platform.scan_interval_seconds,
+                statistics.average_duration,
+                statistics.last_duration,
+                statistics.max_duration,
+                statistics.last_latency,
+                statistics.max_latency,
+                statistics.overruns,
+            )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -293,6 +359,16 @@ async def async_setup_entry(  # noqa: C901
         ),
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EVENT_BUS_PROFILE,
+        _async_run_event_bus_profile,
+        schema=vol.Schema(
+            {vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float)}
+        ),
+    )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +458,20 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_IMPORT_TIMES,
+        _async_log_import_times,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_POLL_STATISTICS,
+        _async_log_poll_statistics,
+    )
+
     return True
 
 
@@ -463,6 +553,37 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_generate_event_bus_profile(hass: HomeAssistant, call: ServiceCall):
+    start_time = int(time.time() * 1000000)
+    persistent_notification.async_create(
+        hass,
+        (
+            "The event bus profile has started. This notification will be updated"
+            " when it is complete."
+        ),
+        title="Profile Started",
+        notification_id=f"event_bus_profiler_{start_time}",
+    )
+    # Profiling started elsewhere keeps running with its wall times
+    if not (profiling := hass.bus.listener_profiling):
+        hass.bus.async_set_listener_profiling(True)
+    try:
+        await asyncio.sleep(float(call.data[CONF_SECONDS]))
+        listeners = hass.bus.async_listener_profile()
+    finally:
+        if not profiling:
+            hass.bus.async_set_listener_profiling(False)
+
+    profile_path = hass.config.path(f"event_bus_profile.{start_time}.json")
+    await hass.async_add_executor_job(save_json, profile_path, listeners)
+    persistent_notification.async_create(
+        hass,
+        f"Wrote event bus profile to {profile_path}",
+        title="Profile Complete",
+        notification_id=f"event_bus_profiler_{start_time}",
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -7,11 +7,11 @@ from collections.abc import Callable
 from dataclasses import astuple, dataclass
 import logging
 import string
-from typing import Any, cast
+from typing import Any
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
-from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.exposition import choose_encoder, gzip_accepted
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -74,6 +74,15 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import (
+    OPENMETRICS_EOF,
+    MetricExposition,
+    MetricFamily,
+    MetricSample,
+    MetricType,
+    gzip_join,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -123,7 +132,10 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
+    exposition = MetricExposition()
+    hass.http.register_view(
+        PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH], exposition)
+    )
 
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
@@ -138,6 +150,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
+        exposition,
         entity_filter,
         namespace,
         climate_units,
@@ -180,6 +193,7 @@ class PrometheusMetrics:
 
     def __init__(
         self,
+        exposition: MetricExposition,
         entity_filter: entityfilter.EntityFilter,
         namespace: str,
         climate_units: UnitOfTemperature,
@@ -188,6 +202,7 @@ class PrometheusMetrics:
         default_metric: str | None,
     ) -> None:
         """Initialize Prometheus Metrics."""
+        self._exposition = exposition
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -207,7 +222,7 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics: dict[str, MetricWrapperBase] = {}
+        self._metrics: dict[str, MetricFamily] = {}
         self._metrics_by_entity_id: dict[str, set[MetricNameWithLabelValues]] = (
             defaultdict(set)
         )
@@ -240,21 +255,21 @@ class PrometheusMetrics:
 
         self._metric(
             "state_change",
-            prometheus_client.Counter,
+            MetricType.COUNTER,
             "The number of state changes",
             labels,
         ).inc()
 
         self._metric(
             "entity_available",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "Entity is available (not in the unavailable or unknown state)",
             labels,
         ).set(float(state.state not in IGNORED_STATES))
 
         self._metric(
             "last_updated_time_seconds",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "The last_updated timestamp",
             labels,
         ).set(state.last_updated.timestamp())
@@ -317,7 +332,7 @@ class PrometheusMetrics:
                 entity_id,
             )
             removed_metrics.add(metric)
-            self._metrics[metric_name].remove(*label_values)
+            self._metrics[metric_name].remove(label_values)
         metric_set -= removed_metrics
         if not metric_set:
             del self._metrics_by_entity_id[entity_id]
@@ -331,35 +346,32 @@ class PrometheusMetrics:
 
             self._metric(
                 f"{state.domain}_attr_{key.lower()}",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 f"{key} attribute of {state.domain} entity",
                 self._labels(state),
             ).set(value)
 
-    def _metric[_MetricBaseT: MetricWrapperBase](
+    def _metric(
         self,
         metric_name: str,
-        factory: type[_MetricBaseT],
+        metric_type: MetricType,
         documentation: str,
         labels: dict[str, str],
-    ) -> _MetricBaseT:
+    ) -> MetricSample:
         try:
-            metric = cast(_MetricBaseT, self._metrics[metric_name])
+            metric = self._metrics[metric_name]
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric_name}"
             )
-            self._metrics[metric_name] = factory(
-                full_metric_name,
-                documentation,
-                labels.keys(),
-                registry=prometheus_client.REGISTRY,
+            metric = self._metrics[metric_name] = self._exposition.add_family(
+                full_metric_name, metric_type, documentation, tuple(labels)
             )
-            metric = cast(_MetricBaseT, self._metrics[metric_name])
+        label_values = tuple(str(value) for value in labels.values())
         self._metrics_by_entity_id[labels["entity"]].add(
-            MetricNameWithLabelValues(metric_name, tuple(labels.values()))
+            MetricNameWithLabelValues(metric_name, label_values)
         )
-        return metric.labels(**labels)
+        return metric.labels(label_values)
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -410,7 +422,7 @@ class PrometheusMetrics:
 
         self._metric(
             "battery_level_percent",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "Battery level as a percentage of its capacity",
             self._labels(state),
         ).set(value)
@@ -421,7 +433,7 @@ class PrometheusMetrics:
 
         self._metric(
             "binary_sensor_state",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "State of the binary sensor (0/1)",
             self._labels(state),
         ).set(value)
@@ -432,7 +444,7 @@ class PrometheusMetrics:
 
         self._metric(
             "input_boolean_state",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "State of the input boolean (0/1)",
             self._labels(state),
         ).set(value)
@@ -444,14 +456,14 @@ class PrometheusMetrics:
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
             metric = self._metric(
                 f"{domain}_state_{unit}",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 f"State of the {title} measured in {unit}",
                 self._labels(state),
             )
         else:
             metric = self._metric(
                 f"{domain}_state",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 f"State of the {title}",
                 self._labels(state),
             )
@@ -478,7 +490,7 @@ class PrometheusMetrics:
 
         self._metric(
             "device_tracker_state",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "State of the device tracker (0/1)",
             self._labels(state),
         ).set(value)
@@ -489,7 +501,7 @@ class PrometheusMetrics:
 
         self._metric(
             "person_state",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "State of the person (0/1)",
             self._labels(state),
         ).set(value)
@@ -499,7 +511,7 @@ class PrometheusMetrics:
         for cover_state in cover_states:
             metric = self._metric(
                 "cover_state",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "State of the cover (0/1)",
                 self._labels(state, {"state": cover_state}),
             )
@@ -509,7 +521,7 @@ class PrometheusMetrics:
         if position is not None:
             self._metric(
                 "cover_position",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "Position of the cover (0-100)",
                 self._labels(state),
             ).set(float(position))
@@ -518,7 +530,7 @@ class PrometheusMetrics:
         if tilt_position is not None:
             self._metric(
                 "cover_tilt_position",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "Tilt Position of the cover (0-100)",
                 self._labels(state),
             ).set(float(tilt_position))
@@ -534,7 +546,7 @@ class PrometheusMetrics:
 
         self._metric(
             "light_brightness_percent",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "Light brightness percentage (0..100)",
             self._labels(state),
         ).set(value)
@@ -545,7 +557,7 @@ class PrometheusMetrics:
 
         self._metric(
             "lock_state",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "State of the lock (0/1)",
             self._labels(state),
         ).set(value)
@@ -562,7 +574,7 @@ class PrometheusMetrics:
             )
         self._metric(
             metric_name,
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             metric_description,
             self._labels(state),
         ).set(temp)
@@ -597,7 +609,7 @@ class PrometheusMetrics:
             for action in HVACAction:
                 self._metric(
                     "climate_action",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "HVAC action",
                     self._labels(state, {"action": action.value}),
                 ).set(float(action == current_action))
@@ -608,7 +620,7 @@ class PrometheusMetrics:
             for mode in available_modes:
                 self._metric(
                     "climate_mode",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "HVAC mode",
                     self._labels(state, {"mode": mode}),
                 ).set(float(mode == current_mode))
@@ -619,7 +631,7 @@ class PrometheusMetrics:
             for mode in available_preset_modes:
                 self._metric(
                     "climate_preset_mode",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "Preset mode enum",
                     self._labels(state, {"mode": mode}),
                 ).set(float(mode == preset_mode))
@@ -630,7 +642,7 @@ class PrometheusMetrics:
             for mode in available_fan_modes:
                 self._metric(
                     "climate_fan_mode",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "Fan mode enum",
                     self._labels(state, {"mode": mode}),
                 ).set(float(mode == fan_mode))
@@ -640,7 +652,7 @@ class PrometheusMetrics:
         if humidifier_target_humidity_percent:
             self._metric(
                 "humidifier_target_humidity_percent",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "Target Relative Humidity",
                 self._labels(state),
             ).set(humidifier_target_humidity_percent)
@@ -648,7 +660,7 @@ class PrometheusMetrics:
         if (value := self.state_as_number(state)) is not None:
             self._metric(
                 "humidifier_state",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "State of the humidifier (0/1)",
                 self._labels(state),
             ).set(value)
@@ -659,7 +671,7 @@ class PrometheusMetrics:
             for mode in available_modes:
                 self._metric(
                     "humidifier_mode",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "Humidifier Mode",
                     self._labels(state, {"mode": mode}),
                 ).set(float(mode == current_mode))
@@ -686,7 +698,7 @@ class PrometheusMetrics:
                 )
             self._metric(
                 metric,
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 documentation,
                 self._labels(state),
             ).set(value)
@@ -751,7 +763,7 @@ class PrometheusMetrics:
         if (value := self.state_as_number(state)) is not None:
             self._metric(
                 "switch_state",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "State of the switch (0/1)",
                 self._labels(state),
             ).set(value)
@@ -762,7 +774,7 @@ class PrometheusMetrics:
         if (value := self.state_as_number(state)) is not None:
             self._metric(
                 "fan_state",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "State of the fan (0/1)",
                 self._labels(state),
             ).set(value)
@@ -771,7 +783,7 @@ class PrometheusMetrics:
         if fan_speed_percent is not None:
             self._metric(
                 "fan_speed_percent",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "Fan speed percent (0-100)",
                 self._labels(state),
             ).set(float(fan_speed_percent))
@@ -780,7 +792,7 @@ class PrometheusMetrics:
         if fan_is_oscillating is not None:
             self._metric(
                 "fan_is_oscillating",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "Whether the fan is oscillating (0/1)",
                 self._labels(state),
             ).set(float(fan_is_oscillating))
@@ -791,7 +803,7 @@ class PrometheusMetrics:
             for mode in available_modes:
                 self._metric(
                     "fan_preset_mode",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "Fan preset mode enum",
                     self._labels(state, {"mode": mode}),
                 ).set(float(mode == fan_preset_mode))
@@ -800,7 +812,7 @@ class PrometheusMetrics:
         if fan_direction in {DIRECTION_FORWARD, DIRECTION_REVERSE}:
             self._metric(
                 "fan_direction_reversed",
-                prometheus_client.Gauge,
+                MetricType.GAUGE,
                 "Fan direction reversed (bool)",
                 self._labels(state),
             ).set(float(fan_direction == DIRECTION_REVERSE))
@@ -811,7 +823,7 @@ class PrometheusMetrics:
     def _handle_automation(self, state: State) -> None:
         self._metric(
             "automation_triggered_count",
-            prometheus_client.Counter,
+            MetricType.COUNTER,
             "Count of times an automation has been triggered",
             self._labels(state),
         ).inc()
@@ -822,7 +834,7 @@ class PrometheusMetrics:
 
         self._metric(
             "counter_value",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "Value of counter entities",
             self._labels(state),
         ).set(value)
@@ -833,7 +845,7 @@ class PrometheusMetrics:
 
         self._metric(
             "update_state",
-            prometheus_client.Gauge,
+            MetricType.GAUGE,
             "Update state, indicating if an update is available (0/1)",
             self._labels(state),
         ).set(value)
@@ -845,7 +857,7 @@ class PrometheusMetrics:
             for alarm_state in AlarmControlPanelState:
                 self._metric(
                     "alarm_control_panel_state",
-                    prometheus_client.Gauge,
+                    MetricType.GAUGE,
                     "State of the alarm control panel (0/1)",
                     self._labels(state, {"state": alarm_state.value}),
                 ).set(float(alarm_state.value == current_state))
@@ -857,19 +869,49 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: MetricExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
-        """Handle request for Prometheus metrics."""
+        """Handle request for Prometheus metrics.
+
+        Only the metrics of the registry of prometheus_client, like the process
+        and Python metrics, are generated on each request. The metrics of Home
+        Assistant are rendered when they change.
+        """
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
+        encoder, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT))
+        openmetrics = content_type != prometheus_client.CONTENT_TYPE_LATEST
+        compress = gzip_accepted(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
         body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
-        return web.Response(
-            body=body,
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+            self._generate, encoder, openmetrics, compress
         )
+        headers = {
+            hdrs.CONTENT_TYPE: content_type if openmetrics else CONTENT_TYPE_TEXT_PLAIN
+        }
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return web.Response(body=body, headers=headers)
+
+    def _generate(
+        self,
+        encoder: Callable[[prometheus_client.CollectorRegistry], bytes],
+        openmetrics: bool,
+        compress: bool,
+    ) -> bytes:
+        """Generate the body of a response."""
+        registry_body = encoder(prometheus_client.REGISTRY)
+        tail = b""
+        if openmetrics:
+            registry_body = registry_body.removesuffix(OPENMETRICS_EOF)
+            tail = OPENMETRICS_EOF
+        if compress:
+            rendered, deflated = self._exposition.render_deflated(openmetrics)
+            return gzip_join(
+                [(registry_body, None), (rendered, deflated), (tail, None)]
+            )
+        return b"".join([registry_body, self._exposition.render(openmetrics), tail])
@@ -0,0 +1,273 @@
+"""Pre-rendered exposition of the Home Assistant metrics.
+
+The metrics are kept rendered in the exposition formats, so a scrape only has
+to join the rendered lines of the metrics which changed since the last scrape
+instead of rendering every sample of every metric.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import threading
+import time
+import zlib
+
+from prometheus_client.utils import floatToGoString
+
+# Header of a gzip stream without file name or modification time
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+OPENMETRICS_EOF = b"# EOF\n"
+
+
+class MetricType(StrEnum):
+    """Type of a metric."""
+
+    COUNTER = "counter"
+    GAUGE = "gauge"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_documentation(documentation: str, openmetrics: bool) -> str:
+    """Escape the documentation of a metric."""
+    documentation = documentation.replace("\\", r"\\").replace("\n", r"\n")
+    if openmetrics:
+        return documentation.replace('"', r"\"")
+    return documentation
+
+
+def _deflate(data: bytes, mode: int = zlib.Z_SYNC_FLUSH) -> bytes:
+    """Compress data to a raw deflate stream.
+
+    Streams compressed with a sync flush end on a byte boundary without a
+    final block, so they can be joined with other streams into one stream.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(mode)
+
+
+def gzip_join(chunks: list[tuple[bytes, bytes | None]]) -> bytes:
+    """Join data chunks into one gzip stream.
+
+    Each chunk is a tuple of the data and, if available, the data compressed
+    with a sync flush, so compressed data can be reused across responses.
+    """
+    crc = 0
+    size = 0
+    parts = [GZIP_HEADER]
+    for data, deflated in chunks:
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        parts.append(_deflate(data) if deflated is None else deflated)
+    parts.append(_deflate(b"", zlib.Z_FINISH))
+    parts.append(crc.to_bytes(4, "little"))
+    parts.append((size & 0xFFFFFFFF).to_bytes(4, "little"))
+    return b"".join(parts)
+
+
+class MetricSample:
+    """A sample of a metric with the lines rendered for it."""
+
+    __slots__ = ("created", "created_lines", "family", "labels", "lines", "value")
+
+    def __init__(self, family: MetricFamily, labels: str) -> None:
+        """Initialize the sample."""
+        self.family = family
+        self.labels = labels
+        self.value = 0.0
+        self.created = time.time()
+        self.lines: bytes | None = None
+        self.created_lines: bytes | None = None
+
+    def set(self, value: float) -> None:
+        """Set the value of the sample."""
+        value = float(value)
+        with self.family.lock:
+            if self.value != value:
+                self.value = value
+                self.family.changed(self)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the value of the sample."""
+        with self.family.lock:
+            self.value += amount
+            self.family.changed(self)
+
+
+class MetricFamily:
+    """A metric with its samples, one for each set of label values."""
+
+    def __init__(
+        self,
+        exposition: MetricExposition,
+        name: str,
+        metric_type: MetricType,
+        documentation: str,
+        label_names: tuple[str, ...],
+    ) -> None:
+        """Initialize the metric family."""
+        self._exposition = exposition
+        self.lock = exposition.lock
+        self.name = name
+        self.type = metric_type
+        self.documentation = documentation
+        self.label_names = label_names
+        self._sorted_label_indices = sorted(
+            range(len(label_names)), key=label_names.__getitem__
+        )
+        self._samples: dict[tuple[str, ...], MetricSample] = {}
+        self._blocks: dict[bool, bytes] = {}
+
+    def _render_labels(self, label_values: tuple[str, ...]) -> str:
+        """Render the labels of a sample."""
+        return "{{{}}}".format(
+            ",".join(
+                f'{self.label_names[idx]}="{_escape_label_value(label_values[idx])}"'
+                for idx in self._sorted_label_indices
+            )
+        )
+
+    def labels(self, label_values: tuple[str, ...]) -> MetricSample:
+        """Return the sample of a set of label values, adding it if needed."""
+        if (sample := self._samples.get(label_values)) is not None:
+            return sample
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"Incorrect label count for {self.name}")
+        with self.lock:
+            if (sample := self._samples.get(label_values)) is None:
+                sample = self._samples[label_values] = MetricSample(
+                    self, self._render_labels(label_values)
+                )
+                self.changed(sample)
+        return sample
+
+    def changed(self, sample: MetricSample) -> None:
+        """Drop the rendered lines of a changed sample.
+
+        Must be called with the lock held.
+        """
+        sample.lines = None
+        self._blocks.clear()
+        self._exposition.changed()
+
+    def remove(self, label_values: tuple[str, ...]) -> None:
+        """Remove a sample."""
+        with self.lock:
+            if self._samples.pop(label_values, None) is not None:
+                self._blocks.clear()
+                self._exposition.changed()
+
+    def render(self, openmetrics: bool) -> bytes:
+        """Return the rendered metric, rendering the changed samples.
+
+        Must be called with the lock held.
+        """
+        if (block := self._blocks.get(openmetrics)) is not None:
+            return block
+        name = self.name
+        documentation = _escape_documentation(self.documentation, openmetrics)
+        counter = self.type is MetricType.COUNTER
+        value_name = f"{name}_total" if counter else name
+        lines: list[bytes] = []
+        created_lines: list[bytes] = []
+        for sample in self._samples.values():
+            if (sample_lines := sample.lines) is None:
+                sample_lines = sample.lines = (
+                    f"{value_name}{sample.labels} {floatToGoString(sample.value)}\n"
+                ).encode()
+            lines.append(sample_lines)
+            if not counter:
+                continue
+            if (sample_created_lines := sample.created_lines) is None:
+                sample_created_lines = sample.created_lines = (
+                    f"{name}_created{sample.labels} "
+                    f"{floatToGoString(sample.created)}\n"
+                ).encode()
+            if openmetrics:
+                lines.append(sample_created_lines)
+            else:
+                created_lines.append(sample_created_lines)
+        if not counter:
+            header = f"# HELP {name} {documentation}\n# TYPE {name} gauge\n"
+        elif openmetrics:
+            header = f"# HELP {name} {documentation}\n# TYPE {name} counter\n"
+        else:
+            # The text format has no created samples, they are exposed as a
+            # separate gauge like prometheus_client does
+            header = (
+                f"# HELP {value_name} {documentation}\n"
+                f"# TYPE {value_name} counter\n"
+            )
+        if created_lines:
+            created_lines.insert(
+                0,
+                (
+                    f"# HELP {name}_created {documentation}\n"
+                    f"# TYPE {name}_created gauge\n"
+                ).encode(),
+            )
+        block = self._blocks[openmetrics] = b"".join(
+            [header.encode(), *lines, *created_lines]
+        )
+        return block
+
+
+class MetricExposition:
+    """Exposition of the metrics of Home Assistant.
+
+    The metrics are updated by state changed listeners running in the executor
+    and rendered for requests, so all access is guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metric exposition."""
+        self.lock = threading.Lock()
+        self._families: list[MetricFamily] = []
+        self._rendered: dict[bool, bytes] = {}
+        self._deflated: dict[bool, bytes] = {}
+
+    def add_family(
+        self,
+        name: str,
+        metric_type: MetricType,
+        documentation: str,
+        label_names: tuple[str, ...],
+    ) -> MetricFamily:
+        """Add a metric."""
+        family = MetricFamily(self, name, metric_type, documentation, label_names)
+        with self.lock:
+            self._families.append(family)
+            self.changed()
+        return family
+
+    def changed(self) -> None:
+        """Drop the rendered exposition after a metric changed.
+
+        Must be called with the lock held.
+        """
+        self._rendered.clear()
+        self._deflated.clear()
+
+    def _render(self, openmetrics: bool) -> bytes:
+        """Return the rendered metrics."""
+        if (rendered := self._rendered.get(openmetrics)) is None:
+            rendered = self._rendered[openmetrics] = b"".join(
+                family.render(openmetrics) for family in self._families
+            )
+        return rendered
+
+    def render(self, openmetrics: bool) -> bytes:
+        """Return the rendered metrics."""
+        with self.lock:
+            return self._render(openmetrics)
+
+    def render_deflated(self, openmetrics: bool) -> tuple[bytes, bytes]:
+        """Return the rendered metrics and their compressed data."""
+        with self.lock:
+            rendered = self._render(openmetrics)
+            if (deflated := self._deflated.get(openmetrics)) is None:
+                deflated = self._deflated[openmetrics] = _deflate(rendered)
+            return rendered, deflated
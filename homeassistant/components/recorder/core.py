@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -146,6 +153,28 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
+# Columns written by the multi-row INSERTs for rows buffered
+# in the commit interval. The primary key and any foreign keys
+# are resolved at commit time.
+_EVENTS_INSERT_COLUMNS = (
+    "origin_idx",
+    "time_fired_ts",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+)
+_STATES_INSERT_COLUMNS = (
+    "entity_id",
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    "last_reported_ts",
+    "origin_idx",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+)
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -203,6 +232,11 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Rows buffered until the next commit, these are never added to the
+        # session and are written with multi-row INSERTs instead to avoid
+        # the per-object overhead of the unit of work.
+        self._pending_events: list[Events] = []
+        self._pending_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -690,6 +724,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_pending_event(self, dbevent: Events) -> None:
+        """Buffer an event row until the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_events.append(dbevent)
+
+    def _add_pending_state(self, dbstate: States) -> None:
+        """Buffer a state row until the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_states.append(dbstate)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -1056,7 +1100,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1081,7 +1125,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1163,7 +1207,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_pending_state(dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1211,6 +1255,10 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_events or self._pending_states:
+            with session.no_autoflush:
+                self._insert_pending_rows(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1229,6 +1277,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self._pending_events.clear()
+        self._pending_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1246,6 +1296,89 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _insert_pending_rows(self, session: Session) -> None:
+        """Write the buffered event and state rows with multi-row INSERTs.
+
+        The rows referenced by the buffered rows (event types, event data,
+        states meta and state attributes) are still added to the session
+        since new ones are rare, they are flushed first so their ids are
+        known when the buffered rows are written.
+        """
+        session.flush()
+
+        if pending_events := self._pending_events:
+            event_rows: list[dict[str, Any]] = []
+            for dbevent in pending_events:
+                row = {
+                    column: getattr(dbevent, column)
+                    for column in _EVENTS_INSERT_COLUMNS
+                }
+                event_type_rel = dbevent.event_type_rel
+                row["event_type_id"] = (
+                    event_type_rel.event_type_id
+                    if event_type_rel is not None
+                    else dbevent.event_type_id
+                )
+                event_data_rel = dbevent.event_data_rel
+                row["data_id"] = (
+                    event_data_rel.data_id
+                    if event_data_rel is not None
+                    else dbevent.data_id
+                )
+                event_rows.append(row)
+            session.execute(insert(Events), event_rows)
+
+        if not (pending_states := self._pending_states):
+            return
+
+        assert self.engine is not None
+        if not self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            # The state_id of each new row is needed to link the next state
+            # of the entity to it. When the database cannot return them in
+            # order for a multi-row INSERT we let the unit of work do it.
+            session.add_all(pending_states)
+            session.flush()
+            return
+
+        state_rows: list[dict[str, Any]] = []
+        for dbstate in pending_states:
+            row = {
+                column: getattr(dbstate, column) for column in _STATES_INSERT_COLUMNS
+            }
+            states_meta_rel = dbstate.states_meta_rel
+            row["metadata_id"] = (
+                states_meta_rel.metadata_id
+                if states_meta_rel is not None
+                else dbstate.metadata_id
+            )
+            state_attributes = dbstate.state_attributes
+            row["attributes_id"] = (
+                state_attributes.attributes_id
+                if state_attributes is not None
+                else dbstate.attributes_id
+            )
+            # States linked to another pending state get their
+            # old_state_id once the state_id of the old state is known
+            row["old_state_id"] = (
+                None if dbstate.old_state is not None else dbstate.old_state_id
+            )
+            state_rows.append(row)
+
+        state_ids = session.scalars(
+            insert(States).returning(States.state_id, sort_by_parameter_order=True),
+            state_rows,
+        ).all()
+        for dbstate, state_id in zip(pending_states, state_ids, strict=True):
+            dbstate.state_id = state_id
+
+        if linked_rows := [
+            {"state_id": dbstate.state_id, "old_state_id": old_state.state_id}
+            for dbstate in pending_states
+            if (old_state := dbstate.old_state) is not None
+            and old_state.state_id is not None
+        ]:
+            session.execute(update(States), linked_rows)
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1266,6 +1399,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_events.clear()
+        self._pending_states.clear()
 
         if not self.event_session:
             return
@@ -0,0 +1,175 @@
+"""Sample buffer with running aggregates for the statistics sensor."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+import math
+
+
+class SampleBuffer:
+    """Buffer of the samples of a source entity with running aggregates.
+
+    The aggregates are updated when a sample is added to or removed from the
+    buffer so the characteristics can be calculated without iterating all
+    samples on every new state. To keep the rounding errors of adding and
+    removing samples from accumulating, the aggregates are recalculated from
+    the samples once as many samples were removed as the buffer holds.
+    """
+
+    def __init__(
+        self,
+        maxlen: int | None,
+        *,
+        track_variance: bool = False,
+        track_circular: bool = False,
+        track_order: bool = False,
+    ) -> None:
+        """Initialize the sample buffer."""
+        self.maxlen = maxlen
+        self.states: deque[bool | float] = deque()
+        self.ages: deque[float] = deque()
+        self._track_variance = track_variance
+        self._track_circular = track_circular
+        self._removed = 0
+        # Values sorted ascending, only kept for order statistics
+        self.sorted_states: list[bool | float] | None = [] if track_order else None
+        self._reset_aggregates()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def _reset_aggregates(self) -> None:
+        """Reset the running aggregates to those of an empty buffer."""
+        self.sum: float = 0.0
+        self.count_true = 0
+        self.sum_differences: float = 0.0
+        self.sum_differences_nonnegative: float = 0.0
+        self.area_linear: float = 0.0
+        self.area_step: float = 0.0
+        self.seconds_true: float = 0.0
+        self.sin_sum: float = 0.0
+        self.cos_sum: float = 0.0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
+    def append(self, state: bool | float, age: float) -> None:
+        """Add a sample, removing the oldest one if the buffer is full."""
+        states = self.states
+        if self.maxlen is not None and len(states) >= self.maxlen:
+            self.popleft()
+        if states:
+            self._add_segment(states[-1], self.ages[-1], state, age, 1)
+        states.append(state)
+        self.ages.append(age)
+        self.sum += state
+        self.count_true += state is True
+        if self._track_variance:
+            # Welford's online algorithm
+            delta = state - self._mean
+            self._mean += delta / len(states)
+            self._m2 += delta * (state - self._mean)
+        if self._track_circular:
+            radians = math.radians(state)
+            self.sin_sum += math.sin(radians)
+            self.cos_sum += math.cos(radians)
+        if self.sorted_states is not None:
+            insort(self.sorted_states, state)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        states = self.states
+        state = states.popleft()
+        age = self.ages.popleft()
+        if not states:
+            self._removed = 0
+            self._reset_aggregates()
+            if self.sorted_states is not None:
+                self.sorted_states.clear()
+            return
+        self._add_segment(state, age, states[0], self.ages[0], -1)
+        self.sum -= state
+        self.count_true -= state is True
+        if self._track_variance:
+            delta = state - self._mean
+            self._mean -= delta / len(states)
+            self._m2 -= delta * (state - self._mean)
+        if self._track_circular:
+            radians = math.radians(state)
+            self.sin_sum -= math.sin(radians)
+            self.cos_sum -= math.cos(radians)
+        if (sorted_states := self.sorted_states) is not None:
+            del sorted_states[bisect_left(sorted_states, state)]
+        self._removed += 1
+        if self._removed >= len(states):
+            self._recalculate()
+
+    def _add_segment(
+        self,
+        state: bool | float,
+        age: float,
+        next_state: bool | float,
+        next_age: float,
+        sign: int,
+    ) -> None:
+        """Add or remove the aggregates of the segment between two samples."""
+        duration = next_age - age
+        difference = next_state - state
+        self.sum_differences += sign * abs(difference)
+        self.sum_differences_nonnegative += sign * (
+            difference if next_state >= state else next_state
+        )
+        self.area_linear += sign * 0.5 * (state + next_state) * duration
+        self.area_step += sign * state * duration
+        if state is True:
+            self.seconds_true += sign * duration
+
+    def _recalculate(self) -> None:
+        """Recalculate the running aggregates from the samples."""
+        self._removed = 0
+        states = self.states
+        ages = self.ages
+        self._reset_aggregates()
+        self.sum = math.fsum(states)
+        self.count_true = states.count(True)
+        for i in range(1, len(states)):
+            self._add_segment(states[i - 1], ages[i - 1], states[i], ages[i], 1)
+        if self._track_variance:
+            self._mean = self.sum / len(states)
+            self._m2 = math.fsum((state - self._mean) ** 2 for state in states)
+        if self._track_circular:
+            radians = [math.radians(state) for state in states]
+            self.sin_sum = math.fsum(map(math.sin, radians))
+            self.cos_sum = math.fsum(map(math.cos, radians))
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the states."""
+        if len(self.states) < 2:
+            return 0.0
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    def quantile(self, percentile: int) -> float:
+        """Return a percentile of the states.
+
+        Matches statistics.quantiles(n=100, method="exclusive").
+        """
+        assert self.sorted_states is not None
+        data = self.sorted_states
+        ld = len(data)
+        m = ld + 1
+        j = min(max(percentile * m // 100, 1), ld - 1)
+        delta = percentile * m - j * 100
+        return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
+
+    @property
+    def median(self) -> float:
+        """Return the median of the states."""
+        assert self.sorted_states is not None
+        data = self.sorted_states
+        n = len(data)
+        i = n // 2
+        if n % 2 == 1:
+            return data[i]
+        return (data[i - 1] + data[i]) / 2
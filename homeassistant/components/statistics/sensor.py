@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable, Mapping
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 import time
 from typing import Any, cast
 
@@ -59,6 +57,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .samples import SampleBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,9 +100,8 @@ STAT_VARIANCE = "variance"
 
 def _callable_characteristic_fn(
     characteristic: str, binary: bool
-) -> Callable[[deque[bool | float], deque[float], int], float | int | datetime | None]:
+) -> Callable[[SampleBuffer, int], float | int | datetime | None]:
     """Return the function callable of one characteristic function."""
-    Callable[[deque[bool | float], deque[datetime], int], datetime | int | float | None]
     if binary:
         return STATS_BINARY_SUPPORT[characteristic]
     return STATS_NUMERIC_SUPPORT[characteristic]
@@ -112,315 +110,238 @@ def _callable_characteristic_fn(
 # Statistics for numeric sensor
 
 
-def _stat_average_linear(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return states[0]
-    if len(states) >= 2:
-        area: float = 0
-        for i in range(1, len(states)):
-            area += 0.5 * (states[i] + states[i - 1]) * (ages[i] - ages[i - 1])
-        age_range_seconds = ages[-1] - ages[0]
-        return area / age_range_seconds
+def _stat_average_linear(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return samples.states[0]
+    if len(samples) >= 2:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
+        return samples.area_linear / age_range_seconds
     return None
 
 
-def _stat_average_step(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return states[0]
-    if len(states) >= 2:
-        area: float = 0
-        for i in range(1, len(states)):
-            area += states[i - 1] * (ages[i] - ages[i - 1])
-        age_range_seconds = ages[-1] - ages[0]
-        return area / age_range_seconds
+def _stat_average_step(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return samples.states[0]
+    if len(samples) >= 2:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
+        return samples.area_step / age_range_seconds
     return None
 
 
-def _stat_average_timeless(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    return _stat_mean(states, ages, percentile)
+def _stat_average_timeless(samples: SampleBuffer, percentile: int) -> float | None:
+    return _stat_mean(samples, percentile)
 
 
-def _stat_change(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return states[-1] - states[0]
+def _stat_change(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.states[-1] - samples.states[0]
     return None
 
 
-def _stat_change_sample(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 1:
-        return (states[-1] - states[0]) / (len(states) - 1)
+def _stat_change_sample(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 1:
+        return (samples.states[-1] - samples.states[0]) / (len(samples) - 1)
     return None
 
 
-def _stat_change_second(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 1:
-        age_range_seconds = ages[-1] - ages[0]
+def _stat_change_second(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 1:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
         if age_range_seconds > 0:
-            return (states[-1] - states[0]) / age_range_seconds
+            return (samples.states[-1] - samples.states[0]) / age_range_seconds
     return None
 
 
-def _stat_count(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return len(states)
+def _stat_count(samples: SampleBuffer, percentile: int) -> int | None:
+    return len(samples)
 
 
-def _stat_datetime_newest(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[-1])
+def _stat_datetime_newest(samples: SampleBuffer, percentile: int) -> datetime | None:
+    if len(samples) > 0:
+        return dt_util.utc_from_timestamp(samples.ages[-1])
     return None
 
 
-def _stat_datetime_oldest(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[0])
+def _stat_datetime_oldest(samples: SampleBuffer, percentile: int) -> datetime | None:
+    if len(samples) > 0:
+        return dt_util.utc_from_timestamp(samples.ages[0])
     return None
 
 
-def _stat_datetime_value_max(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[states.index(max(states))])
+def _stat_datetime_value_max(samples: SampleBuffer, percentile: int) -> datetime | None:
+    if len(samples) > 0:
+        value_max = cast(list[float], samples.sorted_states)[-1]
+        return dt_util.utc_from_timestamp(samples.ages[samples.states.index(value_max)])
     return None
 
 
-def _stat_datetime_value_min(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[states.index(min(states))])
+def _stat_datetime_value_min(samples: SampleBuffer, percentile: int) -> datetime | None:
+    if len(samples) > 0:
+        value_min = cast(list[float], samples.sorted_states)[0]
+        return dt_util.utc_from_timestamp(samples.ages[samples.states.index(value_min)])
     return None
 
 
 def _stat_distance_95_percent_of_values(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: SampleBuffer, percentile: int
 ) -> float | None:
-    if len(states) >= 1:
-        return (
-            2 * 1.96 * cast(float, _stat_standard_deviation(states, ages, percentile))
-        )
+    if len(samples) >= 1:
+        return 2 * 1.96 * cast(float, _stat_standard_deviation(samples, percentile))
     return None
 
 
 def _stat_distance_99_percent_of_values(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: SampleBuffer, percentile: int
 ) -> float | None:
-    if len(states) >= 1:
-        return (
-            2 * 2.58 * cast(float, _stat_standard_deviation(states, ages, percentile))
-        )
+    if len(samples) >= 1:
+        return 2 * 2.58 * cast(float, _stat_standard_deviation(samples, percentile))
     return None
 
 
-def _stat_distance_absolute(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return max(states) - min(states)
+def _stat_distance_absolute(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        sorted_states = cast(list[float], samples.sorted_states)
+        return sorted_states[-1] - sorted_states[0]
     return None
 
 
-def _stat_mean(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return statistics.mean(states)
+def _stat_mean(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.sum / len(samples)
     return None
 
 
-def _stat_mean_circular(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        sin_sum = sum(math.sin(math.radians(x)) for x in states)
-        cos_sum = sum(math.cos(math.radians(x)) for x in states)
-        return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+def _stat_mean_circular(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return (math.degrees(math.atan2(samples.sin_sum, samples.cos_sum)) + 360) % 360
     return None
 
 
-def _stat_median(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return statistics.median(states)
+def _stat_median(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.median
     return None
 
 
-def _stat_noisiness(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
+def _stat_noisiness(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return cast(float, _stat_sum_differences(states, ages, percentile)) / (
-            len(states) - 1
+    if len(samples) >= 2:
+        return cast(float, _stat_sum_differences(samples, percentile)) / (
+            len(samples) - 1
         )
     return None
 
 
-def _stat_percentile(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return states[0]
-    if len(states) >= 2:
-        percentiles = statistics.quantiles(states, n=100, method="exclusive")
-        return percentiles[percentile - 1]
+def _stat_percentile(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return samples.states[0]
+    if len(samples) >= 2:
+        return samples.quantile(percentile)
     return None
 
 
-def _stat_standard_deviation(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
+def _stat_standard_deviation(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return statistics.stdev(states)
+    if len(samples) >= 2:
+        return math.sqrt(samples.variance)
     return None
 
 
-def _stat_sum(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return sum(states)
+def _stat_sum(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.sum
     return None
 
 
-def _stat_sum_differences(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
+def _stat_sum_differences(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return sum(
-            abs(j - i) for i, j in zip(list(states), list(states)[1:], strict=False)
-        )
+    if len(samples) >= 2:
+        return samples.sum_differences
     return None
 
 
 def _stat_sum_differences_nonnegative(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: SampleBuffer, percentile: int
 ) -> float | None:
-    if len(states) == 1:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return sum(
-            (j - i if j >= i else j - 0)
-            for i, j in zip(list(states), list(states)[1:], strict=False)
-        )
+    if len(samples) >= 2:
+        return samples.sum_differences_nonnegative
     return None
 
 
-def _stat_total(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    return _stat_sum(states, ages, percentile)
+def _stat_total(samples: SampleBuffer, percentile: int) -> float | None:
+    return _stat_sum(samples, percentile)
 
 
-def _stat_value_max(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return max(states)
+def _stat_value_max(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return cast(list[float], samples.sorted_states)[-1]
     return None
 
 
-def _stat_value_min(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return min(states)
+def _stat_value_min(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return cast(list[float], samples.sorted_states)[0]
     return None
 
 
-def _stat_variance(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
+def _stat_variance(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return statistics.variance(states)
+    if len(samples) >= 2:
+        return samples.variance
     return None
 
 
 # Statistics for binary sensor
 
 
-def _stat_binary_average_step(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return 100.0 * int(states[0] is True)
-    if len(states) >= 2:
-        on_seconds: float = 0
-        for i in range(1, len(states)):
-            if states[i - 1] is True:
-                on_seconds += ages[i] - ages[i - 1]
-        age_range_seconds = ages[-1] - ages[0]
-        return 100 / age_range_seconds * on_seconds
+def _stat_binary_average_step(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return 100.0 * int(samples.states[0] is True)
+    if len(samples) >= 2:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
+        return 100 / age_range_seconds * samples.seconds_true
     return None
 
 
 def _stat_binary_average_timeless(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: SampleBuffer, percentile: int
 ) -> float | None:
-    return _stat_binary_mean(states, ages, percentile)
+    return _stat_binary_mean(samples, percentile)
 
 
-def _stat_binary_count(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return len(states)
+def _stat_binary_count(samples: SampleBuffer, percentile: int) -> int | None:
+    return len(samples)
 
 
-def _stat_binary_count_on(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return states.count(True)
+def _stat_binary_count_on(samples: SampleBuffer, percentile: int) -> int | None:
+    return samples.count_true
 
 
-def _stat_binary_count_off(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return states.count(False)
+def _stat_binary_count_off(samples: SampleBuffer, percentile: int) -> int | None:
+    return len(samples) - samples.count_true
 
 
 def _stat_binary_datetime_newest(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: SampleBuffer, percentile: int
 ) -> datetime | None:
-    return _stat_datetime_newest(states, ages, percentile)
+    return _stat_datetime_newest(samples, percentile)
 
 
 def _stat_binary_datetime_oldest(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: SampleBuffer, percentile: int
 ) -> datetime | None:
-    return _stat_datetime_oldest(states, ages, percentile)
+    return _stat_datetime_oldest(samples, percentile)
 
 
-def _stat_binary_mean(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return 100.0 / len(states) * states.count(True)
+def _stat_binary_mean(samples: SampleBuffer, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return 100.0 / len(samples) * samples.count_true
     return None
 
 
@@ -504,6 +425,25 @@ STATS_NUMERIC_RETAIN_UNIT = {
     STAT_VALUE_MIN,
 }
 
+# Statistics which need the variance of the samples
+STATS_VARIANCE = {
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_STANDARD_DEVIATION,
+    STAT_VARIANCE,
+}
+
+# Statistics which need the samples sorted by value
+STATS_ORDER = {
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+
 # Statistics which produce percentage ratio from binary_sensor source entity
 STATS_BINARY_PERCENTAGE = {
     STAT_AVERAGE_STEP,
@@ -687,13 +627,18 @@ class StatisticsSensor(SensorEntity):
         self._percentile: int = percentile
         self._attr_available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=samples_max_buffer_size)
-        self.ages: deque[float] = deque(maxlen=samples_max_buffer_size)
+        self.samples = SampleBuffer(
+            samples_max_buffer_size,
+            track_variance=state_characteristic in STATS_VARIANCE,
+            track_circular=state_characteristic == STAT_MEAN_CIRCULAR,
+            track_order=state_characteristic in STATS_ORDER,
+        )
+        self.states = self.samples.states
+        self.ages = self.samples.ages
         self._attr_extra_state_attributes = {}
 
         self._state_characteristic_fn: Callable[
-            [deque[bool | float], deque[float], int],
-            float | int | datetime | None,
+            [SampleBuffer, int], float | int | datetime | None
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
 
         self._update_listener: CALLBACK_TYPE | None = None
@@ -797,10 +742,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: bool | float = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_reported_timestamp)
+                value = float(new_state.state)
+            self.samples.append(value, new_state.last_reported_timestamp)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -944,8 +889,7 @@ class StatisticsSensor(SensorEntity):
                     dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
-            self.ages.popleft()
-            self.states.popleft()
+            self.samples.popleft()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> float | None:
@@ -1091,7 +1035,7 @@ class StatisticsSensor(SensorEntity):
         One of the _stat_*() functions is represented by self._state_characteristic_fn().
         """
 
-        value = self._state_characteristic_fn(self.states, self.ages, self._percentile)
+        value = self._state_characteristic_fn(self.samples, self._percentile)
         _LOGGER.debug(
             "Updating value: states: %s, ages: %s => %s", self.states, self.ages, value
         )
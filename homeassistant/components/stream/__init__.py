@@ -40,6 +40,7 @@ from homeassistant.util.async_ import create_eager_task
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_MEMORY_BUDGET,
     ATTR_PREFER_TCP,
     ATTR_SETTINGS,
     ATTR_STREAMS,
@@ -58,6 +59,7 @@ from .const import (
     RECORDER_PROVIDER,
     RTSP_TRANSPORTS,
     SEGMENT_DURATION_ADJUSTER,
+    SEGMENT_MEMORY_BUDGET,
     SOURCE_TIMEOUT,
     STREAM_RESTART_INCREMENT,
     STREAM_RESTART_RESET_TIME,
@@ -69,6 +71,7 @@ from .core import (
     IdleTimer,
     KeyFrameConverter,
     Orientation,
+    SegmentMemoryBudget,
     StreamOutput,
     StreamSettings,
 )
@@ -273,6 +276,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
+    hass.data[DOMAIN][ATTR_MEMORY_BUDGET] = SegmentMemoryBudget(
+        hass, SEGMENT_MEMORY_BUDGET
+    )
     conf = DOMAIN_SCHEMA(config.get(DOMAIN, {}))
     if conf[CONF_LL_HLS]:
         assert isinstance(conf[CONF_SEGMENT_DURATION], float)
@@ -609,9 +615,23 @@ class Stream:
             wait_for_next_keyframe=wait_for_next_keyframe,
         )
 
+    @property
+    def diagnostics(self) -> Diagnostics:
+        """Return diagnostics object."""
+        return self._diagnostics
+
     def get_diagnostics(self) -> dict[str, Any]:
-        """Return diagnostics information for the stream."""
-        return self._diagnostics.as_dict()
+        """Return diagnostics information for the stream.
+
+        Includes the memory budget of the segments of all streams.
+        """
+        memory_budget: SegmentMemoryBudget = self.hass.data[DOMAIN][ATTR_MEMORY_BUDGET]
+        return {
+            **self._diagnostics.as_dict(),
+            "segment_memory_budget": memory_budget.budget,
+            "segment_memory_used": memory_budget.used,
+            "evicted_segments": memory_budget.evicted_segments,
+        }
 
 
 def _should_retry() -> bool:
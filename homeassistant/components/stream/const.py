@@ -8,6 +8,7 @@ from typing import Final
 DOMAIN = "stream"
 
 ATTR_ENDPOINTS = "endpoints"
+ATTR_MEMORY_BUDGET = "memory_budget"
 ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
 
@@ -26,6 +27,9 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
+MIN_SEGMENTS = 2  # Min number of segments to keep when over the memory budget
+SEGMENT_MEMORY_BUDGET = 128 * 1024 * 1024  # Memory for the segments of all streams
+SEGMENT_BUFFER_SIZE = 256 * 1024  # Initial size of the buffer of segment data
 TARGET_SEGMENT_DURATION_NON_LL_HLS = 2.0  # Each segment is about this many seconds
 SEGMENT_DURATION_ADJUSTER = 0.1  # Used to avoid missing keyframe boundaries
 # Number of target durations to start before the end of the playlist.
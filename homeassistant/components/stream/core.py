@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import Counter, deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
 import datetime
@@ -20,8 +20,11 @@ from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
 from .const import (
+    ATTR_MEMORY_BUDGET,
     ATTR_STREAMS,
     DOMAIN,
+    MIN_SEGMENTS,
+    SEGMENT_BUFFER_SIZE,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
@@ -77,8 +80,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once added to a segment
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +105,11 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of the parts added to the segment, parts and responses hold views of
+    # it so the buffer is replaced rather than resized when it is full
+    _data: bytearray = field(default_factory=bytearray, init=False, repr=False)
+    _data_size: int = field(default=0, init=False, repr=False)
+    _num_parts_buffered: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -123,6 +131,30 @@ class Segment:
         """Return the size of all part data without init in bytes."""
         return sum(len(part.data) for part in self.parts)
 
+    @property
+    def memory_size(self) -> int:
+        """Return the memory held by the part data in bytes."""
+        return max(len(self._data), self.data_size)
+
+    def _buffer_data(self, data: bytes | memoryview) -> memoryview:
+        """Append part data to the segment data and return a view of it."""
+        start = self._data_size
+        end = self._data_size = start + len(data)
+        if end > len(self._data):
+            buffer = bytearray(max(end, 2 * len(self._data), SEGMENT_BUFFER_SIZE))
+            buffer[:start] = memoryview(self._data)[:start]
+            self._data = buffer
+            # Move the parts to the new buffer so the old one can be freed
+            # once the responses holding views of it are sent
+            view = memoryview(buffer).toreadonly()
+            offset = 0
+            for part in self.parts[: self._num_parts_buffered]:
+                part_size = len(part.data)
+                part.data = view[offset : offset + part_size]
+                offset += part_size
+        self._data[start:end] = data
+        return memoryview(self._data)[start:end].toreadonly()
+
     @callback
     def async_add_part(
         self,
@@ -133,13 +165,18 @@ class Segment:
 
         Duration is non zero only for the last part.
         """
+        if self._num_parts_buffered == len(self.parts):
+            part.data = self._buffer_data(part.data)
+            self._num_parts_buffered += 1
         self.parts.append(part)
         self.duration = duration
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init."""
+        if self._num_parts_buffered == len(self.parts):
+            return memoryview(self._data)[: self._data_size].toreadonly()
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
@@ -287,6 +324,7 @@ class StreamOutput:
         self._event = asyncio.Event()
         self._part_event = asyncio.Event()
         self._segments: deque[Segment] = deque(maxlen=deque_maxlen)
+        self._memory_budget: SegmentMemoryBudget = hass.data[DOMAIN][ATTR_MEMORY_BUDGET]
 
     @property
     def name(self) -> str | None:
@@ -343,6 +381,7 @@ class StreamOutput:
         # Start idle timeout when we start receiving data
         self._part_event.set()
         self._part_event.clear()
+        self._memory_budget.async_enforce()
 
     async def recv(self) -> bool:
         """Wait for the latest segment."""
@@ -361,6 +400,7 @@ class StreamOutput:
         self._segments.append(segment)
         self._event.set()
         self._event.clear()
+        self._memory_budget.async_enforce()
 
     def cleanup(self) -> None:
         """Handle cleanup."""
@@ -368,6 +408,68 @@ class StreamOutput:
         self.idle_timer.clear()
 
 
+class SegmentMemoryBudget:
+    """Bound the memory of the segments kept by all streams.
+
+    When the segments use more memory than the budget, the oldest segments
+    across all streams are dropped from the outputs keeping a window of recent
+    segments. The most recent segments of each output are kept so playback
+    can continue. Segments kept by another output of the stream, like the
+    recorder, only free their memory once no output keeps them.
+    """
+
+    def __init__(self, hass: HomeAssistant, budget: int) -> None:
+        """Initialize the memory budget."""
+        self._hass = hass
+        self.budget = budget
+        self.used = 0
+        self.evicted_segments = 0
+
+    @callback
+    def async_enforce(self) -> None:
+        """Drop the oldest segments while over the budget."""
+        streams: list[Stream] = self._hass.data[DOMAIN][ATTR_STREAMS]
+        outputs = [
+            (stream, output)
+            for stream in streams
+            for output in stream.outputs().values()
+        ]
+        # Outputs of a stream share their segments
+        references: Counter[int] = Counter()
+        segments: dict[int, Segment] = {}
+        # The recorder keeps all of its segments
+        pinned: set[int] = set()
+        for _, output in outputs:
+            output_segments = output.get_segments()
+            for segment in output_segments:
+                references[id(segment)] += 1
+                segments[id(segment)] = segment
+                if output_segments.maxlen is None:
+                    pinned.add(id(segment))
+        used = sum(segment.memory_size for segment in segments.values())
+        while used > self.budget:
+            if not (
+                candidates := [
+                    (stream, output_segments)
+                    for stream, output in outputs
+                    if (output_segments := output.get_segments()).maxlen is not None
+                    and len(output_segments) > MIN_SEGMENTS
+                    and id(output_segments[0]) not in pinned
+                ]
+            ):
+                break
+            stream, output_segments = min(
+                candidates, key=lambda candidate: candidate[1][0].start_time
+            )
+            segment = output_segments.popleft()
+            references[id(segment)] -= 1
+            if not references[id(segment)]:
+                used -= segment.memory_size
+            self.evicted_segments += 1
+            stream.diagnostics.increment("evict_segment")
+        self.used = used
+
+
 class StreamView(HomeAssistantView):
     """Base StreamView.
 
@@ -15,6 +15,7 @@ CONF_MIN = "min"
 CONF_OBJECT_ID = "object_id"
 CONF_PICTURE = "picture"
 CONF_PRESS = "press"
+CONF_STATE_FILTER = "state_filter"
 CONF_STEP = "step"
 CONF_TRIGGER = "trigger"
 CONF_TURN_OFF = "turn_off"
@@ -13,12 +13,14 @@ import voluptuous as vol
 
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
 from homeassistant.const import (
+    CONF_ATTRIBUTE,
     CONF_ENTITY_PICTURE_TEMPLATE,
     CONF_FRIENDLY_NAME,
     CONF_ICON,
     CONF_ICON_TEMPLATE,
     CONF_NAME,
     CONF_PATH,
+    CONF_STATE,
     CONF_VARIABLES,
     STATE_UNKNOWN,
 )
@@ -40,6 +42,7 @@ from homeassistant.helpers.event import (
     TrackTemplateResult,
     TrackTemplateResultInfo,
     async_track_template_result,
+    make_state_filter,
 )
 from homeassistant.helpers.script import Script, _VarsType
 from homeassistant.helpers.start import async_at_start
@@ -60,6 +63,7 @@ from .const import (
     CONF_AVAILABILITY,
     CONF_AVAILABILITY_TEMPLATE,
     CONF_PICTURE,
+    CONF_STATE_FILTER,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -80,6 +84,7 @@ TEMPLATE_ENTITY_COMMON_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_ATTRIBUTES): vol.Schema({cv.string: cv.template}),
         vol.Optional(CONF_AVAILABILITY): cv.template,
+        vol.Optional(CONF_STATE_FILTER): cv.TEMPLATE_STATE_FILTER_SCHEMA,
         vol.Optional(CONF_VARIABLES): cv.SCRIPT_VARIABLES_SCHEMA,
     }
 ).extend(TEMPLATE_ENTITY_BASE_SCHEMA.schema)
@@ -91,6 +96,7 @@ def make_template_entity_common_schema(default_name: str) -> vol.Schema:
         {
             vol.Optional(CONF_ATTRIBUTES): vol.Schema({cv.string: cv.template}),
             vol.Optional(CONF_AVAILABILITY): cv.template,
+            vol.Optional(CONF_STATE_FILTER): cv.TEMPLATE_STATE_FILTER_SCHEMA,
         }
     ).extend(make_template_entity_base_schema(default_name).schema)
 
@@ -293,6 +299,7 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
             self._friendly_name_template = None
             self._run_variables = {}
             self._blueprint_inputs = None
+            self._state_filter: Callable[[State], bool] | None = None
         else:
             self._attribute_templates = config.get(CONF_ATTRIBUTES)
             self._availability_template = config.get(CONF_AVAILABILITY)
@@ -301,6 +308,13 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
             self._friendly_name_template = config.get(CONF_NAME)
             self._run_variables = config.get(CONF_VARIABLES, {})
             self._blueprint_inputs = config.get("raw_blueprint_inputs")
+            self._state_filter = (
+                make_state_filter(
+                    state_filter.get(CONF_STATE), state_filter.get(CONF_ATTRIBUTE)
+                )
+                if (state_filter := config.get(CONF_STATE_FILTER))
+                else None
+            )
 
         class DummyState(State):
             """None-state for template entities not yet added to the state machine."""
@@ -492,7 +506,9 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
         }
 
         for template, attributes in self._template_attrs.items():
-            template_var_tup = TrackTemplate(template, variables)
+            template_var_tup = TrackTemplate(
+                template, variables, state_filter=self._state_filter
+            )
             is_availability_template = False
             for attribute in attributes:
                 if attribute._attribute == "_attr_available":  # noqa: SLF001
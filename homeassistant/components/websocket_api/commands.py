@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
+from dataclasses import asdict
 from functools import lru_cache, partial
 import json
 import logging
@@ -14,6 +16,8 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    CONF_ATTRIBUTE,
+    CONF_STATE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -36,6 +40,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import async_get_polling_platforms
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
@@ -44,6 +49,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_track_template_result,
+    make_state_filter,
 )
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -55,6 +61,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
@@ -79,6 +86,7 @@ def async_register_commands(
     """Register commands."""
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_entity_source)
+    async_reg(hass, handle_event_bus_profile)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
@@ -86,6 +94,8 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
+    async_reg(hass, handle_integration_poll_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -394,11 +404,162 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+def _filter_state_attributes(state: State, attributes: set[str]) -> State:
+    """Return a copy of a state with only the allowed attributes."""
+    return State(
+        state.entity_id,
+        state.state,
+        {key: value for key, value in state.attributes.items() if key in attributes},
+        state.last_changed,
+        state.last_reported,
+        state.last_updated,
+        state.context,
+        validate_entity_id=False,
+        last_updated_timestamp=state.last_updated_timestamp,
+    )
+
+
+class _ThrottledEntityChanges:
+    """Forward the entity changes of a subscription with a minimum interval.
+
+    Changes of an entity within the interval of the last forwarded change
+    are coalesced and forwarded as a single diff when the interval has
+    passed. When an attribute allow-list is given, other attributes are
+    left out and changes of only other attributes are not forwarded.
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_hass",
+        "_interval",
+        "_last_sent",
+        "_msg_id",
+        "_pending",
+        "_send_message",
+        "_timers",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        msg_id: int,
+        interval: float,
+        attributes: set[str] | None,
+    ) -> None:
+        """Initialize the throttled entity changes."""
+        self._hass = hass
+        self._send_message = send_message
+        self._msg_id = msg_id
+        self._interval = interval
+        self._attributes = attributes
+        self._last_sent: dict[str, float] = {}
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    @callback
+    def async_forward(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> None:
+        """Forward a change or hold it until the interval has passed."""
+        if (pending := self._pending.get(entity_id)) is not None:
+            # Last write wins, the diff is made against the state
+            # the client saw before the first held change
+            self._pending[entity_id] = (pending[0], new_state)
+            return
+        now = self._hass.loop.time()
+        if (last_sent := self._last_sent.get(entity_id)) is not None and (
+            now - last_sent < self._interval
+        ):
+            self._pending[entity_id] = (old_state, new_state)
+            self._timers[entity_id] = self._hass.loop.call_at(
+                last_sent + self._interval, self._async_forward_pending, entity_id
+            )
+            return
+        self._async_send(entity_id, old_state, new_state, now)
+
+    @callback
+    def _async_forward_pending(self, entity_id: str) -> None:
+        """Forward the held changes of an entity."""
+        del self._timers[entity_id]
+        old_state, new_state = self._pending.pop(entity_id)
+        self._async_send(entity_id, old_state, new_state, self._hass.loop.time())
+
+    @callback
+    def _async_send(
+        self,
+        entity_id: str,
+        old_state: State | None,
+        new_state: State | None,
+        now: float,
+    ) -> None:
+        """Send the diff between two states."""
+        if new_state is None:
+            self._last_sent.pop(entity_id, None)
+            if old_state is None:
+                # Added and removed again while the changes were held
+                return
+        if (attributes := self._attributes) is not None:
+            if old_state is not None:
+                old_state = _filter_state_attributes(old_state, attributes)
+            if new_state is not None:
+                new_state = _filter_state_attributes(new_state, attributes)
+            if (
+                old_state is not None
+                and new_state is not None
+                and old_state.state == new_state.state
+                and old_state.attributes == new_state.attributes
+                and old_state.last_changed == new_state.last_changed
+            ):
+                return
+        if new_state is not None:
+            self._last_sent[entity_id] = now
+        self._send_message(
+            messages.state_diff_message(self._msg_id, entity_id, old_state, new_state)
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel forwarding the held changes."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+
+@callback
+def _forward_throttled_entity_changes(
+    throttle: _ThrottledEntityChanges,
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    event: Event[EventStateChangedData],
+) -> None:
+    """Forward entity state changed events to a throttled subscription."""
+    entity_id = event.data["entity_id"]
+    if (entity_ids and entity_id not in entity_ids) or (
+        entity_filter and not entity_filter(entity_id)
+    ):
+        return
+    permissions = user.permissions
+    if (
+        not user.is_admin
+        and not permissions.access_all_entities(POLICY_READ)
+        and not permissions.check_entity(entity_id, POLICY_READ)
+    ):
+        return
+    throttle.async_forward(entity_id, event.data["old_state"], event.data["new_state"])
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("min_update_interval"): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional("attributes"): [str],
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -409,23 +570,58 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    min_update_interval: float | None = msg.get("min_update_interval")
+    attributes = set(msg["attributes"]) if "attributes" in msg else None
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    if min_update_interval is None and attributes is None:
+        connection.subscriptions[msg_id] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                entity_filter,
+                connection.user,
+                message_id_as_bytes,
+            ),
+        )
+    else:
+        throttle = _ThrottledEntityChanges(
+            hass,
             connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+            msg_id,
+            min_update_interval or 0,
+            attributes,
+        )
+        unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_throttled_entity_changes,
+                throttle,
+                entity_ids,
+                entity_filter,
+                connection.user,
+            ),
+        )
+
+        @callback
+        def _unsub() -> None:
+            unsub()
+            throttle.async_cancel()
+
+        connection.subscriptions[msg_id] = _unsub
+        if attributes is not None:
+            states = [
+                _filter_state_attributes(state, attributes)
+                for state in states
+                if (not entity_ids or state.entity_id in entity_ids)
+                and (not entity_filter or entity_filter(state.entity_id))
+            ]
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -570,6 +766,47 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import info command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "module": timing.module,
+                "domain": timing.domain,
+                "seconds": timing.seconds,
+                "modules_loaded": timing.modules_loaded,
+                "event_loop": timing.event_loop,
+            }
+            for timing in async_get_import_timings(hass)
+        ],
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/poll_info"})
+def handle_integration_poll_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration poll info command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "domain": platform.domain,
+                "platform": platform.platform_name,
+                "scan_interval": platform.scan_interval_seconds,
+                **asdict(platform.poll_statistics),
+            }
+            for platform in async_get_polling_platforms(hass)
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -594,6 +831,7 @@ def _cached_template(template_str: str, hass: HomeAssistant) -> template.Templat
         vol.Optional("timeout"): vol.Coerce(float),
         vol.Optional("strict", default=False): bool,
         vol.Optional("report_errors", default=False): bool,
+        vol.Optional("state_filter"): cv.TEMPLATE_STATE_FILTER_SCHEMA,
     }
 )
 @decorators.async_response
@@ -609,6 +847,13 @@ async def handle_render_template(
         template_obj = _cached_template(template_str, hass)
     variables = msg.get("variables")
     timeout = msg.get("timeout")
+    state_filter = (
+        make_state_filter(
+            state_filter_conf.get(CONF_STATE), state_filter_conf.get(CONF_ATTRIBUTE)
+        )
+        if (state_filter_conf := msg.get("state_filter"))
+        else None
+    )
 
     @callback
     def _error_listener(level: int, template_error: str) -> None:
@@ -657,17 +902,16 @@ async def handle_render_template(
             )
             return
 
-        connection.send_message(
-            messages.event_message(
-                msg["id"], {"result": result, "listeners": info.listeners}
-            )
-        )
+        response: dict[str, Any] = {"result": result, "listeners": info.listeners}
+        if state_filter is not None:
+            response["suppressed_renders"] = info.suppressed_renders[template_obj]
+        connection.send_message(messages.event_message(msg["id"], response))
 
     try:
         log_fn = _error_listener if report_errors else None
         info = async_track_template_result(
             hass,
-            [TrackTemplate(template_obj, variables)],
+            [TrackTemplate(template_obj, variables, state_filter=state_filter)],
             _template_listener,
             strict=msg["strict"],
             log_fn=log_fn,
@@ -856,6 +1100,31 @@ def handle_fire_event(
     connection.send_result(msg["id"], {"context": context})
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "event_bus/profile",
+        vol.Optional("enabled"): bool,
+    }
+)
+@decorators.require_admin
+def handle_event_bus_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle event bus profile command.
+
+    Optionally starts or stops recording the wall time of the event
+    listeners and returns the wall time recorded so far.
+    """
+    listeners = hass.bus.async_listener_profile()
+    if (enabled := msg.get("enabled")) is not None:
+        hass.bus.async_set_listener_profiling(enabled)
+    connection.send_result(
+        msg["id"],
+        {"enabled": hass.bus.listener_profiling, "listeners": listeners},
+    )
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "validate_config",
@@ -28,13 +28,15 @@ from .core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant, callback
 from .core_config import _PACKAGE_DEFINITION_SCHEMA, _PACKAGES_CONFIG_SCHEMA
 from .exceptions import ConfigValidationError, HomeAssistantError
 from .helpers import config_validation as cv
+from .helpers.singleton import singleton
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.async_ import create_eager_task
+from .util.hass_dict import HassKey
 from .util.package import is_docker_env
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import SECRET_YAML, Secrets, YamlCache, YamlTypeError, load_yaml_dict
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,6 +56,8 @@ INTEGRATION_LOAD_EXCEPTIONS = (IntegrationNotFound, RequirementsNotFound)
 
 SAFE_MODE_FILENAME = "safe-mode"
 
+DATA_YAML_CACHE: HassKey[YamlCache] = HassKey("yaml_cache")
+
 DEFAULT_CONFIG = f"""
 # Loads default set of integrations. Do not remove.
 default_config:
@@ -206,13 +210,23 @@ def _write_default_config(config_dir: str) -> bool:
     return True
 
 
+@callback
+@singleton(DATA_YAML_CACHE)
+def async_get_yaml_cache(hass: HomeAssistant) -> YamlCache:
+    """Return the cache of the parsed configuration files.
+
+    Reloads and configuration checks only parse the files which changed.
+    """
+    return YamlCache()
+
+
 async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
     This function allows a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
-    secrets = Secrets(Path(hass.config.config_dir))
+    secrets = Secrets(Path(hass.config.config_dir), async_get_yaml_cache(hass))
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -7,7 +7,8 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+from bisect import bisect_left
+from collections import UserDict, defaultdict, deque
 from collections.abc import (
     Callable,
     Collection,
@@ -18,7 +19,7 @@ from collections.abc import (
     ValuesView,
 )
 import concurrent.futures
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import enum
 import functools
@@ -1449,6 +1450,82 @@ class _OneTimeListener(Generic[_DataT]):
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
+# Upper bounds in seconds of the wall time histogram of profiled listeners
+LISTENER_PROFILE_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+# Number of recent wall times kept per profiled listener for the percentiles
+LISTENER_PROFILE_SAMPLES = 1024
+
+
+@dataclass(slots=True)
+class _ListenerProfile:
+    """Wall time spent running an event listener."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LISTENER_PROFILE_BUCKETS) + 1)
+    )
+    samples: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LISTENER_PROFILE_SAMPLES)
+    )
+
+    def add(self, duration: float) -> None:
+        """Add the wall time of a listener run."""
+        self.count += 1
+        self.total += duration
+        self.max = max(duration, self.max)
+        self.histogram[bisect_left(LISTENER_PROFILE_BUCKETS, duration)] += 1
+        self.samples.append(duration)
+
+    def merge(self, other: _ListenerProfile) -> None:
+        """Merge the wall times of another run of the same listener."""
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        for idx, bucket_count in enumerate(other.histogram):
+            self.histogram[idx] += bucket_count
+        self.samples.extend(other.samples)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the wall times as a dictionary."""
+        samples = sorted(self.samples)
+        last = len(samples) - 1
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count,
+            "max": self.max,
+            "p50": samples[min(int(last * 0.5), last)],
+            "p90": samples[min(int(last * 0.9), last)],
+            "p99": samples[min(int(last * 0.99), last)],
+            "histogram": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(
+                        LISTENER_PROFILE_BUCKETS, self.histogram, strict=False
+                    )
+                },
+                "+Inf": self.histogram[-1],
+            },
+        }
+
+
+def _listener_origin(target: Callable[..., Any]) -> tuple[str, str]:
+    """Return the name of a listener and the integration it belongs to."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    name = getattr(target, "__qualname__", None) or repr(target)
+    module: str = getattr(target, "__module__", None) or ""
+    parts = module.split(".")
+    if module.startswith("homeassistant.components.") and len(parts) > 2:
+        integration = parts[2]
+    elif module.startswith("custom_components.") and len(parts) > 1:
+        integration = parts[1]
+    else:
+        integration = parts[0]
+    return f"{module}.{name}" if module else name, integration
+
 
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
@@ -1460,7 +1537,7 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners", "_profile")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1470,6 +1547,10 @@ class EventBus:
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
+        self._profile: (
+            dict[tuple[EventType[Any] | str, HassJob[..., Any]], _ListenerProfile]
+            | None
+        ) = None
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
 
@@ -1491,6 +1572,53 @@ class EventBus:
         """Return dictionary with events and the number of listeners."""
         return run_callback_threadsafe(self._hass.loop, self.async_listeners).result()
 
+    @property
+    def listener_profiling(self) -> bool:
+        """Return if the wall time of the listeners is being recorded."""
+        return self._profile is not None
+
+    @callback
+    def async_set_listener_profiling(self, enabled: bool) -> None:
+        """Start or stop recording the wall time of the listeners.
+
+        Starting discards the wall times of an earlier run.
+
+        This method must be run in the event loop.
+        """
+        self._profile = {} if enabled else None
+
+    @callback
+    def async_listener_profile(self) -> list[dict[str, Any]]:
+        """Return the recorded wall time of the listeners.
+
+        The wall times of listeners with the same event type, target and
+        integration are combined. The list is sorted by the total wall time.
+        Coroutine listeners are only measured until their first suspension.
+
+        This method must be run in the event loop.
+        """
+        if not self._profile:
+            return []
+        combined: dict[tuple[str, str, str], _ListenerProfile] = {}
+        for (event_type, job), profile in self._profile.items():
+            key = (str(event_type), *_listener_origin(job.target))
+            if (combined_profile := combined.get(key)) is None:
+                combined_profile = combined[key] = _ListenerProfile()
+            combined_profile.merge(profile)
+        return sorted(
+            (
+                {
+                    "event_type": event_type,
+                    "listener": listener,
+                    "integration": integration,
+                    **profile.as_dict(),
+                }
+                for (event_type, listener, integration), profile in combined.items()
+            ),
+            key=lambda listener_profile: listener_profile["total"],
+            reverse=True,
+        )
+
     def fire(
         self,
         event_type: EventType[_DataT] | str,
@@ -1556,6 +1684,7 @@ class EventBus:
             match_all_listeners = EMPTY_LIST
 
         event: Event[_DataT] | None = None
+        profile = self._profile
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
                 try:
@@ -1574,11 +1703,33 @@ class EventBus:
                     context,
                 )
 
+            if profile is not None:
+                self._async_run_profiled_job(profile, event_type, job, event)
+                continue
+
             try:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    def _async_run_profiled_job(
+        self,
+        profile: dict[tuple[EventType[Any] | str, HassJob[..., Any]], _ListenerProfile],
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event: Event[_DataT],
+    ) -> None:
+        """Run a listener and record its wall time."""
+        start = time.perf_counter()
+        try:
+            self._hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", job)
+        duration = time.perf_counter() - start
+        if (listener_profile := profile.get((event_type, job))) is None:
+            listener_profile = profile[(event_type, job)] = _ListenerProfile()
+        listener_profile.add(duration)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -14,6 +14,7 @@ from homeassistant import loader
 from homeassistant.config import (  # type: ignore[attr-defined]
     CONF_PACKAGES,
     YAML_CONFIG_FILE,
+    async_get_yaml_cache,
     config_per_platform,
     extract_domain_configs,
     format_homeassistant_error,
@@ -149,7 +150,9 @@ async def async_check_ha_config_file(  # noqa: C901
         config = await hass.async_add_executor_job(
             load_yaml_config_file,
             config_path,
-            yaml_loader.Secrets(Path(hass.config.config_dir)),
+            yaml_loader.Secrets(
+                Path(hass.config.config_dir), async_get_yaml_cache(hass)
+            ),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
@@ -1336,6 +1336,17 @@ TARGET_SERVICE_FIELDS = {
     ),
 }
 
+# The states of an iterated domain which can change the result of a template
+TEMPLATE_STATE_FILTER_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_STATE): vol.All(ensure_list, [string]),
+            vol.Optional(CONF_ATTRIBUTE): string,
+        }
+    ),
+    has_at_least_one_key(CONF_STATE, CONF_ATTRIBUTE),
+)
+
 
 _HAS_ENTITY_SERVICE_FIELD = has_at_least_one_key(*ENTITY_SERVICE_FIELDS)
 
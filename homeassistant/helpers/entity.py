@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABCMeta
 import asyncio
-from collections import deque
+from collections import Counter, deque
 from collections.abc import Callable, Coroutine, Iterable, Mapping
 import dataclasses
 from enum import Enum, IntFlag, auto
@@ -75,6 +75,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_COLLAPSED_STATE_WRITES = "entity_collapsed_state_writes"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +101,13 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@callback
+@singleton.singleton(DATA_COLLAPSED_STATE_WRITES)
+def async_get_collapsed_state_writes(hass: HomeAssistant) -> Counter[str]:
+    """Get the number of state writes collapsed into another write per entity."""
+    return Counter()
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -473,6 +481,11 @@ class Entity(
     # Protect for multiple updates
     _update_staged = False
 
+    # If set, writing the state is deferred to the end of the current iteration
+    # of the event loop, so writes of the same iteration are collapsed into one
+    _coalesce_state_writes = False
+    _coalesced_write: asyncio.Handle | None = None
+
     # _verified_state_writable is set to True if the entity has been verified
     # to be writable. This is used to avoid repeated checks.
     _verified_state_writable = False
@@ -1020,6 +1033,25 @@ class Entity(
             self._async_verify_state_writable()
         if self.hass.loop_thread_id != threading.get_ident():
             report_non_thread_safe_operation("async_write_ha_state")
+        if self._coalesce_state_writes:
+            self._async_write_ha_state_coalesced()
+            return
+        self._async_write_ha_state()
+
+    @callback
+    def _async_write_ha_state_coalesced(self) -> None:
+        """Write the state at the end of the current iteration of the event loop."""
+        if self._coalesced_write is not None:
+            async_get_collapsed_state_writes(self.hass)[self.entity_id] += 1
+            return
+        self._coalesced_write = self.hass.loop.call_soon(
+            self._async_write_coalesced_state
+        )
+
+    @callback
+    def _async_write_coalesced_state(self) -> None:
+        """Write the state of coalesced writes to the state machine."""
+        self._coalesced_write = None
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import timedelta
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
@@ -47,6 +49,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .singleton import singleton
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -68,9 +71,59 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Weight of the latest poll in the moving average of the poll duration
+POLL_DURATION_SMOOTHING = 0.3
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("entity_platform_poll_scheduler")
+
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
 _LOGGER = getLogger(__name__)
 
 
+@dataclass(slots=True)
+class PollStatistics:
+    """Statistics of the polls of an entity platform."""
+
+    polls: int = 0
+    overruns: int = 0
+    last_duration: float = 0.0
+    average_duration: float = 0.0
+    max_duration: float = 0.0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+
+
+class PollScheduler:
+    """Schedule the polls of all entity platforms.
+
+    Platforms polling at the same interval are started with different phases
+    so they do not all poll at the same moment.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the poll scheduler."""
+        self._platforms_per_interval: defaultdict[float, int] = defaultdict(int)
+
+    @callback
+    def async_first_poll_delay(self, interval: float) -> float:
+        """Return the delay of the first poll of a platform.
+
+        The phases follow the golden ratio sequence which spreads any number
+        of platforms evenly across the interval. The first platform of an
+        interval polls after the full interval and no platform polls later.
+        """
+        count = self._platforms_per_interval[interval]
+        self._platforms_per_interval[interval] += 1
+        return interval * (1 - (count * _GOLDEN_RATIO_CONJUGATE) % 1)
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def _async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler."""
+    return PollScheduler()
+
+
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
 
@@ -151,6 +204,8 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._poll_due: float = 0.0
+        self.poll_statistics = PollStatistics()
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -672,28 +727,39 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
+        self._async_schedule_poll(
+            _async_get_poll_scheduler(self.hass).async_first_poll_delay(
+                self.scan_interval_seconds
+            )
+        )
+
+    @callback
+    def _async_schedule_poll(self, delay: float) -> None:
+        """Schedule the next poll."""
+        self._poll_due = self.hass.loop.time() + delay
+        self._async_polling_timer = self.hass.loop.call_at(
+            self._poll_due, self._async_handle_interval_callback
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
+        poll_due = self._poll_due
+        # Stretch the interval when updating takes longer than it
+        # so polls do not keep overrunning each other
+        self._async_schedule_poll(
+            max(self.scan_interval_seconds, self.poll_statistics.average_duration)
         )
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
-                self._async_update_entity_states(),
+                self._async_update_entity_states(poll_due),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
         else:
             self.hass.async_create_background_task(
-                self._async_update_entity_states(),
+                self._async_update_entity_states(poll_due),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
@@ -1024,7 +1090,7 @@ class EntityPlatform:
             supports_response=supports_response,
         )
 
-    async def _async_update_entity_states(self) -> None:
+    async def _async_update_entity_states(self, poll_due: float | None = None) -> None:
         """Update the states of all the polling entities.
 
         To protect from flooding the executor, we will update async entities
@@ -1032,9 +1098,11 @@ class EntityPlatform:
 
         This method must be run in the event loop.
         """
+        statistics = self.poll_statistics
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
+            statistics.overruns += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -1044,6 +1112,19 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
+            await self._async_poll_entities(poll_due)
+
+    async def _async_poll_entities(self, poll_due: float | None) -> None:
+        """Poll the entities and record the statistics of the poll."""
+        loop = self.hass.loop
+        statistics = self.poll_statistics
+        start = loop.time()
+        if poll_due is not None:
+            statistics.last_latency = max(start - poll_due, 0.0)
+            statistics.max_latency = max(
+                statistics.max_latency, statistics.last_latency
+            )
+        try:
             if self._update_in_sequence or len(self.entities) <= 1:
                 # If we know we will update sequentially, we want to avoid scheduling
                 # the coroutines as tasks that will wait on the semaphore lock.
@@ -1056,13 +1137,22 @@ class EntityPlatform:
                 return
 
             if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
+                create_eager_task(entity.async_update_ha_state(True), loop=loop)
                 for entity in self.entities.values()
                 if entity.should_poll
             ]:
                 await asyncio.gather(*tasks)
+        finally:
+            duration = loop.time() - start
+            statistics.polls += 1
+            statistics.last_duration = duration
+            statistics.max_duration = max(statistics.max_duration, duration)
+            if statistics.polls == 1:
+                statistics.average_duration = duration
+            else:
+                statistics.average_duration += POLL_DURATION_SMOOTHING * (
+                    duration - statistics.average_duration
+                )
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -1090,3 +1180,18 @@ def async_get_platforms(
         return []
 
     return hass.data[DATA_ENTITY_PLATFORM][integration_name]
+
+
+@callback
+def async_get_polling_platforms(hass: HomeAssistant) -> list[EntityPlatform]:
+    """Return the entity platforms which polled, slowest first."""
+    return sorted(
+        (
+            platform
+            for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+            for platform in platforms
+            if platform.poll_statistics.polls
+        ),
+        key=lambda platform: platform.poll_statistics.average_duration,
+        reverse=True,
+    )
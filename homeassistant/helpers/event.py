@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Collection, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -145,11 +145,16 @@ class TrackTemplate:
     The template is template to calculate.
     The variables are variables to pass to the template.
     The rate_limit is a rate limit on how often the template is re-rendered.
+    The state_filter declares which states of the domains the template iterates
+    can affect its result. A change of an entity in an iterated domain only
+    re-renders the template if the old or the new state passes the filter,
+    entities the template references directly are not filtered.
     """
 
     template: Template
     variables: TemplateVarsType
     rate_limit: float | None = None
+    state_filter: Callable[[State], bool] | None = None
 
 
 @dataclass(slots=True)
@@ -1004,6 +1009,7 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        self.suppressed_renders: defaultdict[Template, int] = defaultdict(int)
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -1150,6 +1156,17 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if (
+                state_filter := track_template_.state_filter
+            ) is not None and not _event_passes_state_filter(event, info, state_filter):
+                self.suppressed_renders[template] += 1
+                _LOGGER.debug(
+                    "Template update %s suppressed by state filter for event: %s",
+                    template.template,
+                    event,
+                )
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1979,6 +1996,50 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _event_passes_state_filter(
+    event: Event[EventStateChangedData],
+    info: RenderInfo,
+    state_filter: Callable[[State], bool],
+) -> bool:
+    """Determine if a state filter lets an event re-render a template."""
+    entity_id = event.data["entity_id"]
+    domain = split_entity_id(entity_id)[0]
+
+    # Only changes seen through iterating a domain or all states are filtered,
+    # entities the template references directly always re-render it
+    if entity_id in info.entities or not (
+        info.all_states
+        or info.all_states_lifecycle
+        or domain in info.domains
+        or domain in info.domains_lifecycle
+    ):
+        return True
+
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
+    return (old_state is not None and state_filter(old_state)) or (
+        new_state is not None and state_filter(new_state)
+    )
+
+
+def make_state_filter(
+    states: Collection[str] | None = None, attribute: str | None = None
+) -> Callable[[State], bool]:
+    """Return a state filter for TrackTemplate.
+
+    A state passes the filter if its value is one of the states and it has
+    the attribute, a filter without states or attribute matches any value.
+    """
+
+    def _state_filter(state: State) -> bool:
+        return (states is None or state.state in states) and (
+            attribute is None or attribute in state.attributes
+        )
+
+    return _state_filter
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
@@ -31,11 +31,34 @@ DATA_INTEGRATION_PLATFORMS: HassKey[list[IntegrationPlatform]] = HassKey(
 
 @dataclass(slots=True, frozen=True)
 class IntegrationPlatform:
-    """An integration platform."""
+    """An integration platform.
+
+    The deferred components are the integrations with the platform which was
+    not imported yet, it is None when the platforms are imported as soon as
+    the integrations are loaded.
+    """
 
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    deferred_components: set[str] | None = None
+    deferred_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+@callback
+def _async_defer_platform(
+    integration: Integration, integration_platform: IntegrationPlatform
+) -> bool:
+    """Defer the import of a platform until it is first used.
+
+    Platforms which are already imported are not deferred.
+    """
+    if (
+        deferred_components := integration_platform.deferred_components
+    ) is None or integration.get_platform_cached(integration_platform.platform_name):
+        return False
+    deferred_components.add(integration.domain)
+    return True
 
 
 @callback
@@ -62,8 +85,15 @@ def _async_integration_platform_component_loaded(
     if not integration_platforms_by_name:
         return
 
-    # Next, check which platforms exist for this integration.
-    platforms_that_exist = integration.platforms_exists(integration_platforms_by_name)
+    # Next, check which platforms exist for this integration and
+    # have to be imported now.
+    platforms_that_exist = [
+        platform_name
+        for platform_name in integration.platforms_exists(integration_platforms_by_name)
+        if not _async_defer_platform(
+            integration, integration_platforms_by_name[platform_name]
+        )
+    ]
     if not platforms_that_exist:
         return
 
@@ -160,8 +190,14 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    defer_imports: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    With defer_imports, platforms which are not imported yet are only imported
+    and processed when async_process_deferred_integration_platforms is called
+    before the platforms are used.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,10 +211,11 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    # Tell the loader that it should try to pre-load the integration
-    # for any future components that are loaded so we can reduce the
-    # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
+    if not defer_imports:
+        # Tell the loader that it should try to pre-load the integration
+        # for any future components that are loaded so we can reduce the
+        # amount of import executor usage.
+        async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -188,7 +225,10 @@ async def async_process_integration_platforms(
         f"process_platform {platform_name}",
     )
     integration_platform = IntegrationPlatform(
-        platform_name, process_job, top_level_components
+        platform_name,
+        process_job,
+        top_level_components,
+        set() if defer_imports else None,
     )
     integration_platforms.append(integration_platform)
     if not top_level_components:
@@ -209,7 +249,7 @@ async def async_process_integration_platforms(
     #
     future = hass.async_create_task_internal(
         _async_process_integration_platforms(
-            hass, platform_name, top_level_components.copy(), process_job
+            hass, integration_platform, top_level_components.copy(), True
         ),
         eager_start=True,
     )
@@ -217,13 +257,36 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_process_deferred_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Import and process the deferred platforms of the loaded integrations."""
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if (
+            integration_platform.platform_name != platform_name
+            or integration_platform.deferred_components is None
+        ):
+            continue
+        # Wait for a processing which already started so the platforms
+        # are processed when this returns
+        async with integration_platform.deferred_lock:
+            if not (components := integration_platform.deferred_components.copy()):
+                continue
+            integration_platform.deferred_components.clear()
+            await _async_process_integration_platforms(
+                hass, integration_platform, components, False
+            )
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
-    platform_name: str,
+    integration_platform: IntegrationPlatform,
     top_level_components: set[str],
-    process_job: HassJob,
+    defer: bool,
 ) -> None:
     """Process integration platforms for a component."""
+    platform_name = integration_platform.platform_name
+    process_job = integration_platform.process_job
     integrations = await async_get_integrations(hass, top_level_components)
     loaded_integrations: list[Integration] = [
         integration
@@ -236,7 +299,9 @@ async def _async_process_integration_platforms(
     # this could be a bottleneck.
     futures: list[asyncio.Future[None]] = []
     for integration in loaded_integrations:
-        if not integration.platforms_exists((platform_name,)):
+        if not integration.platforms_exists((platform_name,)) or (
+            defer and _async_defer_platform(integration, integration_platform)
+        ):
             continue
         try:
             platform = await integration.async_get_platform(platform_name)
@@ -199,8 +199,8 @@ def save_json(
     *,
     encoder: type[json.JSONEncoder] | None = None,
     atomic_writes: bool = False,
-) -> None:
-    """Save JSON data to a file."""
+) -> str | bytes:
+    """Save JSON data to a file and return the written JSON."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -226,6 +226,7 @@ def save_json(
 
     method = write_utf8_file_atomic if atomic_writes else write_utf8_file
     method(filename, json_data, private, mode=mode)
+    return json_data
 
 
 def find_paths_unserializable_data(
@@ -60,6 +60,7 @@ from . import (
     entity_registry,
     floor_registry,
     label_registry,
+    target_index,
     template,
     translation,
 )
@@ -527,7 +528,6 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
@@ -545,32 +545,23 @@ def async_extract_referenced_entity_ids(  # noqa: C901
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
+    index = target_index.async_get(hass)
+
     if selector.label_ids:
         label_reg = label_registry.async_get(hass)
         for label_id in selector.label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
+            selected.indirectly_referenced.update(
+                index.async_label_entities(label_id, targetable=True)
+            )
+            selected.referenced_devices.update(index.async_label_devices(label_id))
+            selected.referenced_areas.update(index.async_label_areas(label_id))
 
     # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
+    for floor_id in selector.floor_ids:
+        selected.referenced_areas.update(index.async_floor_areas(floor_id))
 
     selected.referenced_areas.update(selector.area_ids)
     selected.referenced_devices.update(selector.device_ids)
@@ -579,53 +570,17 @@ def async_extract_referenced_entity_ids(  # noqa: C901
         return selected
 
     # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (entry.entity_category is None and entry.hidden_by is None)
-    )
-
-    # Find devices for targeted areas
-    referenced_devices_by_area: set[str] = set()
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            referenced_devices_by_area.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
-    selected.referenced_devices.update(referenced_devices_by_area)
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by area through device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in referenced_devices_by_area
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-            )
+    for device_id in selected.referenced_devices:
+        selected.indirectly_referenced.update(index.async_device_entities(device_id))
+
+    for area_id in selected.referenced_areas:
+        # Find devices for targeted areas
+        selected.referenced_devices.update(index.async_area_devices(area_id))
+        # Add indirectly referenced by area, and by area through a device
+        # for entities which have no explicitly set area
+        selected.indirectly_referenced.update(
+            index.async_area_entities(area_id, targetable=True)
         )
-    )
 
     return selected
 
@@ -9,6 +9,7 @@ from copy import deepcopy
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
 import os
 from pathlib import Path
 from typing import Any
@@ -32,7 +33,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -49,6 +50,52 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_VERSION = 1
+
+
+def _load_json_or_snapshot(path: str | Path) -> json_util.JsonValueType:
+    """Load a storage file, using its snapshot if it is up to date.
+
+    The snapshot holds the data of the storage file in the marshal format,
+    which loads considerably faster than JSON. It is only used when the size
+    and modification time of the storage file match those it was made from,
+    so a storage file changed by anything but the Store is parsed again.
+    """
+    try:
+        stat = os.stat(path)
+        with open(f"{path}{SNAPSHOT_SUFFIX}", "rb") as snapshot_file:
+            version, size, mtime_ns, data = marshal.load(snapshot_file)
+    except (OSError, EOFError, TypeError, ValueError):
+        pass
+    else:
+        if (
+            version == SNAPSHOT_VERSION
+            and size == stat.st_size
+            and mtime_ns == stat.st_mtime_ns
+        ):
+            return data
+        _LOGGER.debug("Ignoring stale snapshot of %s", path)
+    return json_util.load_json(path)
+
+
+def _write_snapshot(path: str, json_data: str | bytes, private: bool) -> None:
+    """Write the snapshot of a storage file from the JSON written to it.
+
+    The JSON is parsed in memory rather than marshalling the data given to the
+    Store, as loading the snapshot must return exactly what loading the JSON
+    returns, after the encoder converted objects and tuples became lists.
+    """
+    data = json_util.json_loads(json_data)
+    # Taken after the storage file was written, to match it when loading
+    stat = os.stat(path)
+    write_utf8_file(
+        f"{path}{SNAPSHOT_SUFFIX}",
+        marshal.dumps((SNAPSHOT_VERSION, stat.st_size, stat.st_mtime_ns, data)),
+        private,
+        mode="wb",
+    )
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -213,10 +260,15 @@ class _StoreManager:
         """Cache the keys."""
         storage_path = self._storage_path
         data_preload = self._data_preload
+        files = self._files or set()
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
             try:
-                if storage_file.is_file():
+                if not storage_file.is_file():
+                    continue
+                if f"{key}{SNAPSHOT_SUFFIX}" in files:
+                    data_preload[key] = _load_json_or_snapshot(storage_file)
+                else:
                     data_preload[key] = json_util.load_json(storage_file)
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
@@ -242,8 +294,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        snapshot: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With snapshot, a snapshot of the data that loads faster than JSON is
+        written next to the storage file and used when loading.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -257,6 +314,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._snapshot = snapshot
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
 
@@ -329,7 +387,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    _load_json_or_snapshot if self._snapshot else json_util.load_json,
+                    self.path,
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -553,13 +612,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             data["data"] = data.pop("data_func")()
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
+        json_data = json_helper.save_json(
             path,
             data,
             self._private,
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._snapshot:
+            try:
+                _write_snapshot(path, json_data, self._private)
+            except (HomeAssistantError, OSError, ValueError) as err:
+                # The stale snapshot will be ignored when loading
+                _LOGGER.warning("Error writing snapshot for %s: %s", self.key, err)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +638,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._snapshot:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{SNAPSHOT_SUFFIX}"
+                )
@@ -0,0 +1,283 @@
+"""Index of the areas, devices and entities targeted by floors, areas and labels.
+
+Resolving a floor, area, label or device to the entities it contains walks
+the area, device and entity registries. The index caches the results of these
+lookups and drops them when the registries they were derived from change.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import area_registry as ar, device_registry as dr, entity_registry as er
+from .singleton import singleton
+
+DATA_TARGET_INDEX: HassKey[TargetIndex] = HassKey("target_index")
+
+# Changes of entity and device registry entries which affect the index
+ENTITY_INDEX_CHANGES = frozenset(
+    {
+        "area_id",
+        "device_id",
+        "disabled_by",
+        "entity_category",
+        "entity_id",
+        "hidden_by",
+        "labels",
+    }
+)
+DEVICE_INDEX_CHANGES = frozenset({"area_id", "labels"})
+
+
+def _targetable(entry: er.RegistryEntry) -> bool:
+    """Return if an entity is targeted when its area, device or label is.
+
+    Entities which are hidden, or which are config or diagnostic entities,
+    are only targeted when referenced directly.
+    """
+    return entry.entity_category is None and entry.hidden_by is None
+
+
+class TargetIndex:
+    """Cache floor, area, label and device lookups of the registries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the target index."""
+        self.hass = hass
+        self._registries: tuple[Any, ...] = ()
+        # Lookups derived from the entity registry, and the device registry
+        # for the entities which inherit the area of their device
+        self._entity_lookups: dict[tuple[str, str], tuple[str, ...]] = {}
+        # Lookups derived from the device registry
+        self._device_lookups: dict[tuple[str, str], tuple[str, ...]] = {}
+        # Lookups derived from the area registry
+        self._area_lookups: dict[tuple[str, str], tuple[str, ...]] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for changes of the registries."""
+        bus = self.hass.bus
+        bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+        bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
+        bus.async_listen(
+            ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_registry_updated
+        )
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Drop the lookups derived from the entity registry."""
+        data = event.data
+        if data["action"] == "update" and ENTITY_INDEX_CHANGES.isdisjoint(
+            data["changes"]
+        ):
+            return
+        self._entity_lookups.clear()
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Drop the lookups derived from the device registry."""
+        data = event.data
+        if data["action"] == "update" and DEVICE_INDEX_CHANGES.isdisjoint(
+            data["changes"]
+        ):
+            return
+        self._device_lookups.clear()
+        self._entity_lookups.clear()
+
+    @callback
+    def _async_area_registry_updated(
+        self, event: Event[ar.EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Drop the lookups derived from the area registry."""
+        self._area_lookups.clear()
+
+    @callback
+    def _async_check_registries(self) -> None:
+        """Drop all lookups if a registry was replaced since they were cached."""
+        registries = (
+            er.async_get(self.hass),
+            dr.async_get(self.hass),
+            ar.async_get(self.hass),
+        )
+        if registries != self._registries:
+            self._registries = registries
+            self._entity_lookups.clear()
+            self._device_lookups.clear()
+            self._area_lookups.clear()
+
+    @callback
+    def _async_lookup(
+        self,
+        lookups: dict[tuple[str, str], tuple[str, ...]],
+        key: tuple[str, str],
+        resolve: Callable[[str], Iterable[str]],
+    ) -> tuple[str, ...]:
+        """Return a cached lookup, resolving it if it is not cached."""
+        self._async_check_registries()
+        if (result := lookups.get(key)) is None:
+            result = lookups[key] = tuple(resolve(key[1]))
+        return result
+
+    @callback
+    def async_floor_areas(self, floor_id: str) -> tuple[str, ...]:
+        """Return the IDs of the areas on a floor."""
+        return self._async_lookup(
+            self._area_lookups, ("floor", floor_id), self._resolve_floor_areas
+        )
+
+    @callback
+    def async_label_areas(self, label_id: str) -> tuple[str, ...]:
+        """Return the IDs of the areas with a label."""
+        return self._async_lookup(
+            self._area_lookups, ("label", label_id), self._resolve_label_areas
+        )
+
+    @callback
+    def async_area_devices(self, area_id: str) -> tuple[str, ...]:
+        """Return the IDs of the devices in an area."""
+        return self._async_lookup(
+            self._device_lookups, ("area", area_id), self._resolve_area_devices
+        )
+
+    @callback
+    def async_label_devices(self, label_id: str) -> tuple[str, ...]:
+        """Return the IDs of the devices with a label."""
+        return self._async_lookup(
+            self._device_lookups, ("label", label_id), self._resolve_label_devices
+        )
+
+    @callback
+    def async_area_entities(
+        self, area_id: str, targetable: bool = False
+    ) -> tuple[str, ...]:
+        """Return the entity IDs in an area.
+
+        Entities of a device in the area are included unless they have an area
+        of their own. If targetable is set, only entities which are targeted
+        by the area are returned.
+        """
+        if targetable:
+            return self._async_lookup(
+                self._entity_lookups,
+                ("area_targetable", area_id),
+                self._resolve_area_targetable_entities,
+            )
+        return self._async_lookup(
+            self._entity_lookups, ("area", area_id), self._resolve_area_entities
+        )
+
+    @callback
+    def async_device_entities(self, device_id: str) -> tuple[str, ...]:
+        """Return the entity IDs targeted by a device."""
+        return self._async_lookup(
+            self._entity_lookups,
+            ("device_targetable", device_id),
+            self._resolve_device_targetable_entities,
+        )
+
+    @callback
+    def async_label_entities(
+        self, label_id: str, targetable: bool = False
+    ) -> tuple[str, ...]:
+        """Return the entity IDs with a label.
+
+        If targetable is set, only entities which are targeted by the label
+        are returned.
+        """
+        if targetable:
+            return self._async_lookup(
+                self._entity_lookups,
+                ("label_targetable", label_id),
+                self._resolve_label_targetable_entities,
+            )
+        return self._async_lookup(
+            self._entity_lookups, ("label", label_id), self._resolve_label_entities
+        )
+
+    def _resolve_floor_areas(self, floor_id: str) -> Iterable[str]:
+        """Resolve the IDs of the areas on a floor."""
+        areas = ar.async_get(self.hass).areas
+        return [entry.id for entry in areas.get_areas_for_floor(floor_id)]
+
+    def _resolve_label_areas(self, label_id: str) -> Iterable[str]:
+        """Resolve the IDs of the areas with a label."""
+        areas = ar.async_get(self.hass).areas
+        return [entry.id for entry in areas.get_areas_for_label(label_id)]
+
+    def _resolve_area_devices(self, area_id: str) -> Iterable[str]:
+        """Resolve the IDs of the devices in an area."""
+        devices = dr.async_get(self.hass).devices
+        return [entry.id for entry in devices.get_devices_for_area_id(area_id)]
+
+    def _resolve_label_devices(self, label_id: str) -> Iterable[str]:
+        """Resolve the IDs of the devices with a label."""
+        devices = dr.async_get(self.hass).devices
+        return [entry.id for entry in devices.get_devices_for_label(label_id)]
+
+    def _area_entries(self, area_id: str) -> list[er.RegistryEntry]:
+        """Return the entries in an area, directly or through their device."""
+        entities = er.async_get(self.hass).entities
+        entries = entities.get_entries_for_area_id(area_id)
+        entries.extend(
+            entry
+            for device_id in self.async_area_devices(area_id)
+            for entry in entities.get_entries_for_device_id(device_id)
+            if entry.area_id is None
+        )
+        return entries
+
+    def _resolve_area_entities(self, area_id: str) -> Iterable[str]:
+        """Resolve the entity IDs in an area."""
+        return [entry.entity_id for entry in self._area_entries(area_id)]
+
+    def _resolve_area_targetable_entities(self, area_id: str) -> Iterable[str]:
+        """Resolve the entity IDs targeted by an area."""
+        return [
+            entry.entity_id
+            for entry in self._area_entries(area_id)
+            if _targetable(entry)
+        ]
+
+    def _resolve_device_targetable_entities(self, device_id: str) -> Iterable[str]:
+        """Resolve the entity IDs targeted by a device."""
+        entities = er.async_get(self.hass).entities
+        return [
+            entry.entity_id
+            for entry in entities.get_entries_for_device_id(device_id)
+            if _targetable(entry)
+        ]
+
+    def _resolve_label_entities(self, label_id: str) -> Iterable[str]:
+        """Resolve the entity IDs with a label."""
+        entities = er.async_get(self.hass).entities
+        return [entry.entity_id for entry in entities.get_entries_for_label(label_id)]
+
+    def _resolve_label_targetable_entities(self, label_id: str) -> Iterable[str]:
+        """Resolve the entity IDs targeted by a label."""
+        entities = er.async_get(self.hass).entities
+        return [
+            entry.entity_id
+            for entry in entities.get_entries_for_label(label_id)
+            if _targetable(entry)
+        ]
+
+
+@callback
+@singleton(DATA_TARGET_INDEX)
+def async_get(hass: HomeAssistant) -> TargetIndex:
+    """Return the target index."""
+    index = TargetIndex(hass)
+    index.async_setup()
+    return index
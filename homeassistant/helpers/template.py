@@ -14,6 +14,7 @@ from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -34,11 +35,11 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.bccache import bc_magic
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -54,10 +55,12 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -91,6 +94,7 @@ from . import (
     issue_registry,
     label_registry,
     location as loc_helper,
+    target_index,
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
@@ -171,6 +175,23 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# Compiled templates are shared by all Template instances and environments
+# of the same flavor. Configurations generated from blueprints and packages
+# often contain the same template string many times, which only needs to
+# be compiled once.
+#
+# The compiled code of the templates is persisted to storage after startup
+# so the next start does not need to compile them again.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 2048
+COMPILED_TEMPLATE_CACHE: LRU[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+COMPILED_TEMPLATE_STORAGE_KEY = "core.template_cache"
+COMPILED_TEMPLATE_STORAGE_VERSION = 1
+COMPILED_TEMPLATE_SAVE_DELAY = 60
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -577,10 +598,6 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
-            self._compiled_code = compiled
-            return
-
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
@@ -1520,9 +1537,7 @@ def floor_areas(hass: HomeAssistant, floor_id_or_name: str) -> Iterable[str]:
     if _floor_id is None:
         return []
 
-    area_reg = area_registry.async_get(hass)
-    entries = area_registry.async_entries_for_floor(area_reg, _floor_id)
-    return [entry.id for entry in entries if entry.id]
+    return list(target_index.async_get(hass).async_floor_areas(_floor_id))
 
 
 def areas(hass: HomeAssistant) -> Iterable[str | None]:
@@ -1614,23 +1629,9 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id_or_name
     if _area_id is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
-    dev_reg = device_registry.async_get(hass)
-    # We also need to add entities tied to a device in the area that don't themselves
-    # have an area specified since they inherit the area from the device.
-    entity_ids.extend(
-        [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
-        ]
-    )
-    return entity_ids
+    # The index includes entities tied to a device in the area that don't
+    # themselves have an area specified since they inherit the area from the device.
+    return list(target_index.async_get(hass).async_area_entities(_area_id))
 
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
@@ -1644,9 +1645,7 @@ def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id(hass, area_id_or_name)
     if _area_id is None:
         return []
-    dev_reg = device_registry.async_get(hass)
-    entries = device_registry.async_entries_for_area(dev_reg, _area_id)
-    return [entry.id for entry in entries]
+    return list(target_index.async_get(hass).async_area_devices(_area_id))
 
 
 def labels(hass: HomeAssistant, lookup_value: Any = None) -> Iterable[str | None]:
@@ -1712,27 +1711,21 @@ def label_areas(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     """Return areas for a given label ID or name."""
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
-    area_reg = area_registry.async_get(hass)
-    entries = area_registry.async_entries_for_label(area_reg, _label_id)
-    return [entry.id for entry in entries]
+    return list(target_index.async_get(hass).async_label_areas(_label_id))
 
 
 def label_devices(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     """Return device IDs for a given label ID or name."""
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
-    dev_reg = device_registry.async_get(hass)
-    entries = device_registry.async_entries_for_label(dev_reg, _label_id)
-    return [entry.id for entry in entries]
+    return list(target_index.async_get(hass).async_label_devices(_label_id))
 
 
 def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     """Return entities for a given label ID or name."""
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_label(ent_reg, _label_id)
-    return [entry.entity_id for entry in entries]
+    return list(target_index.async_get(hass).async_label_entities(_label_id))
 
 
 def closest(hass, *args):
@@ -2797,6 +2790,59 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+async def async_load_compiled_templates(hass: HomeAssistant) -> None:
+    """Load the persisted compiled templates into the compiled template cache."""
+    # pylint: disable-next=import-outside-toplevel
+    from .storage import Store
+
+    store = Store[dict[str, Any]](
+        hass, COMPILED_TEMPLATE_STORAGE_VERSION, COMPILED_TEMPLATE_STORAGE_KEY, True
+    )
+    data = await store.async_load()
+    # The code objects can only be loaded by the Python and Jinja versions
+    # that compiled them, and are compiled again after an upgrade to pick up
+    # changes to the filters, tests and sandbox of the template environment.
+    if (
+        data is not None
+        and data.get("magic") == bc_magic.hex()
+        and data.get("ha_version") == __version__
+    ):
+        for flavor, source, code in data["templates"]:
+            key = (flavor, source)
+            if key in COMPILED_TEMPLATE_CACHE:
+                continue
+            try:
+                compiled = marshal.loads(base64.b64decode(code))
+            except (EOFError, TypeError, ValueError):
+                _LOGGER.debug("Discarding invalid compiled template: %s", source)
+                continue
+            if isinstance(compiled, CodeType):
+                COMPILED_TEMPLATE_CACHE[key] = compiled
+    elif data is not None:
+        await store.async_remove()
+
+    @callback
+    def _data_to_save() -> dict[str, Any]:
+        """Return the compiled templates to persist."""
+        return {
+            "magic": bc_magic.hex(),
+            "ha_version": __version__,
+            "templates": [
+                (flavor, source, base64.b64encode(marshal.dumps(compiled)).decode())
+                for (flavor, source), compiled in COMPILED_TEMPLATE_CACHE.items()
+            ],
+        }
+
+    @callback
+    def _async_save_compiled_templates(_: Any) -> None:
+        """Persist the templates compiled during startup."""
+        store.async_delay_save(_data_to_save, COMPILED_TEMPLATE_SAVE_DELAY)
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STARTED, _async_save_compiled_templates
+    )
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2864,9 +2910,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        if hass is None:
+            self.template_flavor = "no_hass"
+        elif limited:
+            self.template_flavor = "limited"
+        elif strict:
+            self.template_flavor = "strict"
+        else:
+            self.template_flavor = "normal"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3203,7 +3254,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
     ) -> CodeType | str:
         """Compile the template."""
         if (
-            name is not None
+            not isinstance(source, str)
+            or name is not None
             or filename is not None
             or raw is not False
             or defer_init is not False
@@ -3219,8 +3271,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        key = (self.template_flavor, source)
+        if (compiled := COMPILED_TEMPLATE_CACHE.get(key)) is None:
+            compiled = COMPILED_TEMPLATE_CACHE[key] = super().compile(source)
         return compiled
 
 
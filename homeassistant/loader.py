@@ -9,13 +9,17 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
+from copy import deepcopy
 from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+from operator import attrgetter
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,7 +33,7 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +53,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -68,7 +73,6 @@ BASE_PRELOAD_PLATFORMS = [
     "backup",
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "hardware",
@@ -133,6 +137,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_INTEGRATION_INDEX: HassKey[IntegrationIndex] = HassKey("integration_index")
+DATA_IMPORT_TIMINGS: HassKey[list[ImportTiming]] = HassKey("import_timings")
+INDEX_STORAGE_KEY = "core.integration_index"
+INDEX_STORAGE_VERSION = 1
+INDEX_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -210,6 +219,18 @@ class USBMatcher(USBMatcherRequired, USBMatcherOptional):
     """Matcher for the USB integration."""
 
 
+@dataclass(slots=True, frozen=True)
+class ImportTiming:
+    """Time it took to import a module of an integration."""
+
+    module: str
+    domain: str
+    seconds: float
+    # Number of modules imported along with the module
+    modules_loaded: int
+    event_loop: bool
+
+
 @dataclass(slots=True)
 class HomeKitDiscoveredIntegration:
     """HomeKit model."""
@@ -271,6 +292,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = []
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -645,6 +667,131 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+class IntegrationIndex:
+    """Index of the manifests and top level files of the integrations.
+
+    Resolving an integration reads its manifest and lists its directory. The
+    index keeps the results from the previous start, so they are only read
+    again for the integrations which changed since. An entry is valid as long
+    as the modification time of the integration directory and the
+    modification time and size of the manifest are unchanged, the whole index
+    is dropped when Home Assistant is updated.
+
+    Entries are looked up and added from the executor, so all access is
+    guarded by a lock.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: Store[dict[str, Any]]) -> None:
+        """Initialize the integration index."""
+        self._hass = hass
+        self._store = store
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the index of the previous start."""
+        data = await self._store.async_load()
+        if data is not None and data.get("ha_version") == __version__:
+            self._entries = data["integrations"]
+
+    @staticmethod
+    def _fingerprint(file_path: pathlib.Path) -> list[int] | None:
+        """Return the fingerprint of an integration, None if it has no manifest."""
+        try:
+            manifest_stat = os.stat(file_path / "manifest.json")
+            dir_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(manifest_stat.st_mode):
+            return None
+        return [dir_stat.st_mtime_ns, manifest_stat.st_mtime_ns, manifest_stat.st_size]
+
+    def get(
+        self, file_path: pathlib.Path
+    ) -> tuple[list[int] | None, tuple[Manifest, set[str] | None] | None]:
+        """Return the fingerprint and the indexed manifest and files of a path.
+
+        The manifest and files are None if they were not indexed or changed
+        since they were indexed, the fingerprint is None if the path is not an
+        integration.
+        """
+        key = str(file_path)
+        if (fingerprint := self._fingerprint(file_path)) is None:
+            with self._lock:
+                if self._entries.pop(key, None) is not None:
+                    self._async_schedule_save_threadsafe()
+            return None, None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return fingerprint, None
+        files = entry["files"]
+        return fingerprint, (
+            cast(Manifest, deepcopy(entry["manifest"])),
+            None if files is None else set(files),
+        )
+
+    def set(
+        self,
+        file_path: pathlib.Path,
+        fingerprint: list[int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Add the manifest and files of an integration to the index."""
+        entry = {
+            "fingerprint": fingerprint,
+            "manifest": deepcopy(manifest),
+            "files": None if top_level_files is None else sorted(top_level_files),
+        }
+        with self._lock:
+            self._entries[str(file_path)] = entry
+        self._async_schedule_save_threadsafe()
+
+    def _async_schedule_save_threadsafe(self) -> None:
+        """Schedule saving the index from any thread."""
+        self._hass.loop.call_soon_threadsafe(
+            self._store.async_delay_save, self._data_to_save, INDEX_SAVE_DELAY
+        )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        with self._lock:
+            return {"ha_version": __version__, "integrations": dict(self._entries)}
+
+
+async def async_load_integration_index(hass: HomeAssistant) -> None:
+    """Load the integration index, so resolving integrations consults it first."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    index = IntegrationIndex(
+        hass,
+        Store[dict[str, Any]](
+            hass, INDEX_STORAGE_VERSION, INDEX_STORAGE_KEY, private=True
+        ),
+    )
+    await index.async_load()
+    hass.data[DATA_INTEGRATION_INDEX] = index
+
+
+def _read_manifest(
+    file_path: pathlib.Path,
+) -> tuple[Manifest, set[str] | None] | None:
+    """Read the manifest and list the top level files of an integration."""
+    manifest_path = file_path / "manifest.json"
+    try:
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+    except JSON_DECODE_EXCEPTIONS as err:
+        _LOGGER.error("Error parsing manifest.json file at %s: %s", manifest_path, err)
+        return None
+    # Avoid the listdir for virtual integrations
+    # as they cannot have any platforms
+    if manifest.get("integration_type") == "virtual":
+        return manifest, None
+    return manifest, set(os.listdir(file_path))
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -653,30 +800,31 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index = hass.data.get(DATA_INTEGRATION_INDEX)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
+            file_path = pathlib.Path(base) / domain
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
-
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            if index is None:
+                if not (file_path / "manifest.json").is_file():
+                    continue
+                if (manifest_and_files := _read_manifest(file_path)) is None:
+                    continue
+            else:
+                fingerprint, manifest_and_files = index.get(file_path)
+                if fingerprint is None:
+                    continue
+                if manifest_and_files is None:
+                    if (manifest_and_files := _read_manifest(file_path)) is None:
+                        continue
+                    index.set(file_path, fingerprint, *manifest_and_files)
+
+            manifest, top_level_files = manifest_and_files
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1072,7 +1220,8 @@ class Integration:
         domain = self.domain
         try:
             cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol,
+                _import_module_timed(self.hass, self.pkg_path, domain),
             )
         except ImportError:
             raise
@@ -1301,7 +1450,9 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module_timed(
+            self.hass, f"{self.pkg_path}.{platform_name}", self.domain
+        )
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -1467,6 +1618,38 @@ class CircularDependency(LoaderError):
         self.to_domain = to_domain
 
 
+def _import_module_timed(hass: HomeAssistant, name: str, domain: str) -> ModuleType:
+    """Import a module, recording the time it took if it was not imported yet.
+
+    This method must be thread-safe as it's called from the executor
+    and the event loop.
+    """
+    if name in sys.modules:
+        return importlib.import_module(name)
+    modules_before = len(sys.modules)
+    start = time.perf_counter()
+    try:
+        return importlib.import_module(name)
+    finally:
+        hass.data[DATA_IMPORT_TIMINGS].append(
+            ImportTiming(
+                name,
+                domain,
+                time.perf_counter() - start,
+                len(sys.modules) - modules_before,
+                threading.get_ident() == hass.loop_thread_id,
+            )
+        )
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> list[ImportTiming]:
+    """Return the modules imported for the integrations, slowest first."""
+    return sorted(
+        hass.data[DATA_IMPORT_TIMINGS], key=attrgetter("seconds"), reverse=True
+    )
+
+
 def _load_file(
     hass: HomeAssistant, comp_or_platform: str, base_paths: list[str]
 ) -> ComponentProtocol | None:
@@ -1482,7 +1665,9 @@ def _load_file(
 
     for path in (f"{base}.{comp_or_platform}" for base in base_paths):
         try:
-            module = importlib.import_module(path)
+            module = _import_module_timed(
+                hass, path, comp_or_platform.partition(".")[0]
+            )
 
             # In Python 3 you can import files from directories that do not
             # contain the file __init__.py. A directory is a valid module if
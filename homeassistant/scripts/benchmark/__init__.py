@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import random
+import statistics
 from timeit import default_timer as timer
 
 from homeassistant import core
+from homeassistant.components.statistics.samples import SampleBuffer
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -308,3 +312,41 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def statistics_sample_buffer(hass):
+    """Update the standard deviation and median of 2000 samples at buffer sizes.
+
+    Compares recalculating from all samples with the running aggregates.
+    """
+    samples_to_add = 2000
+    values = [random.uniform(0, 100) for _ in range(samples_to_add)]
+    total = 0.0
+
+    for buffer_size in (100, 1000, 10000):
+        states: deque[float] = deque(maxlen=buffer_size)
+        start = timer()
+        for value in values:
+            states.append(value)
+            if len(states) >= 2:
+                statistics.stdev(states)
+                statistics.median(states)
+        recalculate = timer() - start
+
+        buffer = SampleBuffer(buffer_size, track_variance=True, track_order=True)
+        start = timer()
+        for age, value in enumerate(values):
+            buffer.append(value, age)
+            if len(buffer) >= 2:
+                buffer.variance**0.5  # noqa: B018
+                buffer.median  # noqa: B018
+        running = timer() - start
+        total += running
+
+        print(
+            f"Buffer size {buffer_size}: recalculate {recalculate:.3f}s,"
+            f" running aggregates {running:.3f}s"
+        )
+
+    return total
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 import fnmatch
+from functools import partial
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import pickle
+import threading
 from typing import Any, TextIO, overload
 
 import yaml
@@ -40,12 +43,106 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+# A dependency of a parsed file, the kind of dependency and its arguments
+type _Dependency = tuple[str, ...]
+
+
+def _file_fingerprint(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file, None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+_DEPENDENCY_STATES: dict[str, Callable[..., Any]] = {
+    "file": _file_fingerprint,
+    "dir": lambda path, pattern: tuple(_find_files(path, pattern)),
+    "env": os.environ.get,
+}
+
+
+class YamlCache:
+    """Cache parsed YAML files until they or their dependencies change.
+
+    A parsed file depends on the files it includes, the directories it includes
+    files from, the secrets files consulted for its secrets and the environment
+    variables it uses. Parsed files are kept pickled, so each load returns new
+    objects which the caller is free to change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[bytes, dict[_Dependency, Any]]] = {}
+        # Dependencies of the files being parsed by a thread, innermost last
+        self._local = threading.local()
+
+    def _recording(self) -> list[dict[_Dependency, Any]]:
+        """Return the dependencies of the files being parsed by this thread."""
+        try:
+            return self._local.recording  # type: ignore[no-any-return]
+        except AttributeError:
+            recording: list[dict[_Dependency, Any]] = []
+            self._local.recording = recording
+            return recording
+
+    def record(self, dependency: _Dependency, state: Any) -> None:
+        """Record a dependency of the file being parsed."""
+        if recording := self._recording():
+            recording[-1][dependency] = state
+
+    def _record_all(self, dependencies: dict[_Dependency, Any]) -> None:
+        """Record the dependencies of an included file."""
+        if recording := self._recording():
+            recording[-1].update(dependencies)
+
+    def load(
+        self, fname: str | os.PathLike[str], parse: Callable[[], JSON_TYPE | None]
+    ) -> JSON_TYPE | None:
+        """Return a parsed file, parsing it if it or a dependency changed."""
+        path = os.path.abspath(fname)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and all(
+            _DEPENDENCY_STATES[dependency[0]](*dependency[1:]) == state
+            for dependency, state in entry[1].items()
+        ):
+            self.hits += 1
+            self._record_all(entry[1])
+            return pickle.loads(entry[0])  # type: ignore[no-any-return]
+
+        self.misses += 1
+        fingerprint = _file_fingerprint(path)
+        dependencies: dict[_Dependency, Any] = {("file", path): fingerprint}
+        recording = self._recording()
+        recording.append(dependencies)
+        try:
+            result = parse()
+        finally:
+            recording.pop()
+        self._record_all(dependencies)
+        # Files changed while they were parsed are parsed again on the next load
+        if fingerprint is not None and _file_fingerprint(path) == fingerprint:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._entries[path] = (data, dependencies)
+        return result
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
-    def __init__(self, config_dir: Path) -> None:
-        """Initialize secrets."""
+    def __init__(self, config_dir: Path, cache: YamlCache | None = None) -> None:
+        """Initialize secrets.
+
+        If a cache is passed, files loaded with these secrets are cached.
+        """
         self.config_dir = config_dir
+        self.cache = cache
         self._cache: dict[Path, dict[str, str]] = {}
 
     def get(self, requester_path: str, secret: str) -> str:
@@ -76,7 +173,12 @@ class Secrets:
 
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
-        if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+        secret_path = secret_dir / SECRET_YAML
+        if self.cache is not None:
+            self.cache.record(
+                ("file", str(secret_path)), _file_fingerprint(str(secret_path))
+            )
+        if secret_path in self._cache:
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
@@ -163,6 +265,15 @@ def load_yaml(
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
+    if secrets is not None and secrets.cache is not None:
+        return secrets.cache.load(fname, partial(_load_yaml, fname, secrets))
+    return _load_yaml(fname, secrets)
+
+
+def _load_yaml(
+    fname: str | os.PathLike[str], secrets: Secrets | None
+) -> JSON_TYPE | None:
+    """Load a YAML file without the cache."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -326,6 +437,12 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
         ) from exc
 
 
+def _record_dependency(loader: LoaderType, dependency: _Dependency, state: Any) -> None:
+    """Record a dependency of the file being loaded, if it is cached."""
+    if loader.secrets is not None and loader.secrets.cache is not None:
+        loader.secrets.cache.record(dependency, state)
+
+
 def _is_file_valid(name: str) -> bool:
     """Decide if a file is valid."""
     return not name.startswith(".")
@@ -341,12 +458,19 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(loader: LoaderType, directory: str) -> list[str]:
+    """Find the YAML files in a directory."""
+    files = list(_find_files(directory, "*.yaml"))
+    _record_dependency(loader, ("dir", directory, "*.yaml"), tuple(files))
+    return files
+
+
 @_raise_if_no_value
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loader, loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -366,7 +490,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -383,7 +507,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loader, loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -396,7 +520,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -465,6 +589,7 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _record_dependency(loader, ("env", args[0]), os.environ.get(args[0]))
 
     # Check for a default value
     if len(args) > 1:
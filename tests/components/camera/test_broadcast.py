@@ -0,0 +1,143 @@
+"""Test sharing the streams of a camera between viewers."""
+
+import asyncio
+from contextlib import aclosing
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+from aiohttp import hdrs, web
+import pytest
+
+from homeassistant.components.camera.broadcast import (
+    MjpegStreamBroadcaster,
+    StillStreamBroadcaster,
+)
+from homeassistant.core import HomeAssistant
+
+
+async def test_viewers_share_images(hass: HomeAssistant) -> None:
+    """Test viewers share the images fetched from the camera."""
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+    fetches = 0
+    done: list[StillStreamBroadcaster] = []
+
+    async def image_cb() -> bytes | None:
+        nonlocal fetches
+        fetches += 1
+        return await images.get()
+
+    broadcaster = StillStreamBroadcaster(hass, image_cb, 0, done.append)
+    async with (
+        aclosing(broadcaster.async_images()) as first,
+        aclosing(broadcaster.async_images()) as second,
+    ):
+        images.put_nowait(b"1")
+        assert await anext(first) == b"1"
+        # A viewer joining a running stream starts with the current image
+        assert await anext(second) == b"1"
+        assert broadcaster.viewers == 2
+
+        # The second viewer does not keep up and skips the oldest images
+        for image in (b"2", b"3", b"4"):
+            images.put_nowait(image)
+            assert await anext(first) == image
+        assert await anext(second) == b"3"
+        assert await anext(second) == b"4"
+        assert broadcaster.dropped_frames == 1
+
+        # No more images ends the stream of all viewers
+        images.put_nowait(None)
+        assert [image async for image in first] == []
+        assert [image async for image in second] == []
+
+    assert fetches == 5
+    assert done == [broadcaster]
+    assert broadcaster.viewers == 0
+
+
+async def test_last_viewer_stops_fetching(hass: HomeAssistant) -> None:
+    """Test fetching images stops when the last viewer leaves."""
+    done: list[StillStreamBroadcaster] = []
+    fetches = 0
+
+    async def image_cb() -> bytes | None:
+        nonlocal fetches
+        fetches += 1
+        return b"image"
+
+    broadcaster = StillStreamBroadcaster(hass, image_cb, 10, done.append)
+    async with aclosing(broadcaster.async_images()) as images:
+        assert await anext(images) == b"image"
+        assert done == []
+
+    assert done == [broadcaster]
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert fetches == 1
+    # A broadcaster is not restarted once stopped
+    assert [image async for image in broadcaster.async_images()] == []
+
+
+async def test_image_error_ends_stream(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an error fetching an image is logged and ends the stream."""
+    done: list[StillStreamBroadcaster] = []
+
+    async def image_cb() -> bytes | None:
+        raise RuntimeError("Camera is gone")
+
+    broadcaster = StillStreamBroadcaster(hass, image_cb, 0, done.append)
+    assert [image async for image in broadcaster.async_images()] == []
+    assert done == [broadcaster]
+    assert "Error reading camera still stream" in caplog.text
+    assert "Camera is gone" in caplog.text
+
+
+async def test_viewers_share_upstream_mjpeg_stream(hass: HomeAssistant) -> None:
+    """Test viewers share one upstream MJPEG stream split into its parts."""
+    chunks: asyncio.Queue[bytes] = asyncio.Queue()
+    done: list[MjpegStreamBroadcaster] = []
+
+    async def read(size: int) -> bytes:
+        return await chunks.get()
+
+    upstream = Mock(
+        headers={hdrs.CONTENT_TYPE: "multipart/x-mixed-replace;boundary=frame"}
+    )
+    upstream.content.read = read
+    open_stream = AsyncMock(return_value=upstream)
+
+    broadcaster = MjpegStreamBroadcaster(hass, open_stream, done.append)
+    async with aclosing(broadcaster.async_parts()) as first:
+        # Parts are published once complete, whatever the chunks are
+        chunks.put_nowait(b"preamble--frame\r\nimage 1\r\n--fr")
+        chunks.put_nowait(b"ame\r\nimage 2\r\n--frame")
+        assert await anext(first) == b"--frame\r\nimage 1\r\n"
+        assert broadcaster.content_type == "multipart/x-mixed-replace;boundary=frame"
+
+        # A viewer joining the stream starts with the next whole part
+        async with aclosing(broadcaster.async_parts()) as second:
+            chunks.put_nowait(b"\r\nimage 3\r\n--frame")
+            assert await anext(second) == b"--frame\r\nimage 3\r\n"
+            assert await anext(first) == b"--frame\r\nimage 2\r\n"
+            assert await anext(first) == b"--frame\r\nimage 3\r\n"
+            assert broadcaster.viewers == 2
+
+        assert not upstream.close.called
+
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert open_stream.call_count == 1
+    assert upstream.close.called
+    assert done == [broadcaster]
+
+
+async def test_upstream_mjpeg_stream_open_error(hass: HomeAssistant) -> None:
+    """Test viewers get an error when the upstream stream cannot be opened."""
+    done: list[MjpegStreamBroadcaster] = []
+    broadcaster = MjpegStreamBroadcaster(
+        hass, AsyncMock(side_effect=aiohttp.ClientError), done.append
+    )
+    async with aclosing(broadcaster.async_parts()) as parts:
+        with pytest.raises(web.HTTPBadGateway):
+            await anext(parts)
+    assert done == [broadcaster]
@@ -21,6 +21,7 @@ from homeassistant.components.camera.const import (
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_CACHE_TTL,
     StreamType,
 )
 from homeassistant.components.camera.helper import get_camera_from_entity_id
@@ -487,6 +488,46 @@ async def test_websocket_update_orientation_prefs(
     assert msg["result"]["orientation"] == camera.Orientation.ROTATE_180
 
 
+async def test_websocket_snapshot_cache(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the snapshot cache TTL preference and statistics."""
+    assert await async_setup_component(
+        hass, "camera", {camera.DOMAIN: {"platform": "demo"}}
+    )
+    await hass.async_block_till_done()
+    client = await hass_ws_client(hass)
+
+    await client.send_json(
+        {
+            "id": 7,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            PREF_SNAPSHOT_CACHE_TTL: 10,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_SNAPSHOT_CACHE_TTL] == 10
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Test",
+    ) as mock_read_bytes:
+        for _ in range(2):
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+            assert image.content == b"Test"
+    assert mock_read_bytes.call_count == 1
+
+    await client.send_json(
+        {"id": 8, "type": "camera/snapshot_cache", "entity_id": "camera.demo_camera"}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"ttl": 10, "hits": 1, "misses": 1}
+
+
 @pytest.mark.usefixtures("mock_camera", "mock_stream")
 async def test_play_stream_service_no_source(hass: HomeAssistant) -> None:
     """Test camera play_stream service."""
@@ -0,0 +1,141 @@
+"""Test the camera snapshot cache."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.snapshot import (
+    FULL_SIZE,
+    MAX_SNAPSHOT_SIZES,
+    SnapshotCache,
+)
+from homeassistant.core import HomeAssistant
+
+from .common import EMPTY_8_6_JPEG, mock_turbo_jpeg
+
+
+async def test_concurrent_requests_share_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent requests for a snapshot share one fetch."""
+    cache = SnapshotCache()
+    release = asyncio.Event()
+    fetches: list[tuple[int | None, int | None]] = []
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        fetches.append((width, height))
+        await release.wait()
+        return Image("image/jpeg", b"snapshot")
+
+    requests = [
+        hass.async_create_task(cache.async_get(hass, 0, None, None, 10, fetch))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    # A request going away does not cancel the fetch of the others
+    requests[0].cancel()
+    release.set()
+    images = await asyncio.gather(*requests[1:])
+
+    assert fetches == [(None, None)]
+    assert [image.content for image in images] == [b"snapshot", b"snapshot"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Without a TTL, snapshots are not kept
+    await cache.async_get(hass, 0, None, None, 10, fetch)
+    assert fetches == [(None, None), (None, None)]
+
+
+async def test_snapshots_cached_for_ttl(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test snapshots and their scaled variants are served for the TTL."""
+    cache = SnapshotCache()
+    fetches: list[tuple[int | None, int | None]] = []
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        fetches.append((width, height))
+        return Image("image/jpeg", b"snapshot")
+
+    turbo_jpeg = mock_turbo_jpeg(first_width=16, first_height=12)
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ):
+        image = await cache.async_get(hass, 5, None, None, 10, fetch)
+        assert image.content == b"snapshot"
+
+        freezer.tick(4)
+        assert await cache.async_get(hass, 5, None, None, 10, fetch) is image
+        # Scaled from the cached snapshot only once
+        scaled = await cache.async_get(hass, 5, 8, 6, 10, fetch)
+        assert scaled.content == EMPTY_8_6_JPEG
+        assert await cache.async_get(hass, 5, 8, 6, 10, fetch) is scaled
+        assert turbo_jpeg.scale_with_quality.call_count == 1
+        assert fetches == [(None, None)]
+
+        freezer.tick(1)
+        await cache.async_get(hass, 5, 8, 6, 10, fetch)
+        assert fetches == [(None, None), (8, 6)]
+
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+async def test_requests_wait_for_their_own_timeout(hass: HomeAssistant) -> None:
+    """Test requests sharing a fetch each wait as long as their own timeout."""
+    cache = SnapshotCache()
+    release = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return Image("image/jpeg", b"snapshot")
+
+    patient = hass.async_create_task(cache.async_get(hass, 0, None, None, 10, fetch))
+    await asyncio.sleep(0)
+    with pytest.raises(TimeoutError):
+        await cache.async_get(hass, 0, None, None, 0.01, fetch)
+    assert not patient.done()
+    release.set()
+    assert (await patient).content == b"snapshot"
+
+    # The fetch is cancelled once no request waits for it
+    release.clear()
+    with pytest.raises(TimeoutError):
+        await cache.async_get(hass, 0, None, None, 0.01, fetch)
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+    release.set()
+    assert (
+        await cache.async_get(hass, 0, None, None, 10, fetch)
+    ).content == b"snapshot"
+
+
+async def test_stale_snapshots_dropped(freezer: FrozenDateTimeFactory) -> None:
+    """Test stale snapshots are dropped and replacing one does not evict others."""
+    cache = SnapshotCache()
+    image = Image("image/png", b"snapshot")
+    for width in range(MAX_SNAPSHOT_SIZES):
+        cache._store((width, 1), 5, time.monotonic(), image)
+        freezer.tick(0.1)
+
+    # Replacing a snapshot keeps the other sizes
+    cache._store((1, 1), 5, time.monotonic(), image)
+    assert len(cache._snapshots) == MAX_SNAPSHOT_SIZES
+    assert (0, 1) in cache._snapshots
+
+    # A new size evicts the oldest one
+    cache._store((None, 1), 5, time.monotonic(), image)
+    assert len(cache._snapshots) == MAX_SNAPSHOT_SIZES
+    assert (0, 1) not in cache._snapshots
+
+    # Storing a snapshot drops the ones older than the TTL
+    freezer.tick(5)
+    cache._store(FULL_SIZE, 5, time.monotonic(), image)
+    assert list(cache._snapshots) == [FULL_SIZE]
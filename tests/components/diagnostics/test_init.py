@@ -6,11 +6,12 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from homeassistant.components.websocket_api import TYPE_RESULT
+from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.system_info import async_get_system_info
-from homeassistant.loader import async_get_integration
-from homeassistant.setup import async_setup_component
+from homeassistant.loader import DATA_COMPONENTS, async_get_integration
+from homeassistant.setup import ATTR_COMPONENT, async_setup_component
 
 from . import _get_diagnostics_for_config_entry, _get_diagnostics_for_device
 
@@ -81,6 +82,40 @@ async def test_websocket(
 
 
 @pytest.mark.usefixtures("enable_custom_integrations")
+async def test_websocket_imports_deferred_platforms(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test diagnostics platforms are imported when diagnostics are listed."""
+    platform = Mock(
+        spec=["async_get_config_entry_diagnostics"],
+        async_get_config_entry_diagnostics=AsyncMock(),
+    )
+    mock_platform(hass, "deferred_integration.diagnostics", platform)
+    del hass.data[DATA_COMPONENTS]["deferred_integration.diagnostics"]
+    integration = await async_get_integration(hass, "deferred_integration")
+
+    with patch.object(
+        integration, "async_get_platform", return_value=platform
+    ) as mock_import:
+        hass.config.components.add("deferred_integration")
+        hass.bus.async_fire(
+            EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "deferred_integration"}
+        )
+        await hass.async_block_till_done()
+        assert not mock_import.called
+
+        client = await hass_ws_client(hass)
+        await client.send_json({"id": 5, "type": "diagnostics/list"})
+        msg = await client.receive_json()
+
+    mock_import.assert_called_once_with("diagnostics")
+    assert msg["success"]
+    assert {
+        "domain": "deferred_integration",
+        "handlers": {"config_entry": True, "device": False},
+    } in msg["result"]
+
+
 async def test_download_diagnostics(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
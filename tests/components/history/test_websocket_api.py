@@ -10,6 +10,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import async_import_statistics
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -173,6 +174,211 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_with_resolution(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period serves entities with statistics from them."""
+    now = dt_util.utcnow()
+    period1 = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+    period2 = period1 + timedelta(hours=1)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    async_import_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Power",
+            "source": "recorder",
+            "statistic_id": "sensor.power",
+            "unit_of_measurement": "W",
+        },
+        (
+            {"start": period1, "mean": 10.0, "min": 5.0, "max": 15.0},
+            {"start": period2, "mean": 20.0, "min": 15.0, "max": 25.0},
+        ),
+    )
+    hass.states.async_set("sensor.raw", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": period1.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.raw"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "resolution": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert list(response["result"]) == ["sensor.power", "sensor.raw"]
+    assert response["result"]["sensor.power"] == [
+        {"s": "10.0", "min": 5.0, "max": 15.0, "lu": period1.timestamp()},
+        {"s": "20.0", "min": 15.0, "max": 25.0, "lu": period2.timestamp()},
+    ]
+    sensor_raw_history = response["result"]["sensor.raw"]
+    assert len(sensor_raw_history) == 1
+    assert sensor_raw_history[0]["s"] == "on"
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": period1.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "resolution": "day",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_with_resolution_before_statistics(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period serves raw states before the first statistics."""
+    now = dt_util.utcnow()
+    start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=3)
+    period = start + timedelta(hours=1)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start - timedelta(minutes=5)):
+        hass.states.async_set("sensor.power", "5.0", attributes={"any": "attr"})
+        await async_wait_recording_done(hass)
+    with freeze_time(start + timedelta(minutes=30)):
+        hass.states.async_set("sensor.power", "8.0", attributes={"any": "changed"})
+        await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", "12.0", attributes={"any": "changed"})
+    async_import_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Power",
+            "source": "recorder",
+            "statistic_id": "sensor.power",
+            "unit_of_measurement": "W",
+        },
+        ({"start": period, "mean": 10.0, "min": 5.0, "max": 15.0},),
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "resolution": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sensor.power"] == [
+        {"s": "5.0", "a": {"any": "attr"}, "lu": start.timestamp()},
+        {"s": "8.0", "lu": (start + timedelta(minutes=30)).timestamp()},
+        {"s": "10.0", "min": 5.0, "max": 15.0, "lu": period.timestamp()},
+        {"s": "12.0", "lu": ANY},
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": period.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "include_start_time_state": False,
+            "resolution": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sensor.power"] == [
+        {
+            "s": "10.0",
+            "min": 5.0,
+            "max": 15.0,
+            "a": {"any": "changed"},
+            "lu": period.timestamp(),
+        },
+        {"s": "12.0", "lu": ANY},
+    ]
+
+
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the history of each entity as an event."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.missing", "sensor.two"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response == {"id": 1, "type": "result", "success": True, "result": None}
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    sensor_one_history = response["event"]["states"]["sensor.one"]
+    assert [state["s"] for state in sensor_one_history] == ["on", "off"]
+    assert "complete" not in response["event"]
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    sensor_two_history = response["event"]["states"]["sensor.two"]
+    assert [state["s"] for state in sensor_two_history] == ["on"]
+
+    response = await client.receive_json()
+    assert response == {
+        "id": 1,
+        "type": "event",
+        "event": {"states": {}, "complete": True},
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "complete": True}
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
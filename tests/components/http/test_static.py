@@ -1,13 +1,33 @@
 """The tests for http static files."""
 
+import asyncio
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    ETAG,
+    IF_NONE_MATCH,
+    VARY,
+)
 from aiohttp.test_utils import TestClient
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import (
+    CACHE_HEADER,
+    COMPRESS_MIN_SIZE,
+    FILE_CHECK_INTERVAL,
+    CachingStaticResource,
+    _accepts_gzip,
+    _compress_file,
+    prune_compressed_cache,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +83,172 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_not_modified(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test files the client has are answered without filesystem access."""
+    app = hass.http.app
+    (tmp_path / "card.js").write_text("card")
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+
+    resp = await mock_http_client.get("/static/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[CACHE_CONTROL] == CACHE_HEADER
+    etag = resp.headers[ETAG]
+
+    (tmp_path / "card.js").unlink()
+    resp = await mock_http_client.get("/static/card.js", headers={IF_NONE_MATCH: etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers[ETAG] == etag
+
+    # Files are checked for changes after the check interval
+    freezer.tick(FILE_CHECK_INTERVAL + 1)
+    resp = await mock_http_client.get("/static/card.js", headers={IF_NONE_MATCH: etag})
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_static_resource_compressed(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test files are compressed once to the compressed cache."""
+    app = hass.http.app
+    static_path = tmp_path / "www"
+    static_path.mkdir()
+    cache_path = tmp_path / "cache"
+    card_path = static_path / "card.js"
+    card_path.write_text("a" * COMPRESS_MIN_SIZE)
+    resource = CachingStaticResource(
+        "/static", static_path, compressed_cache_dir=cache_path
+    )
+    app.router.register_resource(resource)
+
+    for _ in range(2):
+        resp = await mock_http_client.get(
+            "/static/card.js", headers={ACCEPT_ENCODING: "gzip"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers[CONTENT_ENCODING] == "gzip"
+        assert resp.headers[CONTENT_TYPE] == "text/javascript"
+        assert resp.headers[VARY] == "Accept-Encoding"
+        assert await resp.text() == "a" * COMPRESS_MIN_SIZE
+    assert len(list(cache_path.glob("*.gz"))) == 1
+
+    resp = await mock_http_client.get(
+        "/static/card.js", headers={ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == "a" * COMPRESS_MIN_SIZE
+
+    # A changed file replaces its compressed file
+    card_path.write_text("b" * 2 * COMPRESS_MIN_SIZE)
+    freezer.tick(FILE_CHECK_INTERVAL + 1)
+    resp = await mock_http_client.get(
+        "/static/card.js", headers={ACCEPT_ENCODING: "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "b" * 2 * COMPRESS_MIN_SIZE
+    assert len(list(cache_path.glob("*.gz"))) == 1
+
+
+async def test_static_resource_compressed_once(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test concurrent requests share the compression of a file."""
+    static_path = tmp_path / "www"
+    static_path.mkdir()
+    cache_path = tmp_path / "cache"
+    (static_path / "card.js").write_text("a" * COMPRESS_MIN_SIZE)
+    hass.http.app.router.register_resource(
+        CachingStaticResource("/static", static_path, compressed_cache_dir=cache_path)
+    )
+    # Index the file before the concurrent requests
+    resp = await mock_http_client.get(
+        "/static/card.js", headers={ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+
+    with patch(
+        "homeassistant.components.http.static._compress_file",
+        wraps=_compress_file,
+    ) as compress_mock:
+        responses = await asyncio.gather(
+            *(
+                mock_http_client.get(
+                    "/static/card.js", headers={ACCEPT_ENCODING: "gzip"}
+                )
+                for _ in range(3)
+            )
+        )
+    for resp in responses:
+        assert resp.headers[CONTENT_ENCODING] == "gzip"
+        assert await resp.text() == "a" * COMPRESS_MIN_SIZE
+    assert compress_mock.call_count == 1
+    assert len(list(cache_path.glob("*.gz"))) == 1
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "accepted"),
+    [
+        ("gzip", True),
+        ("deflate, gzip;q=0.5", True),
+        ("GZIP", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, br", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, accepted: bool) -> None:
+    """Test the quality values of the Accept-Encoding header are respected."""
+    assert _accepts_gzip(accept_encoding) is accepted
+
+
+def test_prune_compressed_cache(tmp_path: Path) -> None:
+    """Test the compressed files of removed files are pruned."""
+    cache_path = tmp_path / "cache"
+    kept_path = tmp_path / "kept.js"
+    removed_path = tmp_path / "removed.js"
+    for path in (kept_path, removed_path):
+        path.write_text("a" * COMPRESS_MIN_SIZE)
+    kept, _ = _compress_file(kept_path, "kept", cache_path)
+    _compress_file(removed_path, "removed", cache_path)
+    cache_path.joinpath("interrupted.tmp").write_bytes(b"")
+    cache_path.joinpath("unknown-etag.gz").write_bytes(b"")
+    removed_path.unlink()
+
+    prune_compressed_cache(cache_path)
+
+    assert sorted(file.name for file in cache_path.iterdir()) == sorted(
+        [kept.name, f"{kept.name.partition('-')[0]}.source"]
+    )
+    # Nothing to prune before the first compression
+    prune_compressed_cache(tmp_path / "missing")
+
+
+def test_compress_file_failure(tmp_path: Path) -> None:
+    """Test the temporary file is removed when compressing a file fails."""
+    cache_path = tmp_path / "cache"
+    path = tmp_path / "card.js"
+    path.write_text("a" * COMPRESS_MIN_SIZE)
+
+    with (
+        patch("shutil.copyfileobj", side_effect=OSError),
+        pytest.raises(OSError),
+    ):
+        _compress_file(path, "etag", cache_path)
+
+    assert not list(cache_path.glob("*.gz"))
+    assert not list(cache_path.glob("*.tmp"))
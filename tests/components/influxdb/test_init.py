@@ -5,8 +5,11 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+import math
+from pathlib import Path
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+import aiohttp
 import pytest
 
 from homeassistant.components import influxdb
@@ -14,6 +17,10 @@ from homeassistant.components.influxdb.const import DEFAULT_BUCKET
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+from tests.test_util.aiohttp import AiohttpClientMocker
 
 INFLUX_PATH = "homeassistant.components.influxdb"
 INFLUX_CLIENT_PATH = f"{INFLUX_PATH}.InfluxDBClient"
@@ -1706,3 +1713,111 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+def test_encode_line() -> None:
+    """Test encoding points to line protocol."""
+    time_fired = datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.UTC)
+    json = {
+        "measurement": "°C, room",
+        "tags": {"entity_id": "living room", "domain": "sensor", "empty": ""},
+        "time": time_fired,
+        "fields": {
+            "value": 21.5,
+            "state_str": 'say "hi" \\o/',
+            "nan": float("nan"),
+            "count": 3,
+        },
+    }
+    assert (
+        influxdb.writer.encode_line(json, None)
+        == (
+            "°C\\,\\ room,domain=sensor,entity_id=living\\ room "
+            'value=21.5,state_str="say \\"hi\\" \\\\o/",count=3i '
+            "1704164645678901000"
+        ).encode()
+    )
+    assert influxdb.writer.encode_line(json, "s").endswith(b" 1704164645")
+    assert (
+        influxdb.writer.encode_line({**json, "fields": {"nan": math.nan}}, None) is None
+    )
+
+
+@pytest.mark.parametrize("mock_client", [influxdb.DEFAULT_API_VERSION], indirect=True)
+async def test_async_writer(
+    hass: HomeAssistant,
+    mock_client,
+    aioclient_mock: AiohttpClientMocker,
+    tmp_path: Path,
+) -> None:
+    """Test the async writer buffers batches on disk while InfluxDB is down."""
+    hass.config.config_dir = str(tmp_path)
+    url = "http://host:8086/write"
+    aioclient_mock.post(url, exc=aiohttp.ClientConnectionError())
+    await _setup(hass, mock_client, {"async_writer": True}, _get_write_api_mock_v1)
+    writer = hass.data[influxdb.DOMAIN]
+
+    hass.states.async_set("fake.entity_id", "1.5", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    await writer.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert writer.write_errors == 1
+    buffer_files = list(tmp_path.joinpath(".cache", "influxdb").iterdir())
+    assert len(buffer_files) == 1
+    assert (
+        buffer_files[0]
+        .read_bytes()
+        .startswith(b"W,domain=fake,entity_id=entity_id value=1.5 ")
+    )
+
+    # Batches are buffered until InfluxDB can be reached again
+    hass.states.async_set("fake.entity_id", "2.5", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    await writer.async_block_till_done()
+    assert aioclient_mock.call_count == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(url, status=HTTPStatus.NO_CONTENT)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + datetime.timedelta(seconds=influxdb.RETRY_DELAY)
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [call[2].split(b" ")[1] for call in aioclient_mock.mock_calls] == [
+        b"value=1.5",
+        b"value=2.5",
+    ]
+    assert aioclient_mock.mock_calls[0][1].query == {
+        "db": "home_assistant",
+        "precision": "n",
+    }
+    assert writer.write_errors == 0
+    assert not any(tmp_path.joinpath(".cache", "influxdb").iterdir())
+
+    # Once reachable again, batches are written right away
+    hass.states.async_set("fake.entity_id", "3.5", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    await writer.async_block_till_done()
+    assert aioclient_mock.call_count == 3
+
+
+def test_disk_buffer(tmp_path: Path) -> None:
+    """Test the disk buffer drops the oldest batches and lists its files once."""
+    path = tmp_path / "buffer"
+    path.mkdir()
+    path.joinpath("00000000000000000001-000001.lp").write_bytes(b"old")
+    buffer = influxdb.writer.DiskBuffer(path, 10)
+
+    assert buffer.count() == 1
+    with patch.object(Path, "glob") as glob_mock:
+        buffer.append(b"first")
+        buffer.append(b"second")
+        assert buffer.count() == 1
+        file, body = buffer.oldest()
+        assert body == b"second"
+        buffer.remove(file)
+        assert buffer.count() == 0
+        assert buffer.oldest() is None
+    assert not glob_mock.called
+    assert not any(path.iterdir())
@@ -19,6 +19,7 @@ from homeassistant.components.logbook.models import EventAsRow, LazyEventPartial
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.services import SERVICE_PURGE
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -516,6 +517,66 @@ async def test_logbook_describe_event(
     assert event["domain"] == "test_domain"
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_logbook_describe_event_cached(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test described events are reused across requests until they may change."""
+    describe = Mock(
+        side_effect=lambda event: {"name": "Test Name", "message": "tested a message"}
+    )
+
+    hass.config.components.add("fake_integration")
+    mock_platform(
+        hass,
+        "fake_integration.logbook",
+        Mock(
+            async_describe_events=(
+                lambda hass, async_describe_event: async_describe_event(
+                    "test_domain", "some_event", describe
+                )
+            ),
+        ),
+    )
+
+    assert await async_setup_component(hass, "logbook", {})
+    with freeze_time(dt_util.utcnow() - timedelta(seconds=5)):
+        hass.bus.async_fire("some_event")
+        await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day, tzinfo=dt_util.UTC)
+    end_time = start_date + timedelta(hours=24)
+
+    async def _get_messages() -> list[str]:
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}",
+            params={"end_time": end_time.isoformat()},
+        )
+        return [entry["message"] for entry in await response.json()]
+
+    assert await _get_messages() == ["tested a message"]
+    assert await _get_messages() == ["tested a message"]
+    assert describe.call_count == 1
+
+    await hass.services.async_call(
+        recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 1}, blocking=True
+    )
+    await async_wait_recording_done(hass)
+    assert await _get_messages() == ["tested a message"]
+    assert describe.call_count == 2
+
+    # Describers may use the registries
+    entity_registry.async_get_or_create("light", "hue", "1234")
+    await hass.async_block_till_done()
+    assert await _get_messages() == ["tested a message"]
+    assert await _get_messages() == ["tested a message"]
+    assert describe.call_count == 3
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_exclude_described_event(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
@@ -13,6 +13,7 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.queries import statement_for_request
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -292,6 +293,91 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_from_recent_events(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events is answered from the recent events."""
+    before_setup = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    after_setup = dt_util.utcnow()
+
+    context = core.Context(
+        id="01GTDGKBCH00GW0X276W5TEDDD",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 100})
+    hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 200})
+    hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.power", "2", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    # The continuous sensor is not shown, but starts the context of the light
+    sensor_context = core.Context()
+    hass.states.async_set(
+        "sensor.power", "3", {ATTR_UNIT_OF_MEASUREMENT: "W"}, context=sensor_context
+    )
+    hass.states.async_set("light.hallway", STATE_OFF)
+    hass.states.async_set("light.hallway", STATE_ON, context=sensor_context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg_id = 0
+
+    async def _get_events(start_time: str, **request: Any) -> list[dict[str, Any]]:
+        nonlocal msg_id
+        msg_id += 1
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": start_time,
+                **request,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    for name, request in (
+        ("all", {}),
+        ("context", {"context_id": "01GTDGKBCH00GW0X276W5TEDDD"}),
+        ("entity", {"entity_ids": ["light.hallway"]}),
+    ):
+        # The recent events do not cover the time before the setup
+        from_database = await _get_events(before_setup.isoformat(), **request)
+        with patch(
+            "homeassistant.components.logbook.processor.statement_for_request"
+        ) as statement_mock:
+            from_recent_events = await _get_events(after_setup.isoformat(), **request)
+        assert not statement_mock.called
+        assert from_recent_events == from_database
+        results[name] = from_database
+
+    assert [(row.get("entity_id"), row.get("state")) for row in results["context"]] == [
+        ("light.kitchen", "off")
+    ]
+    assert [
+        (row["entity_id"], row["state"], row.get("context_entity_id"))
+        for row in results["entity"]
+    ] == [("light.hallway", "on", "sensor.power")]
+
+    # The context of the kitchen light was created before the recent events
+    with patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=statement_for_request,
+    ) as statement_mock:
+        await _get_events(after_setup.isoformat(), entity_ids=["light.kitchen"])
+    assert statement_mock.called
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -13,7 +13,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    WildcardSubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -23,7 +27,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -633,6 +643,90 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "match"),
+    [
+        ("test-topic/+/on", "test-topic/bier/on", True),
+        ("test-topic/+/on", "test-topic/bier", False),
+        ("test-topic/+", "test-topic/bier/on", False),
+        ("test-topic/#", "test-topic", True),
+        ("test-topic/#", "test-topic/bier/on", True),
+        ("test-topic/#", "test-topic-123", False),
+        ("+/test-topic/#", "hi/test-topic", True),
+        ("+/test-topic/#", "hi/here-iam/test-topic", False),
+        ("#", "test-topic/bier", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/#", "$SYS", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_wildcard_subscription_trie_match(
+    topic_filter: str, topic: str, match: bool
+) -> None:
+    """Test matching topics against the wildcard subscription trie."""
+    trie = WildcardSubscriptionTrie()
+    subscription = Subscription(topic_filter, False, HassJob(lambda msg: None))
+    trie.add(subscription)
+    assert trie.match(topic) == ([subscription] if match else [])
+
+    trie.remove(subscription)
+    assert trie.match(topic) == []
+    with pytest.raises(KeyError):
+        trie.remove(subscription)
+
+
+def test_wildcard_subscription_trie_order() -> None:
+    """Test the wildcard subscription trie returns matches in the order added."""
+    trie = WildcardSubscriptionTrie()
+    job = HassJob(lambda msg: None)
+    subscriptions = [
+        Subscription(topic_filter, False, job)
+        for topic_filter in ("a/#", "+/b/c", "a/b/#", "#", "a/+/c")
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+    assert trie.match("a/b/c") == subscriptions
+    trie.remove(subscriptions[1])
+    assert trie.match("a/b/c") == [
+        subscriptions[0],
+        subscriptions[2],
+        subscriptions[3],
+        subscriptions[4],
+    ]
+
+
+async def test_subscribe_wildcard_topics_updates_matches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscribing and unsubscribing updates the matching subscriptions."""
+    await mqtt_mock_entry()
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "payload1")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 1
+
+    unsub_level = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "payload2")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+
+    unsub_wildcard()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "payload3")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+
+    unsub_level()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "payload4")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
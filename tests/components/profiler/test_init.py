@@ -2,10 +2,11 @@
 
 from datetime import timedelta
 from functools import lru_cache
+import json
 import logging
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 from lru import LRU
@@ -18,8 +19,11 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_EVENT_BUS_PROFILE,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_IMPORT_TIMES,
+    SERVICE_LOG_POLL_STATISTICS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -29,11 +33,14 @@ from homeassistant.components.profiler import (
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    _async_generate_event_bus_profile,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import PollStatistics
+from homeassistant.loader import ImportTiming
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -101,6 +108,54 @@ async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     await hass.async_block_till_done()
 
 
+async def test_event_bus_profile(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test we can record the wall time of the event listeners."""
+    test_dir = tmp_path / "profiles"
+    test_dir.mkdir()
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_EVENT_BUS_PROFILE)
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(test_dir / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_EVENT_BUS_PROFILE, {CONF_SECONDS: 0.000001}, blocking=True
+        )
+
+    assert not hass.bus.listener_profiling
+    assert last_filename.endswith(".json")
+    profile = json.loads(Path(last_filename).read_text())
+    assert isinstance(profile, list)
+
+    hass.bus.async_set_listener_profiling(True)
+    with pytest.raises(HomeAssistantError, match="Event bus profiling already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_EVENT_BUS_PROFILE, {CONF_SECONDS: 0.000001}, blocking=True
+        )
+
+    # Profiling started elsewhere while waiting for another profile is kept
+    with patch.object(hass.config, "path", _mock_path):
+        await _async_generate_event_bus_profile(
+            hass, Mock(data={CONF_SECONDS: 0.000001})
+        )
+    assert hass.bus.listener_profiling
+    hass.bus.async_set_listener_profiling(False)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_object_growth_logging(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -245,6 +300,85 @@ async def test_log_current_tasks(
     await hass.async_block_till_done()
 
 
+async def test_log_import_times(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the import times of the integrations."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_IMPORT_TIMES)
+
+    with patch(
+        "homeassistant.components.profiler.async_get_import_timings",
+        return_value=[
+            ImportTiming("homeassistant.components.hue", "hue", 1.5, 40, False),
+            ImportTiming("homeassistant.components.hue.light", "hue", 0.25, 3, True),
+        ],
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_IMPORT_TIMES, {}, blocking=True
+        )
+
+    assert "Integration hue imports took 1.750s and loaded 43 modules" in caplog.text
+    assert (
+        "Import of homeassistant.components.hue.light took 0.250s and loaded 3"
+        " modules in the event loop"
+    ) in caplog.text
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_log_poll_statistics(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the poll statistics of the entity platforms."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_POLL_STATISTICS)
+
+    platform = Mock(
+        platform_name="hue",
+        domain="light",
+        scan_interval_seconds=30,
+        poll_statistics=PollStatistics(
+            polls=3,
+            overruns=1,
+            last_duration=0.5,
+            average_duration=0.4,
+            max_duration=0.9,
+            last_latency=0.01,
+            max_latency=0.02,
+        ),
+    )
+    with patch(
+        "homeassistant.components.profiler.async_get_polling_platforms",
+        return_value=[platform],
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_POLL_STATISTICS, {}, blocking=True
+        )
+
+    assert (
+        "Polls of hue light: 3 polls every 30s, average 0.400s, last 0.500s,"
+        " max 0.900s, last latency 0.010s, max latency 0.020s, 1 overruns"
+    ) in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_scheduled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
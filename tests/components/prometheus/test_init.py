@@ -1252,6 +1252,37 @@ async def test_update(
     ).withValue(0.0).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_openmetrics_and_compression(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test OpenMetrics and compressed responses."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=1.0.0"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"] == (
+        "application/openmetrics-text; version=1.0.0; charset=utf-8"
+    )
+    body = (await resp.text()).split("\n")
+    assert body[-2:] == ["# EOF", ""]
+    assert body.count("# EOF") == 1
+    assert "# TYPE state_change counter" in body
+    EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(15.6).assert_in_metrics(body)
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-encoding"] == "gzip"
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_renaming_entity_name(
     hass: HomeAssistant,
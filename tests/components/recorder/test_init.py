@@ -1473,6 +1473,62 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 1}])
+@pytest.mark.parametrize("executemany_returning", [True, False])
+async def test_saving_sets_old_state_chain(
+    hass: HomeAssistant, setup_recorder: None, executemany_returning: bool
+) -> None:
+    """Test old state is linked for many states of an entity in one commit."""
+    instance = recorder.get_instance(hass)
+    assert instance.engine is not None
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        executemany_returning,
+    ):
+        for state in ("s1", "s2", "s3"):
+            hass.states.async_set("test.one", state, {"attr": state})
+        hass.bus.async_fire("test_event", {"some": "data"})
+        await async_wait_recording_done(hass)
+        hass.states.async_set("test.one", "s4", {"attr": "s1"})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert all(state.entity_id == "test.one" for state in states)
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert (
+            states_by_state["s1"].state_id
+            < states_by_state["s2"].state_id
+            < states_by_state["s3"].state_id
+        )
+        assert (
+            states_by_state["s4"].attributes_id == states_by_state["s1"].attributes_id
+        )
+
+        events = list(
+            session.query(Events, EventData, EventTypes)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(events) == 1
+        assert events[0].EventData.shared_data == '{"some":"data"}'
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -0,0 +1,69 @@
+"""Test the statistics sample buffer."""
+
+from __future__ import annotations
+
+import math
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.samples import SampleBuffer
+
+VALUES = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 11.1, 2.4, 19.5]
+
+
+@pytest.mark.parametrize("maxlen", [None, 4, 7])
+def test_running_aggregates(maxlen: int | None) -> None:
+    """Test the running aggregates match those calculated from the samples."""
+    samples = SampleBuffer(maxlen, track_variance=True, track_order=True)
+    for age, value in enumerate(VALUES):
+        samples.append(value, age * 60)
+        states = list(samples.states)
+        ages = list(samples.ages)
+        assert len(samples) == len(states) == len(ages)
+
+        assert math.isclose(samples.sum, sum(states))
+        assert samples.sorted_states == sorted(states)
+        assert samples.median == statistics.median(states)
+        assert math.isclose(
+            samples.sum_differences,
+            sum(abs(j - i) for i, j in zip(states, states[1:], strict=False)),
+            abs_tol=1e-9,
+        )
+        if len(states) < 2:
+            continue
+        assert math.isclose(samples.variance, statistics.variance(states))
+        assert math.isclose(
+            samples.quantile(20),
+            statistics.quantiles(states, n=100, method="exclusive")[19],
+        )
+        assert math.isclose(
+            samples.area_step,
+            sum(states[i - 1] * (ages[i] - ages[i - 1]) for i in range(1, len(ages))),
+        )
+
+
+def test_remove_all_samples() -> None:
+    """Test removing all samples resets the running aggregates."""
+    samples = SampleBuffer(None, track_variance=True, track_circular=True)
+    for age, value in enumerate(VALUES):
+        samples.append(value, age)
+    while len(samples):
+        samples.popleft()
+
+    assert samples.sum == 0
+    assert samples.variance == 0
+    assert samples.sin_sum == 0
+    assert samples.cos_sum == 0
+    assert samples.area_linear == 0
+
+
+def test_binary_samples() -> None:
+    """Test the running aggregates of binary samples."""
+    samples = SampleBuffer(3)
+    for age, value in enumerate([True, False, True, True, False]):
+        samples.append(value, age * 10)
+
+    assert list(samples.states) == [True, True, False]
+    assert samples.count_true == 2
+    assert samples.seconds_true == 20
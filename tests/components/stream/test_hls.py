@@ -2,7 +2,7 @@
 
 from datetime import timedelta
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 from urllib.parse import urlparse
 
 import av
@@ -10,13 +10,19 @@ import pytest
 
 from homeassistant.components.stream import Stream, create_stream
 from homeassistant.components.stream.const import (
+    ATTR_MEMORY_BUDGET,
+    DOMAIN,
     EXT_X_START_LL_HLS,
     EXT_X_START_NON_LL_HLS,
     HLS_PROVIDER,
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
+    RECORDER_PROVIDER,
+    SEGMENT_BUFFER_SIZE,
+    SEGMENT_MEMORY_BUDGET,
 )
 from homeassistant.components.stream.core import Orientation, Part
+from homeassistant.components.stream.hls import HlsStreamOutput
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -191,6 +197,9 @@ async def test_hls_stream(
         "start_worker": 1,
         "video_codec": "h264",
         "worker_error": 1,
+        "segment_memory_budget": SEGMENT_MEMORY_BUDGET,
+        "segment_memory_used": ANY,
+        "evicted_segments": 0,
     }
 
 
@@ -589,3 +598,101 @@ async def test_hls_stream_rotate(
 
     # Stop stream, if it hasn't quit already
     await stream.stop()
+
+
+async def test_segment_data_buffered(hass: HomeAssistant) -> None:
+    """Test the part data of a segment is kept in one buffer."""
+    segment = Segment(sequence=0)
+    segment.async_add_part(
+        Part(duration=1, has_keyframe=True, data=FAKE_PAYLOAD), duration=0
+    )
+    data = segment.get_data()
+    assert isinstance(data, memoryview)
+    assert data == FAKE_PAYLOAD
+
+    # The buffer is replaced when full, views handed out are not changed
+    large_payload = b"x" * SEGMENT_BUFFER_SIZE
+    segment.async_add_part(
+        Part(duration=1, has_keyframe=False, data=large_payload),
+        duration=SEGMENT_DURATION,
+    )
+    assert data == FAKE_PAYLOAD
+    assert segment.get_data() == FAKE_PAYLOAD + large_payload
+    assert [part.data for part in segment.parts] == [FAKE_PAYLOAD, large_payload]
+    assert segment.data_size == len(FAKE_PAYLOAD) + SEGMENT_BUFFER_SIZE
+    assert segment.memory_size == 2 * SEGMENT_BUFFER_SIZE
+
+
+async def test_segment_memory_budget(hass: HomeAssistant, setup_component) -> None:
+    """Test the oldest segments of all streams are dropped over the memory budget."""
+    budget = hass.data[DOMAIN][ATTR_MEMORY_BUDGET]
+    budget.budget = 5 * SEGMENT_BUFFER_SIZE
+    streams = [
+        create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+        for _ in range(2)
+    ]
+    outputs = [stream.add_provider(HLS_PROVIDER) for stream in streams]
+
+    def put_segment(output: HlsStreamOutput, sequence: int, seconds: int) -> None:
+        segment = Segment(
+            sequence=sequence, start_time=FAKE_TIME + timedelta(seconds=seconds)
+        )
+        segment.async_add_part(
+            Part(duration=1, has_keyframe=True, data=FAKE_PAYLOAD),
+            duration=SEGMENT_DURATION,
+        )
+        output.put(segment)
+
+    for sequence in range(3):
+        put_segment(outputs[0], sequence, 2 * sequence)
+        put_segment(outputs[1], sequence, 2 * sequence + 1)
+    await hass.async_block_till_done()
+
+    assert [output.sequences for output in outputs] == [[1, 2], [0, 1, 2]]
+    assert budget.used == 5 * SEGMENT_BUFFER_SIZE
+    assert budget.evicted_segments == 1
+    assert streams[0].get_diagnostics()["evict_segment"] == 1
+
+    # The most recent segments of each stream are kept
+    budget.budget = 0
+    put_segment(outputs[0], 3, 6)
+    await hass.async_block_till_done()
+
+    assert [output.sequences for output in outputs] == [[2, 3], [1, 2]]
+    assert budget.evicted_segments == 3
+    assert streams[0].get_diagnostics()["evict_segment"] == 2
+    assert streams[1].get_diagnostics()["evict_segment"] == 1
+
+    for stream in streams:
+        await stream.stop()
+
+
+async def test_segment_memory_budget_shared_segments(
+    hass: HomeAssistant, setup_component
+) -> None:
+    """Test segments kept by the recorder are not dropped from other outputs."""
+    budget = hass.data[DOMAIN][ATTR_MEMORY_BUDGET]
+    budget.budget = 0
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    hls_output = stream.add_provider(HLS_PROVIDER)
+    recorder_output = stream.add_provider(RECORDER_PROVIDER)
+
+    for sequence in range(3):
+        segment = Segment(
+            sequence=sequence, start_time=FAKE_TIME + timedelta(seconds=sequence)
+        )
+        segment.async_add_part(
+            Part(duration=1, has_keyframe=True, data=FAKE_PAYLOAD),
+            duration=SEGMENT_DURATION,
+        )
+        recorder_output.put(segment)
+        hls_output.put(segment)
+    await hass.async_block_till_done()
+
+    # Dropping them would not free any memory
+    assert hls_output.sequences == [0, 1, 2]
+    assert budget.used == 3 * SEGMENT_BUFFER_SIZE
+    assert budget.evicted_segments == 0
+    assert stream.get_diagnostics()["segment_memory_used"] == budget.used
+
+    await stream.stop()
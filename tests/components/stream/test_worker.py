@@ -20,7 +20,7 @@ import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import av
 import numpy as np
@@ -28,7 +28,9 @@ import pytest
 
 from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
 from homeassistant.components.stream.const import (
+    ATTR_MEMORY_BUDGET,
     ATTR_SETTINGS,
+    ATTR_STREAMS,
     CONF_LL_HLS,
     CONF_PART_DURATION,
     CONF_SEGMENT_DURATION,
@@ -38,9 +40,14 @@ from homeassistant.components.stream.const import (
     PACKETS_TO_WAIT_FOR_AUDIO,
     RECORDER_PROVIDER,
     SEGMENT_DURATION_ADJUSTER,
+    SEGMENT_MEMORY_BUDGET,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
-from homeassistant.components.stream.core import Orientation, StreamSettings
+from homeassistant.components.stream.core import (
+    Orientation,
+    SegmentMemoryBudget,
+    StreamSettings,
+)
 from homeassistant.components.stream.exceptions import StreamClientError
 from homeassistant.components.stream.worker import (
     StreamEndedError,
@@ -94,7 +101,9 @@ def mock_stream_settings(hass: HomeAssistant) -> None:
             part_target_duration=TARGET_SEGMENT_DURATION_NON_LL_HLS,
             hls_advance_part_limit=3,
             hls_part_timeout=TARGET_SEGMENT_DURATION_NON_LL_HLS,
-        )
+        ),
+        ATTR_STREAMS: [],
+        ATTR_MEMORY_BUDGET: SegmentMemoryBudget(hass, SEGMENT_MEMORY_BUDGET),
     }
 
 
@@ -994,6 +1003,9 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
         "start_worker": 1,
         "video_codec": "hevc",
         "worker_error": 1,
+        "segment_memory_budget": SEGMENT_MEMORY_BUDGET,
+        "segment_memory_used": ANY,
+        "evicted_segments": 0,
     }
 
 
@@ -650,6 +650,41 @@ async def test_unique_id(
     )
 
 
+@pytest.mark.parametrize(("count", "domain"), [(1, "template")])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "template": {
+                "sensor": {
+                    "name": "Lights",
+                    "state": (
+                        "{{ states.light | selectattr('state', 'eq', 'unavailable')"
+                        " | list | count }}/{{ states.light"
+                        " | selectattr('state', 'eq', 'on') | list | count }}"
+                    ),
+                    "state_filter": {"state": "unavailable"},
+                },
+            },
+        },
+    ],
+)
+@pytest.mark.usefixtures("start_ha")
+async def test_state_filter(hass: HomeAssistant) -> None:
+    """Test the state filter skips renders for changes of other states."""
+    assert hass.states.get("sensor.lights").state == "0/0"
+
+    hass.states.async_set("light.one", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.lights").state == "0/0"
+
+    hass.states.async_set("light.two", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.lights").state == "1/1"
+
+
 @pytest.mark.parametrize(("count", "domain"), [(1, sensor.DOMAIN)])
 @pytest.mark.parametrize(
     "config",
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -24,9 +25,11 @@ from homeassistant.core import Context, HomeAssistant, State, SupportsResponse,
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity_platform import PollStatistics
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +37,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -126,6 +130,66 @@ async def test_fire_event(
     assert runs[0].data == {"hello": "world"}
 
 
+async def test_event_bus_profile(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test event bus profile command."""
+
+    @callback
+    def event_handler(event):
+        """Handle event."""
+
+    hass.bus.async_listen("event_type_test", event_handler)
+
+    await websocket_client.send_json_auto_id(
+        {"type": "event_bus/profile", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": True, "listeners": []}
+
+    hass.bus.async_fire("event_type_test")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "event_bus/profile", "enabled": False}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["enabled"] is False
+    listeners = [
+        listener
+        for listener in msg["result"]["listeners"]
+        if listener["event_type"] == "event_type_test"
+    ]
+    assert len(listeners) == 1
+    assert listeners[0]["listener"].endswith(
+        "test_event_bus_profile.<locals>.event_handler"
+    )
+    assert listeners[0]["count"] == 1
+
+    await websocket_client.send_json_auto_id({"type": "event_bus/profile"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": False, "listeners": []}
+
+
+async def test_event_bus_profile_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test event bus profile command requires admin."""
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json_auto_id(
+        {"type": "event_bus/profile", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+    assert not hass.bus.listener_profiling
+
+
 async def test_fire_event_without_data(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1029,6 +1093,85 @@ async def test_subscribe_entities_with_unserializable_state(
     }
 
 
+async def test_subscribe_entities_min_update_interval_and_attributes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities with a minimum update interval and attributes."""
+    hass.states.async_set(
+        "media_player.tablet", "playing", {"media_title": "a", "media_position": 1}
+    )
+
+    await websocket_client.send_json_auto_id(
+        {
+            "type": "subscribe_entities",
+            "entity_ids": ["media_player.tablet"],
+            "min_update_interval": 10,
+            "attributes": ["media_title"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "media_player.tablet": {
+                "a": {"media_title": "a"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "playing",
+            }
+        }
+    }
+
+    # Changes of other attributes are not forwarded
+    hass.states.async_set(
+        "media_player.tablet", "playing", {"media_title": "a", "media_position": 2}
+    )
+    hass.states.async_set(
+        "media_player.tablet", "paused", {"media_title": "a", "media_position": 3}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"media_player.tablet": {"+": {"c": ANY, "lc": ANY, "s": "paused"}}}
+    }
+
+    # Changes within the interval are coalesced
+    hass.states.async_set(
+        "media_player.tablet", "playing", {"media_title": "b", "media_position": 4}
+    )
+    hass.states.async_set(
+        "media_player.tablet", "paused", {"media_title": "c", "media_position": 5}
+    )
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "media_player.tablet": {
+                "+": {"a": {"media_title": "c"}, "c": ANY, "lc": ANY}
+            }
+        }
+    }
+
+    # Entities added and removed within the interval are not forwarded
+    hass.states.async_remove("media_player.tablet")
+    hass.states.async_set("media_player.tablet", "idle", {"media_title": "d"})
+    hass.states.async_remove("media_player.tablet")
+    hass.states.async_set("media_player.tablet", "idle", {"media_title": "e"})
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=22))
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "media_player.tablet": {
+                "+": {"a": {"media_title": "e"}, "c": ANY, "lc": ANY, "s": "idle"}
+            }
+        }
+    }
+
+
 async def test_subscribe_unsubscribe_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1359,6 +1502,52 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_render_template_state_filter(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test a state filter suppresses renders of an iterated domain."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "unavailable")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "render_template",
+            "template": (
+                "{{ states.sensor | selectattr('state', 'eq', 'unavailable')"
+                " | list | count }}"
+            ),
+            "state_filter": {"state": "unavailable"},
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "result": 1,
+        "listeners": {
+            "all": False,
+            "domains": ["sensor"],
+            "entities": [],
+            "time": False,
+        },
+        "suppressed_renders": 0,
+    }
+
+    hass.states.async_set("sensor.one", "2")
+    hass.states.async_set("sensor.one", "unavailable")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == 2
+    assert msg["event"]["suppressed_renders"] == 1
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2566,6 +2755,79 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the modules imported for the integrations are ranked by import time."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_timings",
+        return_value=[
+            loader.ImportTiming("homeassistant.components.hue", "hue", 1.5, 40, False),
+            loader.ImportTiming(
+                "homeassistant.components.hue.light", "hue", 0.2, 3, True
+            ),
+        ],
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "module": "homeassistant.components.hue",
+            "domain": "hue",
+            "seconds": 1.5,
+            "modules_loaded": 40,
+            "event_loop": False,
+        },
+        {
+            "module": "homeassistant.components.hue.light",
+            "domain": "hue",
+            "seconds": 0.2,
+            "modules_loaded": 3,
+            "event_loop": True,
+        },
+    ]
+
+
+async def test_integration_poll_info(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the poll statistics of the entity platforms are returned."""
+    platform = Mock(
+        platform_name="hue",
+        domain="light",
+        scan_interval_seconds=30,
+        poll_statistics=PollStatistics(polls=3, overruns=1, average_duration=0.4),
+    )
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_polling_platforms",
+        return_value=[platform],
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/poll_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "light",
+            "platform": "hue",
+            "scan_interval": 30,
+            "polls": 3,
+            "overruns": 1,
+            "last_duration": 0.0,
+            "average_duration": 0.4,
+            "max_duration": 0.0,
+            "last_latency": 0.0,
+            "max_latency": 0.0,
+        },
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -44,6 +45,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -2643,6 +2645,35 @@ async def test_async_write_ha_state_thread_safety(hass: HomeAssistant) -> None:
     assert not hass.states.get(ent2.entity_id)
 
 
+async def test_async_write_ha_state_coalesced(hass: HomeAssistant) -> None:
+    """Test writes of the same loop iteration are collapsed into one write."""
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    class CoalescingEntity(entity.Entity):
+        _coalesce_state_writes = True
+
+    ent = CoalescingEntity()
+    ent.entity_id = "test.any"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test")
+    for state in ("on", "off", "on"):
+        ent._attr_state = state
+        ent.async_write_ha_state()
+    assert not hass.states.get(ent.entity_id)
+
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "on"
+    assert len(state_changes) == 1
+    assert entity.async_get_collapsed_state_writes(hass) == {"test.any": 2}
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "off"
+    assert len(state_changes) == 2
+    assert entity.async_get_collapsed_state_writes(hass) == {"test.any": 2}
+
+
 async def test_async_write_ha_state_thread_safety_always(
     hass: HomeAssistant,
 ) -> None:
@@ -36,7 +36,10 @@ from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
     EntityComponent,
 )
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_platform import (
+    AddEntitiesCallback,
+    async_get_polling_platforms,
+)
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.dt as dt_util
 
@@ -115,6 +118,40 @@ async def test_polling_check_works_if_entity_add_fails(
     assert working_poll_ent.async_update.called
 
 
+async def test_polling_spread_and_statistics(hass: HomeAssistant) -> None:
+    """Test polls of platforms are spread over the interval and recorded."""
+    platforms = [
+        MockEntityPlatform(
+            hass, platform_name=f"platform_{idx}", scan_interval=timedelta(seconds=20)
+        )
+        for idx in range(3)
+    ]
+    for platform in platforms:
+        platform.async_prepare()
+        await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    now = hass.loop.time()
+    delays = sorted(
+        platform._async_polling_timer.when() - now for platform in platforms
+    )
+    assert delays == pytest.approx([7.6393, 15.2786, 20], abs=0.1)
+    assert all(platform.poll_statistics.polls == 0 for platform in platforms)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    for platform in platforms:
+        assert platform.poll_statistics.polls == 1
+        assert platform.poll_statistics.overruns == 0
+    assert sorted(
+        platform.platform_name for platform in async_get_polling_platforms(hass)
+    ) == ["platform_0", "platform_1", "platform_2"]
+
+    # The next poll is scheduled one interval after the previous one was due
+    for platform in platforms:
+        assert platform._async_polling_timer.when() - now > 20
+
+
 async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
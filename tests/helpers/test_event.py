@@ -48,6 +48,7 @@ from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
+    make_state_filter,
     track_point_in_utc_time,
 )
 from homeassistant.helpers.template import Template, result_as_boolean
@@ -2418,6 +2419,130 @@ async def test_static_string(hass: HomeAssistant) -> None:
     assert refresh_runs == ["static"]
 
 
+async def test_track_template_result_state_filter(hass: HomeAssistant) -> None:
+    """Test a state filter suppresses re-renders of iterated domains."""
+    template_unavailable = Template(
+        "{{ states.sensor | selectattr('state', 'eq', 'unavailable') | list | count"
+        " if is_state('input_boolean.enabled', 'on') else 0 }}",
+        hass,
+    )
+    hass.states.async_set("input_boolean.enabled", "on")
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "unavailable")
+
+    runs = []
+
+    @ha.callback
+    def run_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                template_unavailable,
+                None,
+                0,
+                lambda state: state.state == "unavailable",
+            )
+        ],
+        run_listener,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    assert runs == [1]
+    assert info.listeners == {
+        "all": False,
+        "domains": {"sensor"},
+        "entities": {"input_boolean.enabled"},
+        "time": False,
+    }
+
+    hass.states.async_set("sensor.one", "2")
+    hass.states.async_set("sensor.three", "3")
+    hass.states.async_remove("sensor.three")
+    await hass.async_block_till_done()
+    assert runs == [1]
+    assert info.suppressed_renders == {template_unavailable: 3}
+
+    hass.states.async_set("sensor.one", "unavailable")
+    await hass.async_block_till_done()
+    assert runs == [1, 2]
+
+    hass.states.async_set("sensor.two", "2")
+    await hass.async_block_till_done()
+    assert runs == [1, 2, 1]
+
+    # Entities outside the iterated domains are not filtered
+    hass.states.async_set("input_boolean.enabled", "off")
+    await hass.async_block_till_done()
+    assert runs == [1, 2, 1, 0]
+    assert info.suppressed_renders == {template_unavailable: 3}
+
+
+async def test_track_template_result_state_filter_referenced_entity(
+    hass: HomeAssistant,
+) -> None:
+    """Test a state filter does not suppress entities referenced directly."""
+    template_unavailable = Template(
+        "{{ states.sensor | selectattr('state', 'eq', 'unavailable') | list | count"
+        " }} {{ state_attr('sensor.one', 'unit') }}",
+        hass,
+    )
+    hass.states.async_set("sensor.one", "1", {"unit": "W"})
+    hass.states.async_set("sensor.two", "2")
+
+    runs = []
+
+    @ha.callback
+    def run_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                template_unavailable,
+                None,
+                0,
+                make_state_filter(["unavailable"]),
+            )
+        ],
+        run_listener,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    assert runs == ["0 W"]
+
+    hass.states.async_set("sensor.two", "3")
+    await hass.async_block_till_done()
+    assert runs == ["0 W"]
+    assert info.suppressed_renders == {template_unavailable: 1}
+
+    hass.states.async_set("sensor.one", "1", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert runs == ["0 W", "0 kW"]
+    assert info.suppressed_renders == {template_unavailable: 1}
+
+
+def test_make_state_filter() -> None:
+    """Test state filters made from states and an attribute."""
+    state = ha.State("sensor.one", "unavailable", {"battery": 10})
+
+    assert make_state_filter(["unavailable", "unknown"])(state)
+    assert not make_state_filter(["unknown"])(state)
+    assert make_state_filter(attribute="battery")(state)
+    assert not make_state_filter(attribute="unit")(state)
+    assert not make_state_filter(["unavailable"], "unit")(state)
+    assert make_state_filter()(state)
+
+
 async def test_track_template_rate_limit(hass: HomeAssistant) -> None:
     """Test template rate limit."""
     template_refresh = Template("{{ states | count }}", hass)
@@ -1,6 +1,7 @@
 """Test integration platform helpers."""
 
 from collections.abc import Callable
+from operator import itemgetter
 from types import ModuleType
 from typing import Any
 from unittest.mock import Mock, patch
@@ -12,6 +13,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
+    async_process_deferred_integration_platforms,
     async_process_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
@@ -99,6 +101,64 @@ async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     assert len(processed) == 2
 
 
+async def test_process_integration_platforms_deferred(hass: HomeAssistant) -> None:
+    """Test deferred platforms are imported when they are first used."""
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    module_cache = hass.data[loader.DATA_COMPONENTS]
+    del module_cache["loaded.platform_to_check"]
+    del module_cache["event.platform_to_check"]
+    loaded_integration = await loader.async_get_integration(hass, "loaded")
+    event_integration = await loader.async_get_integration(hass, "event")
+
+    processed = []
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    with (
+        patch.object(
+            loaded_integration, "async_get_platform", return_value=loaded_platform
+        ) as mock_loaded_import,
+        patch.object(
+            event_integration, "async_get_platform", return_value=event_platform
+        ) as mock_event_import,
+    ):
+        await async_process_integration_platforms(
+            hass,
+            "platform_to_check",
+            _process_platform,
+            wait_for_platforms=True,
+            defer_imports=True,
+        )
+        hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+        await hass.async_block_till_done()
+
+        assert processed == []
+        assert not mock_loaded_import.called
+        assert not mock_event_import.called
+        assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+        await async_process_deferred_integration_platforms(hass, "platform_to_check")
+
+        assert sorted(processed, key=itemgetter(0)) == [
+            ("event", event_platform),
+            ("loaded", loaded_platform),
+        ]
+
+        # The platforms are processed once
+        await async_process_deferred_integration_platforms(hass, "platform_to_check")
+        assert len(processed) == 2
+
+
 async def test_process_integration_platforms_import_fails(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
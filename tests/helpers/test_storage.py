@@ -667,6 +667,39 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_snapshot(tmpdir: py.path.local) -> None:
+    """Test loading from a snapshot and falling back to JSON when stale."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, snapshot=True)
+        await store.async_save(MOCK_DATA)
+        snapshot_file = f"{store.path}{storage.SNAPSHOT_SUFFIX}"
+        assert await hass.async_add_executor_job(os.path.isfile, snapshot_file)
+
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            side_effect=AssertionError,
+        ):
+            assert await store.async_load() == MOCK_DATA
+
+        def _edit_store() -> None:
+            with open(store.path, "w", encoding="utf8") as f:
+                json.dump(
+                    {"version": MOCK_VERSION, "key": MOCK_KEY, "data": MOCK_DATA2}, f
+                )
+
+        await hass.async_add_executor_job(_edit_store)
+        assert await store.async_load() == MOCK_DATA2
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.isfile, snapshot_file)
+        assert await store.async_load() is None
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -0,0 +1,91 @@
+"""Test the target index."""
+
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+    target_index,
+)
+
+from tests.common import MockConfigEntry
+
+
+async def test_target_index(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test the index follows changes of the registries."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    index = target_index.async_get(hass)
+
+    floor = floor_registry.async_create("First floor")
+    kitchen = area_registry.async_create("Kitchen", floor_id=floor.floor_id)
+    hall = area_registry.async_create("Hall")
+    label = label_registry.async_create("Lights")
+    assert index.async_floor_areas(floor.floor_id) == (kitchen.id,)
+
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("light", "device")},
+    )
+    device_light = entity_registry.async_get_or_create(
+        "light", "hue", "device", config_entry=config_entry, device_id=device.id
+    )
+    device_config = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "config",
+        config_entry=config_entry,
+        device_id=device.id,
+        entity_category=EntityCategory.CONFIG,
+    )
+    hall_light = entity_registry.async_get_or_create(
+        "light", "hue", "hall", config_entry=config_entry, device_id=device.id
+    )
+    entity_registry.async_update_entity(hall_light.entity_id, area_id=hall.id)
+
+    assert index.async_area_entities(kitchen.id) == ()
+    assert index.async_device_entities(device.id) == (
+        device_light.entity_id,
+        hall_light.entity_id,
+    )
+
+    # Moving the device moves the entities without an area of their own
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    assert index.async_area_devices(kitchen.id) == (device.id,)
+    assert index.async_area_entities(kitchen.id) == (
+        device_light.entity_id,
+        device_config.entity_id,
+    )
+    assert index.async_area_entities(kitchen.id, targetable=True) == (
+        device_light.entity_id,
+    )
+
+    # Changes which do not affect the index keep the lookups
+    lookup = index.async_area_entities(kitchen.id)
+    entity_registry.async_update_entity(device_light.entity_id, name="Ceiling")
+    assert index.async_area_entities(kitchen.id) is lookup
+
+    entity_registry.async_update_entity(device_light.entity_id, labels={label.label_id})
+    assert index.async_label_entities(label.label_id) == (device_light.entity_id,)
+
+    entity_registry.async_update_entity(
+        device_light.entity_id, hidden_by=er.RegistryEntryHider.USER
+    )
+    assert index.async_label_entities(label.label_id, targetable=True) == ()
+    assert index.async_area_entities(kitchen.id, targetable=True) == ()
+
+    area_registry.async_update(hall.id, floor_id=floor.floor_id)
+    assert set(index.async_floor_areas(floor.floor_id)) == {kitchen.id, hall.id}
+
+    entity_registry.async_remove(hall_light.entity_id)
+    assert index.async_device_entities(device.id) == (device_light.entity_id,)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -13,6 +15,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from jinja2.bccache import bc_magic
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +25,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -32,6 +36,7 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
     UnitOfVolume,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -5149,27 +5154,113 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by template instances."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    compiled = template.COMPILED_TEMPLATE_CACHE.get(("normal", template_string))
+    assert compiled is not None
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    del tpl
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is compiled
+    assert tpl2.async_render() == "foo=x%26y&bar=42"
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    # Environments with a custom log function share the compiled code
+    tpl3 = template.Template(template_string, hass)
+    assert tpl3.async_render(log_fn=lambda level, msg: None) == "foo=x%26y&bar=42"
+    assert tpl3._compiled_code is compiled
+
+    tpl4 = template.Template(template_string, hass)
+    assert tpl4.async_render(limited=True) == "foo=x%26y&bar=42"
+    assert template.COMPILED_TEMPLATE_CACHE.get(("normal", template_string))
+
+
+async def test_load_compiled_templates(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loading and persisting the compiled templates."""
+    template_string = "{{ 'persisted' | upper }}"
+    code = template.TemplateEnvironment(hass).compile(template_string)
+    template.COMPILED_TEMPLATE_CACHE.clear()
+
+    hass_storage[template.COMPILED_TEMPLATE_STORAGE_KEY] = {
+        "version": template.COMPILED_TEMPLATE_STORAGE_VERSION,
+        "key": template.COMPILED_TEMPLATE_STORAGE_KEY,
+        "data": {
+            "magic": bc_magic.hex(),
+            "ha_version": HA_VERSION,
+            "templates": [
+                [
+                    "normal",
+                    template_string,
+                    base64.b64encode(marshal.dumps(code)).decode(),
+                ],
+                ["normal", "{{ invalid }}", "aW52YWxpZA=="],
+            ],
+        },
+    }
+    await template.async_load_compiled_templates(hass)
+
+    assert template.COMPILED_TEMPLATE_CACHE.get(("normal", "{{ invalid }}")) is None
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert tpl._compiled_code == code
+    assert tpl.async_render() == "PERSISTED"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.COMPILED_TEMPLATE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[template.COMPILED_TEMPLATE_STORAGE_KEY]["data"]
+    assert data["magic"] == bc_magic.hex()
+    assert data["ha_version"] == HA_VERSION
+    assert ["normal", template_string] in [
+        [flavor, source] for flavor, source, _ in data["templates"]
+    ]
+
+
+@pytest.mark.parametrize(
+    ("magic", "ha_version"),
+    [("00", HA_VERSION), (bc_magic.hex(), "2000.1.0"), (bc_magic.hex(), None)],
+)
+async def test_load_compiled_templates_other_version(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    magic: str,
+    ha_version: str | None,
+) -> None:
+    """Test compiled templates of another Python, Jinja or HA version are dropped."""
+    template_string = "{{ 'other version' | upper }}"
+    code = template.TemplateEnvironment(hass).compile(template_string)
+    template.COMPILED_TEMPLATE_CACHE.clear()
+
+    hass_storage[template.COMPILED_TEMPLATE_STORAGE_KEY] = {
+        "version": template.COMPILED_TEMPLATE_STORAGE_VERSION,
+        "key": template.COMPILED_TEMPLATE_STORAGE_KEY,
+        "data": {
+            "magic": magic,
+            "ha_version": ha_version,
+            "templates": [
+                [
+                    "normal",
+                    template_string,
+                    base64.b64encode(marshal.dumps(code)).decode(),
+                ],
+            ],
+        },
+    }
+    await template.async_load_compiled_templates(hass)
+
+    assert not template.COMPILED_TEMPLATE_CACHE
+    assert template.COMPILED_TEMPLATE_STORAGE_KEY not in hass_storage
 
 
 def test_is_template_string() -> None:
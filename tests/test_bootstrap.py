@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
+from datetime import timedelta
 import glob
 import logging
 import os
@@ -26,11 +27,13 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.util import dt as dt_util
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -296,7 +299,100 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
 
     assert "normal_integration" in hass.config.components
     assert "cloud" in hass.config.components
-    assert order == ["cloud", "an_after_dep", "normal_integration"]
+    # Stage 2 is started once the requirements of cloud are processed, so only
+    # the order of cloud and the integration it lists as after dependency holds
+    assert order.index("cloud") < order.index("normal_integration")
+    assert order.index("an_after_dep") < order.index("normal_integration")
+
+
+async def test_setup_stage_2_not_waiting_on_stage_1(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test stage 2 is set up without waiting for the setup of stage 1."""
+    # This test relies on this
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    hass_storage[bootstrap.SETUP_TIMES_STORAGE_KEY] = {
+        "version": bootstrap.SETUP_TIMES_STORAGE_VERSION,
+        "data": {"slow_integration": 5.0},
+    }
+    order = []
+    cloud_setup = asyncio.Event()
+    stage_2_setup = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+            if domain == "cloud":
+                await cloud_setup.wait()
+            order.append(domain)
+            if domain == "normal_integration":
+                stage_2_setup.set()
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass,
+        MockModule(domain="cloud", async_setup=gen_domain_setup("cloud")),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            async_setup=gen_domain_setup("normal_integration"),
+            partial_manifest={"after_dependencies": ["slow_integration"]},
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="slow_integration",
+            async_setup=gen_domain_setup("slow_integration"),
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="fast_integration",
+            async_setup=gen_domain_setup("fast_integration"),
+        ),
+    )
+
+    caplog.set_level(logging.INFO)
+    setup_task = hass.async_create_task(
+        bootstrap._async_set_up_integrations(
+            hass,
+            {
+                "cloud": {},
+                "normal_integration": {},
+                "slow_integration": {},
+                "fast_integration": {},
+            },
+        )
+    )
+    async with asyncio.timeout(1):
+        await stage_2_setup.wait()
+    assert "cloud" not in hass.config.components
+
+    cloud_setup.set()
+    await setup_task
+
+    # The integration holding up another one is started first
+    assert order.index("slow_integration") < order.index("fast_integration")
+    assert order[-1] == "cloud"
+    assert "Startup critical path: " in caplog.text
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=bootstrap.SETUP_TIMES_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[bootstrap.SETUP_TIMES_STORAGE_KEY]["data"].keys() == {
+        "cloud",
+        "normal_integration",
+        "slow_integration",
+        "fast_integration",
+    }
 
 
 @pytest.mark.parametrize("load_registries", [False])
@@ -1165,6 +1165,64 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_listener_profiling(hass: HomeAssistant) -> None:
+    """Test recording the wall time of the listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def failing_listener(event):
+        """Mock failing listener."""
+        raise ValueError
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen("test", functools.partial(listener))
+    hass.bus.async_listen("other", failing_listener)
+
+    hass.bus.async_fire("test")
+    assert not hass.bus.listener_profiling
+    assert hass.bus.async_listener_profile() == []
+
+    hass.bus.async_set_listener_profiling(True)
+    assert hass.bus.listener_profiling
+    for _ in range(3):
+        hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    await hass.async_block_till_done()
+    assert len(calls) == 8
+
+    profile = hass.bus.async_listener_profile()
+    assert [
+        (listener["event_type"], listener["listener"], listener["count"])
+        for listener in sorted(profile, key=lambda listener: listener["event_type"])
+    ] == [
+        (
+            "other",
+            "tests.test_core.test_eventbus_listener_profiling.<locals>.failing_listener",
+            1,
+        ),
+        (
+            "test",
+            "tests.test_core.test_eventbus_listener_profiling.<locals>.listener",
+            6,
+        ),
+    ]
+    test_profile = next(
+        listener for listener in profile if listener["event_type"] == "test"
+    )
+    assert test_profile["integration"] == "tests"
+    assert sum(test_profile["histogram"].values()) == 6
+    assert test_profile["p50"] <= test_profile["p99"] <= test_profile["max"]
+    assert test_profile["mean"] == test_profile["total"] / 6
+
+    hass.bus.async_set_listener_profiling(False)
+    assert hass.bus.async_listener_profile() == []
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from datetime import timedelta
 import os
 import pathlib
 import sys
@@ -14,12 +15,19 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -1381,6 +1389,29 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_async_get_component_records_import_timings(
+    hass: HomeAssistant,
+) -> None:
+    """Verify async_get_component records the time of the imports."""
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        await executor_import_integration.async_get_component()
+
+    assert mock_import.call_count == 1
+    assert (
+        mock_import.call_args_list[0][0][0]
+        == "homeassistant.components.executor_import"
+    )
+    timings = loader.async_get_import_timings(hass)
+    assert len(timings) == 1
+    assert timings[0].module == "homeassistant.components.executor_import"
+    assert timings[0].domain == "executor_import"
+    assert timings[0].event_loop is False
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -2039,3 +2070,49 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_integration_index(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are resolved from the index of the previous start."""
+    await loader.async_load_integration_index(hass)
+    integration = await loader.async_get_integration(hass, "hue")
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    entry = data["integrations"][str(integration.file_path)]
+    assert entry["manifest"]["domain"] == "hue"
+    assert "light.py" in entry["files"]
+
+    # Unchanged integrations are not read again
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    await loader.async_load_integration_index(hass)
+    with patch.object(
+        loader, "_read_manifest", wraps=loader._read_manifest
+    ) as mock_read_manifest:
+        cached = await loader.async_get_integration(hass, "hue")
+    assert not mock_read_manifest.called
+    assert cached.manifest == integration.manifest
+    assert cached.platforms_exists(["light", "missing"]) == ["light"]
+
+    # Changed integrations are read again
+    entry["fingerprint"] = [0, 0, 0]
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    await loader.async_load_integration_index(hass)
+    with patch.object(
+        loader, "_read_manifest", wraps=loader._read_manifest
+    ) as mock_read_manifest:
+        await loader.async_get_integration(hass, "hue")
+    assert mock_read_manifest.call_count == 1
+
+    # The index is dropped when Home Assistant is updated
+    data["ha_version"] = "0.1.0"
+    await loader.async_load_integration_index(hass)
+    assert (
+        hass.data[loader.DATA_INTEGRATION_INDEX].get(integration.file_path)[1] is None
+    )
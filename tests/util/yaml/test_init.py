@@ -602,3 +602,53 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+def test_yaml_cache(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test parsed files are cached until they or their dependencies change."""
+    cache = yaml.YamlCache()
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text(
+        "included: !include included.yaml\n"
+        "listed: !include_dir_list listed\n"
+        "password: !secret password\n"
+        "home: !env_var HOME_NAME\n"
+    )
+    (tmp_path / "included.yaml").write_text("key: value\n")
+    (tmp_path / "listed").mkdir()
+    (tmp_path / "listed" / "one.yaml").write_text("one\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pwhash\n")
+    monkeypatch.setenv("HOME_NAME", "home")
+
+    def load() -> dict:
+        return yaml.load_yaml_dict(config_path, yaml.Secrets(tmp_path, cache))
+
+    expected = {
+        "included": {"key": "value"},
+        "listed": ["one"],
+        "password": "pwhash",
+        "home": "home",
+    }
+    assert load() == expected
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    # Each load returns new objects
+    loaded = load()
+    assert loaded == expected
+    loaded["included"]["key"] = "changed"
+    assert load() == expected
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    (tmp_path / "included.yaml").write_text("key: new value\n")
+    assert load()["included"] == {"key": "new value"}
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    (tmp_path / "listed" / "two.yaml").write_text("two\n")
+    assert load()["listed"] == ["one", "two"]
+
+    (tmp_path / yaml.SECRET_YAML).write_text("password: new pwhash\n")
+    assert load()["password"] == "new pwhash"
+
+    monkeypatch.setenv("HOME_NAME", "new home")
+    assert load()["home"] == "new home"
+    assert (cache.hits, cache.misses) == (5, 7)